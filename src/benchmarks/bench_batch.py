@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Benchmark: scalar loop vs. batch calculate_next_magic
+=====================================================
+
+Compares the per-triple Python loop over calculate_next_magic with the
+vectorized calculate_next_magic_batch at 10^3, 10^6 and 10^8 rows.
+
+Author: André Luís Tomaz Dionísio
+Institution: EPHEC Brussels, Belgium
+Date: December 2025
+
+Usage:
+    python bench_batch.py
+    python bench_batch.py --rows 1000 1000000 --chunk 1000000
+
+Notes:
+    The batch path is processed in chunks of --chunk rows so that 10^8 rows
+    stay within a few hundred MB. The scalar loop is timed on at most
+    --scalar-max rows and extrapolated linearly beyond that (marked with ~).
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                '..', 'calculator'))
+
+from magic_number_calculator import calculate_next_magic  # noqa: E402
+from batch_calculator import calculate_next_magic_batch  # noqa: E402
+
+
+def make_rows(n, seed=0):
+    """Random but realistic parameter triples (even capacities, M_n ≤ 10^4)."""
+    rng = np.random.default_rng(seed)
+    M_n = rng.integers(0, 10_000, n, dtype=np.int64)
+    c_start = 2 * rng.integers(0, 64, n, dtype=np.int64)
+    c_high_j = 2 * rng.integers(1, 64, n, dtype=np.int64)
+    return M_n, c_start, c_high_j
+
+
+def time_scalar(n, scalar_max):
+    """Time the scalar loop; extrapolate when n exceeds scalar_max."""
+    m = min(n, scalar_max)
+    M_n, c_start, c_high_j = (a.tolist() for a in make_rows(m))
+    start = time.perf_counter()
+    for triple in zip(M_n, c_start, c_high_j):
+        calculate_next_magic(*triple)
+    elapsed = time.perf_counter() - start
+    return elapsed * n / m, m < n
+
+
+def time_batch(n, chunk):
+    """Time the batch path over n rows in chunks of at most `chunk` rows."""
+    elapsed = 0.0
+    done = 0
+    seed = 0
+    while done < n:
+        m = min(chunk, n - done)
+        rows = make_rows(m, seed)
+        start = time.perf_counter()
+        calculate_next_magic_batch(*rows)
+        elapsed += time.perf_counter() - start
+        done += m
+        seed += 1
+    return elapsed
+
+
+def check_agreement(n=10_000):
+    """Confirm batch and scalar paths agree, including the big-int fallback."""
+    M_n, c_start, c_high_j = make_rows(n)
+    batch = calculate_next_magic_batch(M_n, c_start, c_high_j)
+    for i in range(n):
+        scalar = calculate_next_magic(int(M_n[i]), int(c_start[i]), int(c_high_j[i]))
+        assert scalar == tuple(int(col[i]) for col in batch)
+
+    huge = [3 * 2**40, -7, 2**62]
+    batch = calculate_next_magic_batch(huge, huge, huge)
+    assert batch[2].dtype == object
+    for i, c in enumerate(huge):
+        assert calculate_next_magic(c, c, c) == tuple(col[i] for col in batch)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', type=int, nargs='+',
+                        default=[10**3, 10**6, 10**8])
+    parser.add_argument('--chunk', type=int, default=10**7)
+    parser.add_argument('--scalar-max', type=int, default=10**6)
+    args = parser.parse_args()
+
+    check_agreement()
+
+    print("\n" + "="*70)
+    print("BENCHMARK: scalar loop vs. calculate_next_magic_batch")
+    print("="*70)
+    print(f"\n{'Rows':>12} | {'Scalar (s)':>12} | {'Batch (s)':>10} | "
+          f"{'Speed-up':>9} | {'Batch rows/s':>13}")
+    print("-"*70)
+
+    for n in args.rows:
+        t_scalar, extrapolated = time_scalar(n, args.scalar_max)
+        t_batch = time_batch(n, args.chunk)
+        mark = "~" if extrapolated else " "
+        print(f"{n:12,} | {mark}{t_scalar:11.4f} | {t_batch:10.4f} | "
+              f"{t_scalar / t_batch:8.1f}x | {n / t_batch:13,.0f}")
+
+    print("-"*70)
+    print("~ scalar time extrapolated from --scalar-max rows")
+    print("="*70 + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
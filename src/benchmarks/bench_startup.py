@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Benchmark: start-up budget of the magic-numbers CLI
+===================================================
+
+Runs each subcommand of src/magic_numbers.py in a fresh interpreter and
+compares its median wall time with that of a bare `python -c pass`.
+
+The calculator commands (calc, validate, sequence) must
+- stay within --budget milliseconds above the bare interpreter, and
+- never import NumPy or matplotlib (checked with python -X importtime).
+
+The heavy commands (figures, abstract, batch) are timed on --help for
+reference only. The exit status is 1 when any budget or import check fails,
+so the benchmark can gate a CI job.
+
+Author: André Luís Tomaz Dionísio
+Institution: EPHEC Brussels, Belgium
+Date: December 2025
+
+Usage:
+    python bench_startup.py
+    python bench_startup.py --repeat 20 --budget 40 --json
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+CLI = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                    '..', 'magic_numbers.py'))
+
+DEFAULT_BUDGET_MS = 50.0
+HEAVY_MODULES = ('numpy', 'matplotlib')
+
+# (label, CLI arguments, enforce the budget)
+COMMANDS = [
+    ('calc', ['calc', '126', '12', '16'], True),
+    ('calc json', ['calc', '126', '12', '16', '--format', 'json'], True),
+    ('validate', ['validate'], True),
+    ('sequence', ['sequence', '--count', '100'], True),
+    ('help', ['--help'], True),
+    ('batch', ['batch', '--help'], False),
+    ('figures', ['figures', '--help'], False),
+    ('abstract', ['abstract', '--help'], False),
+]
+
+
+def time_command(argv, repeat):
+    """Wall times in ms of `repeat` runs of argv (after one warm-up run)."""
+    subprocess.run(argv, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run(argv, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+        times.append((time.perf_counter() - start) * 1e3)
+    return times
+
+
+def imported_modules(argv):
+    """Top-level packages imported while running argv (from -X importtime)."""
+    result = subprocess.run([argv[0], '-X', 'importtime'] + argv[1:],
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                            text=True, check=False)
+    modules = set()
+    for line in result.stderr.splitlines():
+        if line.startswith('import time:') and '|' in line:
+            name = line.rsplit('|', 1)[1].strip()
+            modules.add(name.split('.')[0])
+    return modules
+
+
+def run(repeat, budget_ms):
+    python = sys.executable
+    baseline = statistics.median(time_command([python, '-c', 'pass'], repeat))
+    rows = []
+    for label, args, enforced in COMMANDS:
+        argv = [python, CLI] + args
+        times = time_command(argv, repeat)
+        median = statistics.median(times)
+        heavy = sorted(imported_modules(argv).intersection(HEAVY_MODULES)) if enforced else []
+        ok = (not enforced) or (median - baseline <= budget_ms and not heavy)
+        rows.append({'command': label, 'args': args, 'enforced': enforced,
+                     'min_ms': min(times), 'median_ms': median,
+                     'overhead_ms': median - baseline, 'heavy_imports': heavy, 'ok': ok})
+    return baseline, rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Start-up budget of the magic-numbers CLI.")
+    parser.add_argument('--repeat', type=int, default=10)
+    parser.add_argument('--budget', type=float, default=DEFAULT_BUDGET_MS,
+                        help="allowed ms above a bare interpreter (default: %(default)s)")
+    parser.add_argument('--json', action='store_true')
+    args = parser.parse_args(argv)
+
+    baseline, rows = run(args.repeat, args.budget)
+    passed = all(row['ok'] for row in rows)
+
+    if args.json:
+        print(json.dumps({'python': sys.version.split()[0], 'baseline_ms': baseline,
+                          'budget_ms': args.budget, 'passed': passed, 'commands': rows},
+                         indent=2))
+        return 0 if passed else 1
+
+    print("\n" + "="*74)
+    print(f"CLI START-UP (median of {args.repeat}; bare interpreter {baseline:.1f} ms, "
+          f"budget +{args.budget:.0f} ms)")
+    print("="*74)
+    print(f"\n{'Command':<10} | {'min ms':>8} | {'median ms':>9} | {'overhead':>8} | Status")
+    print("-"*74)
+    for row in rows:
+        if not row['enforced']:
+            status = "(reference)"
+        elif row['ok']:
+            status = "✓"
+        else:
+            status = "✗ " + (f"imports {', '.join(row['heavy_imports'])}"
+                             if row['heavy_imports'] else "over budget")
+        print(f"{row['command']:<10} | {row['min_ms']:8.1f} | {row['median_ms']:9.1f} | "
+              f"{row['overhead_ms']:+8.1f} | {status}")
+    print("-"*74)
+    print("START-UP BUDGET MET ✓" if passed else "START-UP BUDGET EXCEEDED ✗")
+    print("="*74 + "\n")
+    return 0 if passed else 1
+
+
+if __name__ == "__main__":
+    exit(main())
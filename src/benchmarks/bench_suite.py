@@ -0,0 +1,451 @@
+#!/usr/bin/env python3
+"""
+Benchmark Suite: calculator and figure hot paths
+================================================
+
+Measures every case below and appends the results to a JSON history:
+
+    calc_scalar     calculate_next_magic over 100k triples (Python loop)
+    calc_batch      calculate_next_magic_batch over 10^6 rows
+    validate        validate_all_magic_numbers (output captured)
+    sequence        MagicSequence().prefix(10_000) on a fresh generator
+    woods_saxon     Woods-Saxon level schemes for A = 4...300 (cache cleared)
+    figure1..4      generate_figureN into a temporary directory (Agg)
+    abstract        generate_graphic_abstract, first call (builds the skeleton)
+    abstract_variant  one more render to a BytesIO with the skeleton reused
+
+For each case:
+- wall time: min and median of --repeat timed samples, after one warm-up;
+  like timeit.Timer.autorange, each sample loops the case until it lasts at
+  least MIN_SAMPLE_S and is divided by the loop count, so sub-millisecond
+  cases are not timer noise
+- peak memory: tracemalloc peak of one extra run (NumPy buffers included)
+- call count: total Python function calls of one extra run under cProfile
+
+'compare' checks the latest run against a stored baseline. A case regresses
+when a metric grows by more than --threshold (relative) and exits with 1.
+The history and baseline are machine specific, so by default they live in
+build/benchmarks/ (not versioned).
+
+Author: André Luís Tomaz Dionísio
+Institution: EPHEC Brussels, Belgium
+Date: December 2025
+
+Usage:
+    python bench_suite.py run                     # all cases → history
+    python bench_suite.py run calc_scalar validate --repeat 10
+    python bench_suite.py baseline                # latest run becomes the baseline
+    python bench_suite.py compare --threshold 0.10
+    python bench_suite.py list
+"""
+
+import argparse
+import contextlib
+import cProfile
+import io
+import json
+import os
+import platform
+import pstats
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import namedtuple
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.normpath(os.path.join(HERE, '..', '..'))
+RESULTS_DIR = os.path.join(REPO_ROOT, 'build', 'benchmarks')
+DEFAULT_HISTORY = os.path.join(RESULTS_DIR, 'history.json')
+DEFAULT_BASELINE = os.path.join(RESULTS_DIR, 'baseline.json')
+DEFAULT_THRESHOLD = 0.10
+
+# Shortest timed sample; faster cases are looped within one sample
+MIN_SAMPLE_S = 0.05
+
+sys.path.insert(0, os.path.join(HERE, '..', 'calculator'))
+sys.path.insert(0, os.path.join(HERE, '..', 'visualization'))
+
+# setup() runs untimed and returns the zero-argument callable to measure
+Case = namedtuple('Case', ['name', 'description', 'setup', 'repeat'])
+
+METRICS = ('wall_s', 'peak_bytes', 'calls')
+
+# =============================================================================
+# CASES
+# =============================================================================
+
+
+def _setup_calc_scalar(rows=100_000):
+    from magic_number_calculator import calculate_next_magic
+    triples = [(k % 1000, 2 * (k % 32), 2 * (k % 17) + 2) for k in range(rows)]
+
+    def run():
+        for M_n, c_start, c_high_j in triples:
+            calculate_next_magic(M_n, c_start, c_high_j)
+    return run
+
+
+def _setup_calc_batch(rows=1_000_000):
+    import numpy as np
+    from batch_calculator import calculate_next_magic_batch
+    rng = np.random.default_rng(0)
+    M_n = rng.integers(0, 10_000, rows)
+    c_start = 2 * rng.integers(0, 64, rows)
+    c_high_j = 2 * rng.integers(1, 64, rows)
+    return lambda: calculate_next_magic_batch(M_n, c_start, c_high_j)
+
+
+def _setup_validate():
+    from magic_number_calculator import validate_all_magic_numbers
+    return validate_all_magic_numbers
+
+
+def _setup_sequence(count=10_000):
+    from magic_sequence import MagicSequence
+    return lambda: MagicSequence().prefix(count)
+
+
+def _setup_woods_saxon():
+    import woods_saxon
+
+    def run():
+        woods_saxon.clear_cache()
+        woods_saxon.sweep(4, 300)
+    return run
+
+
+def _headless():
+    import matplotlib
+    matplotlib.use('Agg')
+
+
+def _in_directory(func, directory):
+    """Wrap func so that it runs with `directory` as cwd."""
+    def run():
+        previous = os.getcwd()
+        os.chdir(directory)
+        try:
+            return func()
+        finally:
+            os.chdir(previous)
+    return run
+
+
+def _setup_figure(name):
+    def setup():
+        _headless()
+        import generate_figures
+        func = generate_figures.FIGURES[name][0]
+        return _in_directory(func, tempfile.mkdtemp(prefix='bench_'))
+    return setup
+
+
+def _setup_abstract():
+    _headless()
+    import generate_graphic_abstract as abstract
+    path = os.path.join(tempfile.mkdtemp(prefix='bench_'), 'graphic_abstract.png')
+
+    def run():
+        abstract._default_renderer = None  # include the skeleton build
+        abstract.generate_graphic_abstract((path,))
+    return run
+
+
+def _setup_abstract_variant():
+    _headless()
+    import generate_graphic_abstract as abstract
+    renderer = abstract.GraphicAbstract()
+    data = abstract.AbstractData(prediction=172)
+    return lambda: renderer.render(io.BytesIO(), data)
+
+
+CASES = [
+    Case('calc_scalar', "calculate_next_magic, 10^5 triples", _setup_calc_scalar, 5),
+    Case('calc_batch', "calculate_next_magic_batch, 10^6 rows", _setup_calc_batch, 5),
+    Case('validate', "validate_all_magic_numbers", _setup_validate, 20),
+    Case('sequence', "MagicSequence().prefix(10_000)", _setup_sequence, 5),
+    Case('woods_saxon', "Woods-Saxon sweep A = 4...300", _setup_woods_saxon, 3),
+    Case('figure1', "generate_figure1 (100k bootstrap replicates)", _setup_figure('figure1'), 3),
+    Case('figure2', "generate_figure2", _setup_figure('figure2'), 3),
+    Case('figure3', "generate_figure3", _setup_figure('figure3'), 3),
+    Case('figure4', "generate_figure4 (chart of nuclides, BE/A)", _setup_figure('figure4'), 3),
+    Case('abstract', "generate_graphic_abstract (cold renderer)", _setup_abstract, 3),
+    Case('abstract_variant', "GraphicAbstract.render to BytesIO (warm)",
+         _setup_abstract_variant, 3),
+]
+CASES_BY_NAME = {case.name: case for case in CASES}
+
+# =============================================================================
+# MEASUREMENT
+# =============================================================================
+
+
+def _quiet(func):
+    """Call func with stdout captured (generators print progress)."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        return func()
+
+
+def _time_loops(func, loops):
+    """Wall time of `loops` back-to-back calls, stdout captured."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        return time.perf_counter() - start
+
+
+def _autorange(func, min_time=MIN_SAMPLE_S):
+    """Smallest loop count in 1, 2, 5, 10, 20, ... whose sample lasts min_time."""
+    base = 1
+    while True:
+        for step in (1, 2, 5):
+            loops = base * step
+            if _time_loops(func, loops) >= min_time:
+                return loops
+        base *= 10
+
+
+def measure(case, repeat=None):
+    """Wall time (per call), peak memory and call count of one case."""
+    func = _quiet(case.setup)
+    repeat = repeat or case.repeat
+
+    _quiet(func)  # warm-up: imports, caches, font loading
+    loops = _autorange(func)
+    times = [_time_loops(func, loops) / loops for _ in range(repeat)]
+
+    tracemalloc.start()
+    try:
+        _quiet(func)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    profile = cProfile.Profile()
+    _quiet(lambda: profile.runcall(func))
+    calls = pstats.Stats(profile).total_calls
+
+    return {'wall_s': min(times), 'wall_s_median': statistics.median(times),
+            'repeat': repeat, 'loops': loops, 'peak_bytes': peak, 'calls': calls}
+
+
+def _git_commit():
+    try:
+        result = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_ROOT,
+                                capture_output=True, text=True, check=True)
+        return result.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _environment():
+    env = {'python': platform.python_version(), 'machine': platform.machine(),
+           'platform': platform.platform(), 'cpus': os.cpu_count()}
+    for module in ('numpy', 'matplotlib'):
+        if module in sys.modules:
+            env[module] = sys.modules[module].__version__
+    return env
+
+
+def run_cases(names=None, repeat=None, report=None):
+    """
+    Measure the selected cases (default: all) and return one history record.
+    report(case, result) is called after each case, e.g. to print progress.
+    """
+    results = {}
+    for case in CASES:
+        if names and case.name not in names:
+            continue
+        results[case.name] = measure(case, repeat)
+        if report:
+            report(case, results[case.name])
+    return {'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'), 'commit': _git_commit(),
+            'environment': _environment(), 'results': results}
+
+# =============================================================================
+# HISTORY AND COMPARISON
+# =============================================================================
+
+
+def load_json(path, default):
+    if not os.path.exists(path):
+        return default
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_json(path, data):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp = path + '.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+    os.replace(tmp, path)
+
+
+def compare(current, baseline, threshold=DEFAULT_THRESHOLD):
+    """
+    Per case and metric: (case, metric, baseline, current, relative change,
+    status) with status 'REGRESSION', 'improved' or 'ok'.
+    """
+    rows = []
+    for name, result in current['results'].items():
+        base = baseline['results'].get(name)
+        if base is None:
+            rows.append((name, '-', None, None, None, 'new'))
+            continue
+        for metric in METRICS:
+            old, new = base.get(metric), result.get(metric)
+            if old is None or new is None:
+                continue
+            change = (new - old) / old if old else (0.0 if new == old else float('inf'))
+            if change > threshold:
+                status = 'REGRESSION'
+            elif change < -threshold:
+                status = 'improved'
+            else:
+                status = 'ok'
+            rows.append((name, metric, old, new, change, status))
+    return rows
+
+
+def _format_value(metric, value):
+    if value is None:
+        return '-'
+    if metric == 'wall_s':
+        return f"{value * 1e3:.2f} ms"
+    if metric == 'peak_bytes':
+        return f"{value / 2**20:.2f} MiB"
+    return f"{value:,}"
+
+# =============================================================================
+# COMMANDS
+# =============================================================================
+
+
+def cmd_list(args):
+    for case in CASES:
+        print(f"{case.name:<17} {case.description}")
+    return 0
+
+
+def cmd_run(args):
+    unknown = [name for name in args.cases if name not in CASES_BY_NAME]
+    if unknown:
+        print(f"Unknown case(s): {', '.join(unknown)}", file=sys.stderr)
+        return 2
+
+    def report(case, result):
+        print(f"  {case.name:<17} {result['wall_s'] * 1e3:10.3f} ms × {result['loops']:<6,} "
+              f"{result['peak_bytes'] / 2**20:9.2f} MiB  {result['calls']:>10,} calls",
+              flush=True)
+
+    print("\n" + "="*74)
+    print("BENCHMARK SUITE (min wall time, tracemalloc peak, Python calls)")
+    print("="*74)
+    start = time.perf_counter()
+    record = run_cases(args.cases or None, args.repeat, report)
+
+    history = load_json(args.history, [])
+    history.append(record)
+    save_json(args.history, history)
+    print("-"*74)
+    print(f"Total {time.perf_counter() - start:.1f} s; run #{len(history)} appended to "
+          f"{args.history}")
+    print("="*74 + "\n")
+    if args.save_baseline:
+        save_json(args.baseline, record)
+        print(f"Baseline saved: {args.baseline}\n")
+    return 0
+
+
+def cmd_baseline(args):
+    history = load_json(args.history, [])
+    if not history:
+        print(f"No runs in {args.history}; use 'run' first.", file=sys.stderr)
+        return 1
+    record = history[args.index]
+    save_json(args.baseline, record)
+    print(f"Baseline saved from run {record['timestamp']} ({record.get('commit')}): "
+          f"{args.baseline}")
+    return 0
+
+
+def cmd_compare(args):
+    baseline = load_json(args.baseline, None)
+    if baseline is None:
+        print(f"No baseline at {args.baseline}; use 'baseline' first.", file=sys.stderr)
+        return 1
+    if args.against:
+        current = load_json(args.against, None)
+        current = current[-1] if isinstance(current, list) else current
+    else:
+        history = load_json(args.history, [])
+        current = history[-1] if history else None
+    if current is None:
+        print("Nothing to compare; use 'run' first.", file=sys.stderr)
+        return 1
+
+    rows = compare(current, baseline, args.threshold)
+    regressions = [row for row in rows if row[-1] == 'REGRESSION']
+
+    print("\n" + "="*86)
+    print(f"BENCHMARK COMPARISON (threshold {args.threshold:.0%})")
+    print(f"  baseline: {baseline['timestamp']} ({baseline.get('commit')})")
+    print(f"  current:  {current['timestamp']} ({current.get('commit')})")
+    print("="*86)
+    print(f"\n{'Case':<17} | {'Metric':<10} | {'Baseline':>14} | {'Current':>14} | "
+          f"{'Change':>8} | Status")
+    print("-"*86)
+    for name, metric, old, new, change, status in rows:
+        change_str = '-' if change is None else f"{change:+.1%}"
+        print(f"{name:<17} | {metric:<10} | {_format_value(metric, old):>14} | "
+              f"{_format_value(metric, new):>14} | {change_str:>8} | {status}")
+    print("-"*86)
+    if regressions:
+        print(f"{len(regressions)} REGRESSION(S) over {args.threshold:.0%} ✗")
+    else:
+        print("No regressions ✓")
+    print("="*86 + "\n")
+    return 1 if regressions else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Calculator and figure benchmark suite.")
+    parser.add_argument('--history', default=DEFAULT_HISTORY,
+                        help="JSON history file (default: %(default)s)")
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE,
+                        help="baseline file (default: %(default)s)")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run = commands.add_parser('run', help="measure cases and append them to the history")
+    run.add_argument('cases', nargs='*', metavar='CASE', help="default: all (see 'list')")
+    run.add_argument('--repeat', type=int, default=None,
+                     help="timed samples per case (default: per-case)")
+    run.add_argument('--save-baseline', action='store_true',
+                     help="also store this run as the baseline")
+    run.set_defaults(func=cmd_run)
+
+    baseline = commands.add_parser('baseline', help="store a run from the history as baseline")
+    baseline.add_argument('--index', type=int, default=-1,
+                          help="history entry (default: the latest)")
+    baseline.set_defaults(func=cmd_baseline)
+
+    comp = commands.add_parser('compare', help="flag regressions against the baseline")
+    comp.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                      help="relative increase counted as a regression (default: %(default)s)")
+    comp.add_argument('--against', default=None,
+                      help="run file or history to compare (default: latest in --history)")
+    comp.set_defaults(func=cmd_compare)
+
+    commands.add_parser('list', help="list the cases").set_defaults(func=cmd_list)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    exit(main())
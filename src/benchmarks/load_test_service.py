@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Load Test: calculator service
+=============================
+
+Drives calculator_service.py over keep-alive HTTP connections and reports
+client-side latency percentiles (p50/p90/p99/max) and throughput per
+endpoint, followed by the server's own /stats (cache hit rate, server-side
+latency).
+
+By default a fresh server is started in a subprocess on a free localhost
+port and stopped afterwards; use --url to test a running instance.
+
+Author: André Luís Tomaz Dionísio
+Institution: EPHEC Brussels, Belgium
+Date: December 2025
+
+Usage:
+    python load_test_service.py
+    python load_test_service.py --requests 20000 --concurrency 32 --batch 100
+    python load_test_service.py --url http://127.0.0.1:8765
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+from urllib.parse import urlsplit
+
+SERVICE = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                       '..', 'calculator', 'calculator_service.py')
+
+# Request mix: (name, weight)
+DEFAULT_MIX = 'calculate:70,batch:20,sequence:8,validate:2'
+
+
+def parse_mix(text):
+    mix = []
+    for item in text.split(','):
+        name, _, weight = item.partition(':')
+        if name not in ('calculate', 'batch', 'sequence', 'validate'):
+            raise ValueError(f"Unknown request kind: {name}")
+        mix.append((name, float(weight or 1)))
+    return mix
+
+
+def make_request(kind, rng, keys, batch):
+    """(endpoint label, method, path, body bytes) of one request."""
+    def params():
+        k = rng.randrange(keys)
+        return {'M_n': k % 1000, 'c_start': 2 * (k // 1000 % 32), 'c_high_j': 16}
+
+    if kind == 'calculate':
+        return kind, 'POST', '/calculate', json.dumps(params()).encode()
+    if kind == 'batch':
+        return kind, 'POST', '/calculate', json.dumps([params() for _ in range(batch)]).encode()
+    if kind == 'sequence':
+        body = {'start': rng.randrange(64), 'count': rng.choice((8, 16, 64))}
+        return kind, 'POST', '/sequence', json.dumps(body).encode()
+    return kind, 'GET', '/validate', b''
+
+
+async def _request(reader, writer, host, method, path, body):
+    writer.write((f"{method} {path} HTTP/1.1\r\nHost: {host}\r\n"
+                  f"Content-Type: application/json\r\n"
+                  f"Content-Length: {len(body)}\r\n\r\n").encode('ascii') + body)
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        if name.strip().lower() == 'content-length':
+            length = int(value)
+    payload = await reader.readexactly(length)
+    return status, payload
+
+
+async def _worker(host, port, jobs, results):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        while jobs:
+            label, method, path, body = jobs.pop()
+            start = time.perf_counter()
+            status, _ = await _request(reader, writer, host, method, path, body)
+            results.append((label, time.perf_counter() - start, status))
+    finally:
+        writer.close()
+
+
+async def _get_json(host, port, path):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        _, payload = await _request(reader, writer, host, 'GET', path, b'')
+        return json.loads(payload)
+    finally:
+        writer.close()
+
+
+async def run_load(host, port, requests, concurrency, mix, keys, batch, seed):
+    rng = random.Random(seed)
+    names = [name for name, _ in mix]
+    weights = [weight for _, weight in mix]
+    jobs = [make_request(kind, rng, keys, batch)
+            for kind in rng.choices(names, weights, k=requests)]
+    results = []
+    start = time.perf_counter()
+    await asyncio.gather(*(_worker(host, port, jobs, results) for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    stats = await _get_json(host, port, '/stats')
+    return results, elapsed, stats
+
+
+def percentile(sorted_values, q):
+    if not sorted_values:
+        return float('nan')
+    return sorted_values[min(len(sorted_values) - 1, int(q * len(sorted_values)))]
+
+
+def summarize(results, elapsed):
+    """{label: (count, errors, p50, p90, p99, max)} in ms, plus 'all'."""
+    groups = {}
+    for label, seconds, status in results:
+        groups.setdefault(label, []).append((seconds, status))
+    groups['all'] = [(seconds, status) for _, seconds, status in results]
+    summary = {}
+    for label, rows in groups.items():
+        latencies = sorted(seconds * 1e3 for seconds, _ in rows)
+        errors = sum(status != 200 for _, status in rows)
+        summary[label] = (len(rows), errors, percentile(latencies, 0.50),
+                          percentile(latencies, 0.90), percentile(latencies, 0.99),
+                          latencies[-1])
+    return summary
+
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def _wait_for_port(host, port, process, timeout=15.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError("service exited during start-up")
+        try:
+            with socket.create_connection((host, port), timeout=0.2):
+                return
+        except OSError:
+            time.sleep(0.05)
+    raise RuntimeError(f"service did not start on {host}:{port}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load-test the calculator service.")
+    parser.add_argument('--url', default=None,
+                        help="running service (default: start one on a free port)")
+    parser.add_argument('--requests', type=int, default=10_000)
+    parser.add_argument('--concurrency', type=int, default=16)
+    parser.add_argument('--mix', default=DEFAULT_MIX,
+                        help="weighted request kinds (default: %(default)s)")
+    parser.add_argument('--keys', type=int, default=2_000,
+                        help="distinct calculate parameter sets (controls cache hits)")
+    parser.add_argument('--batch', type=int, default=50, help="items per batch request")
+    parser.add_argument('--cache-size', type=int, default=65_536,
+                        help="cache size of the spawned service")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--json', action='store_true', help="print the summary as JSON")
+    args = parser.parse_args(argv)
+    mix = parse_mix(args.mix)
+
+    process = None
+    if args.url:
+        url = urlsplit(args.url)
+        host, port = url.hostname, url.port
+    else:
+        host, port = '127.0.0.1', _free_port()
+        process = subprocess.Popen(
+            [sys.executable, SERVICE, '--host', host, '--port', str(port),
+             '--cache-size', str(args.cache_size)],
+            stdout=subprocess.DEVNULL)
+        _wait_for_port(host, port, process)
+
+    try:
+        results, elapsed, stats = asyncio.run(run_load(
+            host, port, args.requests, args.concurrency, mix, args.keys,
+            args.batch, args.seed))
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+    summary = summarize(results, elapsed)
+    if args.json:
+        print(json.dumps({'elapsed_s': elapsed, 'requests_per_s': len(results) / elapsed,
+                          'client_ms': {k: dict(zip(('count', 'errors', 'p50', 'p90',
+                                                     'p99', 'max'), v))
+                                        for k, v in summary.items()},
+                          'server': stats}, indent=2))
+        return 0 if summary['all'][1] == 0 else 1
+
+    print("\n" + "="*78)
+    print(f"LOAD TEST: {len(results):,} requests, {args.concurrency} connections, "
+          f"batch size {args.batch}")
+    print("="*78)
+    print(f"\n{'Endpoint':<10} | {'Count':>7} | {'Errors':>6} | {'p50 ms':>8} | "
+          f"{'p90 ms':>8} | {'p99 ms':>8} | {'max ms':>8}")
+    print("-"*78)
+    for label, (count, errors, p50, p90, p99, worst) in summary.items():
+        print(f"{label:<10} | {count:7} | {errors:6} | {p50:8.3f} | {p90:8.3f} | "
+              f"{p99:8.3f} | {worst:8.3f}")
+    print("-"*78)
+    print(f"Throughput: {len(results) / elapsed:,.0f} requests/s "
+          f"({stats['items'] / elapsed:,.0f} items/s) in {elapsed:.2f} s")
+    cache = stats['cache']
+    print(f"Server:     p50 {stats['latency_ms']['p50']:.3f} ms, "
+          f"p99 {stats['latency_ms']['p99']:.3f} ms; cache {cache['weight']}/{cache['maxsize']}, "
+          f"hit rate {cache['hit_rate']:.1%}")
+    print("="*78 + "\n")
+    return 0 if summary['all'][1] == 0 else 1
+
+
+if __name__ == "__main__":
+    exit(main())
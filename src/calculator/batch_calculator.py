@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Batch Magic Number Calculator
+Vectorized counterpart of calculate_delta_n / calculate_next_magic.
+
+Author: André Luís Tomaz Dionísio
+Institution: EPHEC Brussels, Belgium
+Date: December 2025
+
+Requirements:
+- numpy
+"""
+
+import numpy as np
+
+# =============================================================================
+# OVERFLOW LIMITS
+# =============================================================================
+
+# Largest |c_start| for which c_start × (c_start + 2) still fits in int64.
+# Δn then stays below 2**60, so M_n and c_high_j may each use up to 2**61
+# without the final sum M_n + Δn + c_high_j leaving the int64 range.
+INT64_C_START_LIMIT = 2**31
+INT64_TERM_LIMIT = 2**61
+
+
+def _as_integer_array(values, name):
+    """Convert any array-like or buffer to a 1-D integer (or object) array."""
+    if isinstance(values, (bytes, bytearray, memoryview)):
+        arr = np.frombuffer(values, dtype=np.int64)
+    else:
+        arr = np.asarray(values)
+
+    if arr.dtype.kind == 'b':
+        arr = arr.astype(np.int64)
+    elif arr.dtype.kind not in 'iuO':
+        raise TypeError(f"{name} must contain integers, got dtype {arr.dtype}")
+
+    return np.atleast_1d(arr)
+
+
+def _fits_int64(arr, limit):
+    """Check that every value of an integer/object array satisfies |x| < limit."""
+    if arr.size == 0:
+        return True
+    if arr.dtype.kind == 'O':
+        return all(-limit < int(x) < limit for x in arr)
+    return int(arr.max()) < limit and int(arr.min()) > -limit
+
+
+def calculate_next_magic_batch(M_n, c_start, c_high_j):
+    """
+    Calculate (delta_n, C_total, M_next) for many parameter triples at once.
+
+    Parameters:
+    -----------
+    M_n, c_start, c_high_j : array_like or buffer of int
+        Broadcastable integer arrays. Raw buffers are read as int64.
+
+    Returns:
+    --------
+    tuple : (delta_n, C_total, M_next) as arrays
+        int64 when every intermediate value fits, otherwise object arrays
+        of Python ints. Results match calculate_next_magic element by element.
+    """
+    M_n = _as_integer_array(M_n, "M_n")
+    c_start = _as_integer_array(c_start, "c_start")
+    c_high_j = _as_integer_array(c_high_j, "c_high_j")
+
+    safe = (_fits_int64(c_start, INT64_C_START_LIMIT)
+            and _fits_int64(M_n, INT64_TERM_LIMIT)
+            and _fits_int64(c_high_j, INT64_TERM_LIMIT))
+    dtype = np.int64 if safe else object
+
+    M_n = M_n.astype(dtype, copy=False)
+    c_start = c_start.astype(dtype, copy=False)
+    c_high_j = c_high_j.astype(dtype, copy=False)
+
+    # Same floor division as the scalar path, so negative inputs agree too
+    delta_n = (c_start * (c_start + 2)) // 4
+    C_total = delta_n + c_high_j
+    M_next = M_n + C_total
+
+    return delta_n, C_total, M_next
+
+
+def calculate_delta_n_batch(c_start):
+    """Vectorized Δn = c_start × (c_start + 2) / 4 (see calculate_delta_n)."""
+    delta_n, _, _ = calculate_next_magic_batch(0, c_start, 0)
+    return delta_n
@@ -0,0 +1,384 @@
+#!/usr/bin/env python3
+"""
+Streaming Batch Calculator
+Non-interactive counterpart of the calculator for pipelines.
+
+Reads (M_n, c_start, c_high_j) rows as CSV or JSONL from a file or stdin,
+evaluates them chunk by chunk with calculate_next_magic_batch and writes
+(M_n, c_start, c_high_j, delta_n, C_total, M_next) in the same or the other
+format. Only one chunk is held in memory at a time. Malformed rows are
+reported on the error stream (line number, reason, raw text) and skipped.
+
+Each chunk is first parsed in one vectorized call (np.loadtxt for CSV, a
+single json.loads for JSONL); only a chunk that fails that fast path is
+re-parsed row by row to isolate the bad lines.
+
+Author: André Luís Tomaz Dionísio
+Institution: EPHEC Brussels, Belgium
+Date: December 2025
+
+Usage:
+    python magic_number_calculator.py batch [input.csv|input.jsonl|-] [options]
+    cat params.csv | python batch_stream.py > results.csv
+
+Requirements:
+- numpy
+"""
+
+import argparse
+import json
+import os
+import sys
+from collections import namedtuple
+from itertools import islice
+
+import numpy as np
+
+from batch_calculator import calculate_next_magic_batch
+import instrumentation
+from instrumentation import count, span
+
+INPUT_FIELDS = ('M_n', 'c_start', 'c_high_j')
+OUTPUT_FIELDS = INPUT_FIELDS + ('delta_n', 'C_total', 'M_next')
+DEFAULT_CHUNK_SIZE = 65_536
+
+_CSV_ROW = ','.join(['%d'] * len(OUTPUT_FIELDS)) + '\n'
+_JSONL_ROW = '{' + ', '.join(f'"{name}": %d' for name in OUTPUT_FIELDS) + '}\n'
+
+# Literal text around the numbers of one output row, for _format_int64_rows
+_CSV_LITERALS = [b''] + [b','] * (len(OUTPUT_FIELDS) - 1) + [b'\n']
+_JSONL_LITERALS = ([b'{"%s": ' % OUTPUT_FIELDS[0].encode()]
+                   + [b', "%s": ' % name.encode() for name in OUTPUT_FIELDS[1:]]
+                   + [b'}\n'])
+
+StreamStats = namedtuple('StreamStats', ['rows', 'errors', 'chunks'])
+
+
+class MalformedRow(ValueError):
+    """A single input row that cannot be turned into three integers."""
+
+
+# =============================================================================
+# PARSING
+# =============================================================================
+
+
+def _to_int(value):
+    """Strict integer conversion: accepts ints and integer strings, not floats or bools."""
+    if isinstance(value, bool) or not isinstance(value, (int, str)):
+        raise MalformedRow(f"expected an integer, got {value!r}")
+    try:
+        return int(value)
+    except ValueError:
+        raise MalformedRow(f"expected an integer, got {value!r}") from None
+
+
+def _csv_header(line):
+    """Column order from a header line, or None if the line is data."""
+    names = [name.strip() for name in line.decode('utf-8', 'replace').split(',')]
+    if sorted(names) == sorted(INPUT_FIELDS):
+        return [names.index(field) for field in INPUT_FIELDS]
+    return None
+
+
+def _parse_csv_row(line, order):
+    fields = line.split(b',')
+    if len(fields) != len(INPUT_FIELDS):
+        raise MalformedRow(f"expected {len(INPUT_FIELDS)} fields, got {len(fields)}")
+    values = [_to_int(field.strip().decode('utf-8', 'replace')) for field in fields]
+    return [values[i] for i in order]
+
+
+def _parse_jsonl_row(line):
+    try:
+        record = json.loads(line)
+    except ValueError as e:
+        raise MalformedRow(f"invalid JSON ({e.msg})") from None
+    if isinstance(record, dict):
+        try:
+            return [_to_int(record[name]) for name in INPUT_FIELDS]
+        except KeyError as e:
+            raise MalformedRow(f"missing key {e.args[0]!r}") from None
+    if isinstance(record, list) and len(record) == len(INPUT_FIELDS):
+        return [_to_int(value) for value in record]
+    raise MalformedRow(f"expected an object with keys {', '.join(INPUT_FIELDS)} "
+                       f"or a list of {len(INPUT_FIELDS)} integers")
+
+
+def _fast_csv(lines, order):
+    """(n, 3) int64 array for a clean chunk, or None to fall back per row."""
+    try:
+        values = np.loadtxt(lines, delimiter=',', dtype=np.int64, ndmin=2,
+                            comments=None, encoding=None)
+    except ValueError:
+        return None
+    # loadtxt skips blank lines; so do we, but then line numbers need the slow path
+    if values.shape != (len(lines), len(INPUT_FIELDS)):
+        return None
+    return values[:, order]
+
+
+def _fast_jsonl(lines):
+    """(n, 3) int64 array for a clean chunk, or None to fall back per row."""
+    data = b','.join(lines)
+    if b'true' in data or b'false' in data:
+        return None  # np.array would silently turn booleans into integers
+    try:
+        records = json.loads(b'[' + data + b']')
+        if all(type(r) is dict for r in records):
+            columns = [[r[name] for r in records] for name in INPUT_FIELDS]
+        elif all(type(r) is list and len(r) == len(INPUT_FIELDS) for r in records):
+            columns = list(zip(*records)) if records else [(), (), ()]
+        else:
+            return None
+        values = np.array(columns).T
+    except (ValueError, KeyError, TypeError, OverflowError):
+        return None
+    if values.dtype != np.int64 or values.shape != (len(lines), len(INPUT_FIELDS)):
+        return None
+    return values
+
+
+def parse_chunk(lines, fmt, first_line, errors, order=(0, 1, 2)):
+    """
+    Parse one chunk of raw input lines into an (n, 3) integer array.
+
+    Rows that cannot be parsed are written to `errors` as
+    "line <number>: <reason>: <raw line>" and left out of the result.
+
+    Returns:
+    --------
+    (values, error_count) : int64 array, or object array of Python ints when
+                            a value exceeds the int64 range
+    """
+    if fmt == 'csv':
+        values = _fast_csv(lines, order)
+    else:
+        values = _fast_jsonl(lines)
+    if values is not None:
+        return values, 0
+
+    rows = []
+    error_count = 0
+    for number, line in enumerate(lines, first_line):
+        if not line.strip():
+            continue
+        try:
+            if fmt == 'csv':
+                rows.append(_parse_csv_row(line, order))
+            else:
+                rows.append(_parse_jsonl_row(line))
+        except MalformedRow as e:
+            error_count += 1
+            raw = line.rstrip(b'\r\n').decode('utf-8', 'replace')
+            errors.write(f"line {number}: {e}: {raw}\n")
+
+    if not rows:
+        return np.empty((0, len(INPUT_FIELDS)), dtype=np.int64), error_count
+    try:
+        values = np.array(rows, dtype=np.int64)
+    except OverflowError:
+        values = np.array(rows, dtype=object)
+    return values, error_count
+
+
+# =============================================================================
+# FORMATTING
+# =============================================================================
+
+
+def _format_int64_rows(table, literals):
+    """
+    ASCII text of an int64 table, one row per line, built with array ops.
+
+    literals[j] is written before column j and literals[-1] after the last
+    column. Each row is laid out in a fixed-width byte matrix with every
+    number right-aligned in a slot as wide as its column's widest value;
+    the NUL padding is then dropped with one mask, which keeps the rows in
+    order. The cost grows with the number of digits, not with Python calls
+    per row.
+    """
+    n, m = table.shape
+    negative = table < 0
+    magnitude = np.abs(table)
+    largest = int(magnitude.max())
+    if largest < 2**32:
+        magnitude = magnitude.astype(np.uint32)  # much cheaper division
+    digits = np.ones(table.shape, dtype=np.uint8)
+    power = 10
+    while power <= largest:
+        digits += magnitude >= power
+        power *= 10
+    slot = (digits + negative).max(axis=0)
+
+    row_width = sum(len(text) for text in literals) + int(slot.sum())
+    layout = np.zeros((n, row_width), dtype=np.uint8)
+    column = 0
+    for j in range(m + 1):
+        text = np.frombuffer(literals[j], dtype=np.uint8)
+        layout[:, column:column + len(text)] = text
+        column += len(text)
+        if j == m:
+            break
+        value = magnitude[:, j]
+        width = digits[:, j]
+        sign = negative[:, j].view(np.uint8) * np.uint8(ord('-'))
+        end = column + int(slot[j])
+        for d in range(int(slot[j])):
+            quotient = value // 10
+            char = (value - quotient * 10).astype(np.uint8) + np.uint8(ord('0'))
+            # digit while d < width, then the sign (or NUL padding)
+            layout[:, end - 1 - d] = np.where(width > d, char, sign * (width == d))
+            value = quotient
+        column = end
+
+    flat = layout.ravel()
+    return flat[flat != 0].tobytes().decode('ascii')
+
+
+def format_chunk(values, delta_n, C_total, M_next, fmt):
+    """Render one chunk of results as CSV or JSONL text."""
+    if len(values) == 0:
+        return ''
+    table = np.column_stack([values, delta_n, C_total, M_next])
+    if table.dtype == np.int64:
+        return _format_int64_rows(table, _CSV_LITERALS if fmt == 'csv' else _JSONL_LITERALS)
+    # Python ints beyond int64: one %-format over the whole chunk
+    row = _CSV_ROW if fmt == 'csv' else _JSONL_ROW
+    return (row * len(table)) % tuple(table.ravel().tolist())
+
+
+# =============================================================================
+# STREAMING
+# =============================================================================
+
+
+def detect_format(first_line, path=None):
+    """'jsonl' for .jsonl/.json paths or lines starting with { or [, else 'csv'."""
+    if path and path.lower().endswith(('.jsonl', '.json', '.ndjson')):
+        return 'jsonl'
+    if path and path.lower().endswith('.csv'):
+        return 'csv'
+    return 'jsonl' if first_line.lstrip()[:1] in (b'{', b'[') else 'csv'
+
+
+def stream_batch(source, sink, errors, input_format='auto', output_format=None,
+                 chunk_size=DEFAULT_CHUNK_SIZE, header=True, path=None):
+    """
+    Stream rows from `source` through the batch calculator into `sink`.
+
+    Parameters:
+    -----------
+    source : binary file-like
+        Input lines (CSV or JSONL).
+    sink : text file-like
+        Receives the results, one chunk per write.
+    errors : text file-like
+        Receives one line per malformed input row.
+    input_format : {'auto', 'csv', 'jsonl'}
+    output_format : {'csv', 'jsonl'} or None (same as the input)
+    chunk_size : int
+        Lines per chunk; memory use is bounded by this, not the input size.
+    header : bool
+        Write a CSV header line.
+    path : str or None
+        Input path, used only to detect the format from its extension.
+
+    Returns:
+    --------
+    StreamStats(rows, errors, chunks)
+    """
+    lines = iter(source)
+    first = next(lines, b'')
+    fmt = detect_format(first, path) if input_format == 'auto' else input_format
+    output_format = output_format or fmt
+
+    order = list(range(len(INPUT_FIELDS)))
+    pending = [first] if first else []
+    line_number = 1
+    if fmt == 'csv' and first:
+        header_order = _csv_header(first)
+        if header_order is not None:
+            order, pending, line_number = header_order, [], 2
+
+    if output_format == 'csv' and header:
+        sink.write(','.join(OUTPUT_FIELDS) + '\n')
+
+    rows = error_count = chunks = 0
+    while True:
+        chunk = pending + list(islice(lines, chunk_size - len(pending)))
+        pending = []
+        if not chunk:
+            break
+        with span('batch.parse', lines=len(chunk)):
+            values, bad = parse_chunk(chunk, fmt, line_number, errors, order)
+        line_number += len(chunk)
+        error_count += bad
+        if len(values):
+            with span('batch.compute', rows=len(values)):
+                delta_n, C_total, M_next = calculate_next_magic_batch(
+                    values[:, 0], values[:, 1], values[:, 2])
+            with span('batch.format', rows=len(values)):
+                text = format_chunk(values, delta_n, C_total, M_next, output_format)
+            with span('batch.write', chars=len(text)):
+                sink.write(text)
+        rows += len(values)
+        chunks += 1
+        count('batch.rows', len(values))
+        count('batch.errors', bad)
+
+    return StreamStats(rows, error_count, chunks)
+
+
+def main(argv=None):
+    """Command-line entry point of the batch subcommand."""
+    parser = argparse.ArgumentParser(
+        prog='magic_number_calculator.py batch',
+        description="Stream (M_n, c_start, c_high_j) rows through the calculator.")
+    parser.add_argument('input', nargs='?', default='-',
+                        help="CSV or JSONL file (default: stdin)")
+    parser.add_argument('-o', '--output', default='-',
+                        help="output file (default: stdout)")
+    parser.add_argument('--errors', default=None,
+                        help="file for malformed rows (default: stderr)")
+    parser.add_argument('--input-format', choices=['auto', 'csv', 'jsonl'],
+                        default='auto')
+    parser.add_argument('--output-format', choices=['csv', 'jsonl'], default=None,
+                        help="default: same as the input")
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument('--no-header', action='store_true',
+                        help="do not write a CSV header line")
+    instrumentation.add_arguments(parser)
+    args = parser.parse_args(argv)
+    if args.chunk_size < 1:
+        parser.error("--chunk-size must be positive")
+
+    source = sys.stdin.buffer if args.input == '-' else open(args.input, 'rb')
+    sink = (sys.stdout if args.output == '-'
+            else open(args.output, 'w', encoding='utf-8', newline='\n'))
+    errors = sys.stderr if args.errors is None else open(args.errors, 'w', encoding='utf-8')
+    recorder = instrumentation.start_from_args(args)
+    try:
+        stats = stream_batch(source, sink, errors, args.input_format,
+                             args.output_format, args.chunk_size,
+                             header=not args.no_header,
+                             path=None if args.input == '-' else args.input)
+    except BrokenPipeError:
+        # Downstream consumer (e.g. head) closed the pipe; silence the
+        # flush at interpreter exit
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+    finally:
+        for stream in (source, sink, errors):
+            if stream not in (sys.stdin.buffer, sys.stdout, sys.stderr):
+                stream.close()
+        instrumentation.finish_from_args(args, recorder)
+
+    if stats.errors:
+        print(f"{stats.errors} malformed row(s) skipped, {stats.rows} processed",
+              file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
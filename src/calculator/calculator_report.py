@@ -0,0 +1,465 @@
+#!/usr/bin/env python3
+"""
+Calculator Results and Renderers
+Pure computations behind the calculator menu, and their output formats.
+
+Each compute_* function returns a small result object (plain attributes in
+__slots__, no printing). render() turns a result into text (the calculator's
+console layout), JSON or Markdown and writes it to a stream in a single
+write() call, so that tests, figures and services can use the same results
+without terminal I/O.
+
+Author: André Luís Tomaz Dionísio
+Institution: EPHEC Brussels, Belgium
+Date: December 2025
+"""
+
+import json
+import sys
+
+from instrumentation import traced
+from magic_number_calculator import calculate_next_magic
+
+FORMATS = ('text', 'json', 'markdown')
+
+# =============================================================================
+# RESULT TYPES
+# =============================================================================
+
+
+class _Result:
+    """Base class: equality, repr and to_dict() from __slots__."""
+
+    __slots__ = ()
+
+    def to_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __eq__(self, other):
+        return type(self) is type(other) and self.to_dict() == other.to_dict()
+
+    def __repr__(self):
+        fields = ', '.join(f"{k}={v!r}" for k, v in self.to_dict().items())
+        return f"{type(self).__name__}({fields})"
+
+
+class Calculation(_Result):
+    """One application of the formula: M_n → M_{n+1}."""
+
+    __slots__ = ('M_n', 'c_start', 'c_high_j', 'delta_n', 'C_total', 'M_next')
+
+    def __init__(self, M_n, c_start, c_high_j, delta_n, C_total, M_next):
+        self.M_n = M_n
+        self.c_start = c_start
+        self.c_high_j = c_high_j
+        self.delta_n = delta_n
+        self.C_total = C_total
+        self.M_next = M_next
+
+    @property
+    def sequence(self):
+        """Decreasing even terms c_start, c_start-2, ..., 2 that sum to Δn."""
+        return list(range(self.c_start, 0, -2))
+
+
+class ValidationRow(_Result):
+    """One shell of the validation chain and the magic number it should reach."""
+
+    __slots__ = ('M_n', 'c_start', 'c_high_j', 'delta_n', 'C_total', 'M_next',
+                 'expected')
+
+    def __init__(self, M_n, c_start, c_high_j, delta_n, C_total, M_next, expected):
+        self.M_n = M_n
+        self.c_start = c_start
+        self.c_high_j = c_high_j
+        self.delta_n = delta_n
+        self.C_total = C_total
+        self.M_next = M_next
+        self.expected = expected
+
+    @property
+    def valid(self):
+        return self.M_next == self.expected
+
+    def to_dict(self):
+        result = _Result.to_dict(self)
+        result['valid'] = self.valid
+        return result
+
+
+class Validation(_Result):
+    """The validation chain 0 → 184."""
+
+    __slots__ = ('rows',)
+
+    def __init__(self, rows):
+        self.rows = tuple(rows)
+
+    @property
+    def all_valid(self):
+        return all(row.valid for row in self.rows)
+
+    def column(self, name):
+        """One field of every row, e.g. column('M_next')."""
+        return tuple(getattr(row, name) for row in self.rows)
+
+    def __iter__(self):
+        return iter(self.rows)
+
+    def __len__(self):
+        return len(self.rows)
+
+    def to_dict(self):
+        return {'rows': [row.to_dict() for row in self.rows],
+                'all_valid': self.all_valid}
+
+
+class HierarchyLevel(_Result):
+    """One Δn stability level with example nuclides."""
+
+    __slots__ = ('delta_n', 'level', 'examples')
+
+    def __init__(self, delta_n, level, examples):
+        self.delta_n = delta_n
+        self.level = level
+        self.examples = examples
+
+
+class SequencePattern(_Result):
+    """Decreasing sequence and sphere closure that lead to one magic number."""
+
+    __slots__ = ('magic', 'sequence', 'sphere', 'note')
+
+    def __init__(self, magic, sequence, sphere, note):
+        self.magic = magic
+        self.sequence = tuple(sequence)
+        self.sphere = sphere
+        self.note = note
+
+    def to_dict(self):
+        result = _Result.to_dict(self)
+        result['sequence'] = list(self.sequence)
+        return result
+
+
+class ShellTable(_Result):
+    """A run of consecutive shells of the magic-number chain."""
+
+    __slots__ = ('shells',)
+
+    def __init__(self, shells):
+        self.shells = tuple(shells)
+
+    def column(self, name):
+        """One field of every shell, e.g. column('M_next')."""
+        return tuple(getattr(shell, name) for shell in self.shells)
+
+    def __iter__(self):
+        return iter(self.shells)
+
+    def __len__(self):
+        return len(self.shells)
+
+    def to_dict(self):
+        return {'shells': [shell._asdict() for shell in self.shells]}
+
+# =============================================================================
+# PURE COMPUTATIONS
+# =============================================================================
+
+
+# Δn levels; their examples come from the doubly-magic scorer (doubly_magic.py)
+STABILITY_LEVELS = (
+    (2,  "LOCAL"),
+    (6,  "SUBSHELL"),
+    (12, "REGIONAL"),
+    (20, "STRONG"),
+    (30, "MAJOR"),
+    (42, "COMPLETE"),
+)
+
+DECREASING_PATTERNS = (
+    (2,   [],                      2,  ""),
+    (8,   [4, 2],                  0,  ""),
+    (20,  [6, 4, 2],               0,  ""),
+    (28,  [],                      8,  "← sphere closure"),
+    (50,  [6, 4, 2],              10,  ""),
+    (82,  [8, 6, 4, 2],           12,  ""),
+    (126, [10, 8, 6, 4, 2],       14,  ""),
+    (184, [12, 10, 8, 6, 4, 2],   16,  "(predicted)"),
+)
+
+
+def compute_calculation(M_n, c_start, c_high_j):
+    """Calculation result for one set of parameters."""
+    return Calculation(M_n, c_start, c_high_j,
+                       *calculate_next_magic(M_n, c_start, c_high_j))
+
+
+@traced('calculator.validation')
+def compute_validation():
+    """Validation chain of all known magic numbers (0 → 184)."""
+    from magic_sequence import MagicSequence, KNOWN_MAGIC_NUMBERS
+
+    # Parameters derived shell by shell, checked against the known values
+    expected_values = KNOWN_MAGIC_NUMBERS + (184,)
+    shells = MagicSequence().prefix(len(expected_values))
+    return Validation(
+        ValidationRow(s.M_n, s.c_start, s.c_high_j,
+                      *calculate_next_magic(s.M_n, s.c_start, s.c_high_j),
+                      expected)
+        for s, expected in zip(shells, expected_values))
+
+
+@traced('calculator.sequence')
+def compute_sequence(start=0, count=8, rule=None):
+    """Shells start, ..., start + count - 1 of the chain (default: published rule)."""
+    from magic_sequence import MagicSequence
+
+    sequence = MagicSequence() if rule is None else MagicSequence(rule=rule)
+    return ShellTable(sequence.iter_shells(start, start + count))
+
+
+def stability_hierarchy():
+    """The Δn stability levels, with doubly-magic examples scored on the (Z, N) grid."""
+    from doubly_magic import hierarchy_examples
+
+    examples = hierarchy_examples([delta_n for delta_n, _ in STABILITY_LEVELS])
+    return tuple(HierarchyLevel(delta_n, level, ", ".join(examples[delta_n]))
+                 for delta_n, level in STABILITY_LEVELS)
+
+
+def decreasing_sequences():
+    """The decreasing sequence pattern of every magic number."""
+    return tuple(SequencePattern(*pattern) for pattern in DECREASING_PATTERNS)
+
+# =============================================================================
+# TEXT RENDERERS (console layout of the calculator)
+# =============================================================================
+
+
+def _text_calculation(calc):
+    M_n, c_start, c_high_j = calc.M_n, calc.c_start, calc.c_high_j
+    delta_n, C_total, M_next = calc.delta_n, calc.C_total, calc.M_next
+    lines = [
+        f"\n{'='*60}",
+        f"Calculating next magic number after M_n = {M_n}",
+        f"{'='*60}",
+        "\nGiven parameters:",
+        f"  c_start  = {c_start}",
+        f"  c_high-j = {c_high_j}",
+        "\nStep 1: Calculate Δn",
+        "  Δn = c_start × (c_start + 2) / 4",
+        f"  Δn = {c_start} × {c_start + 2} / 4",
+        f"  Δn = {c_start * (c_start + 2)} / 4",
+        f"  Δn = {delta_n}",
+    ]
+    # Show decreasing sequence
+    if c_start > 0:
+        sequence = calc.sequence
+        lines.append(f"\n  This is the sum of: {' + '.join(map(str, sequence))}")
+        lines.append(f"  Sum verification: {sum(sequence)} = {delta_n} ✓")
+    lines += [
+        "\nStep 2: Calculate C_total",
+        "  C_total = Δn + c_high-j",
+        f"  C_total = {delta_n} + {c_high_j}",
+        f"  C_total = {C_total}",
+        "\nStep 3: Calculate M_{n+1}",
+        "  M_{n+1} = M_n + C_total",
+        f"  M_{{n+1}} = {M_n} + {C_total}",
+        f"  M_{{n+1}} = {M_next}",
+        f"\n{'='*60}",
+        f"RESULT: Next magic number is {M_next}",
+        f"{'='*60}\n",
+    ]
+    return lines
+
+
+def _text_validation(validation):
+    lines = [
+        "\n" + "="*70,
+        "VALIDATION: All Known Magic Numbers (0 → 184)",
+        "="*70,
+        f"\n{'M_n':>5} | {'c_start':>8} | {'c_high-j':>8} | {'Δn':>6} | "
+        f"{'C_total':>8} | {'M_next':>7} | {'Expected':>8}",
+        "-"*70,
+    ]
+    for r in validation.rows:
+        status = "✓" if r.valid else "✗"
+        lines.append(f"{r.M_n:5} | {r.c_start:8} | {r.c_high_j:8} | {r.delta_n:6} | "
+                     f"{r.C_total:8} | {r.M_next:7} | {r.expected:8} {status}")
+    lines.append("-"*70)
+    lines.append("ALL VALIDATIONS PASSED! ✓✓✓" if validation.all_valid
+                 else "VALIDATION FAILED!")
+    lines.append("="*70 + "\n")
+    return lines
+
+
+def _text_shells(table):
+    lines = [
+        "\n" + "="*70,
+        "MAGIC NUMBER SEQUENCE",
+        "="*70,
+        f"\n{'Shell':>5} | {'M_n':>6} | {'c_start':>8} | {'c_high-j':>8} | {'Δn':>6} | "
+        f"{'C_total':>8} | {'M_next':>7}",
+        "-"*70,
+    ]
+    for s in table.shells:
+        lines.append(f"{s.index:5} | {s.M_n:6} | {s.c_start:8} | {s.c_high_j:8} | "
+                     f"{s.delta_n:6} | {s.C_total:8} | {s.M_next:7}")
+    lines.append("="*70 + "\n")
+    return lines
+
+
+def _text_hierarchy(levels):
+    lines = [
+        "\n" + "="*60,
+        "STABILITY HIERARCHY (based on Δn)",
+        "="*60,
+        f"\n{'Δn':>4} | {'Level':>10} | {'Examples'}",
+        "-"*60,
+    ]
+    for level in levels:
+        lines.append(f"{level.delta_n:4} | {level.level:>10} | {level.examples}")
+    lines += [
+        "\n" + "="*60,
+        "Higher Δn = Greater Nuclear Stability",
+        "="*60 + "\n",
+    ]
+    return lines
+
+
+def _text_sequences(patterns):
+    lines = [
+        "\n" + "="*70,
+        "DECREASING SEQUENCE PATTERN",
+        "="*70,
+        f"\n{'Magic':>6} | {'Decreasing Sequence':>30} | {'Sphere':>8} | {'Note'}",
+        "-"*70,
+    ]
+    for p in patterns:
+        seq_str = "→".join(map(str, p.sequence)) if p.sequence else "—"
+        sphere_str = str(p.sphere) if p.sphere > 0 else "—"
+        lines.append(f"{p.magic:6} | {seq_str:>30} | {sphere_str:>8} | {p.note}")
+    lines += [
+        "\n" + "="*70,
+        "Pattern: Start higher → Descend by 2 → Reach 2 → Start even higher",
+        "="*70 + "\n",
+    ]
+    return lines
+
+# =============================================================================
+# MARKDOWN RENDERERS
+# =============================================================================
+
+
+def _md_table(header, rows):
+    lines = ["| " + " | ".join(header) + " |",
+             "|" + "|".join("---" for _ in header) + "|"]
+    lines += ["| " + " | ".join(str(cell) for cell in row) + " |" for row in rows]
+    return lines
+
+
+def _md_calculation(calc):
+    lines = [f"### M_n = {calc.M_n} → M_{{n+1}} = {calc.M_next}", ""]
+    lines += _md_table(["M_n", "c_start", "c_high-j", "Δn", "C_total", "M_{n+1}"],
+                       [[calc.M_n, calc.c_start, calc.c_high_j, calc.delta_n,
+                         calc.C_total, f"**{calc.M_next}**"]])
+    if calc.c_start > 0:
+        lines += ["", f"Δn = {' + '.join(map(str, calc.sequence))} = {calc.delta_n}"]
+    return lines + [""]
+
+
+def _md_validation(validation):
+    lines = ["### Validation: All Known Magic Numbers (0 → 184)", ""]
+    lines += _md_table(
+        ["M_n", "c_start", "c_high-j", "Δn", "C_total", "M_{n+1}", "Expected", "Status"],
+        [[r.M_n, r.c_start, r.c_high_j, r.delta_n, r.C_total, f"**{r.M_next}**",
+          r.expected, "✓" if r.valid else "✗"] for r in validation.rows])
+    lines += ["", "**All validations passed.**" if validation.all_valid
+              else "**Validation failed.**", ""]
+    return lines
+
+
+def _md_shells(table):
+    lines = ["### Magic Number Sequence", ""]
+    lines += _md_table(["Shell", "M_n", "c_start", "c_high-j", "Δn", "C_total", "M_{n+1}"],
+                       [[s.index, s.M_n, s.c_start, s.c_high_j, s.delta_n, s.C_total,
+                         f"**{s.M_next}**"] for s in table.shells])
+    return lines + [""]
+
+
+def _md_hierarchy(levels):
+    lines = ["### Stability Hierarchy (based on Δn)", ""]
+    lines += _md_table(["Δn", "Level", "Examples"],
+                       [[lv.delta_n, lv.level, lv.examples] for lv in levels])
+    return lines + [""]
+
+
+def _md_sequences(patterns):
+    lines = ["### Decreasing Sequence Pattern", ""]
+    lines += _md_table(
+        ["Magic", "Decreasing Sequence", "Sphere", "Note"],
+        [[p.magic, "→".join(map(str, p.sequence)) or "—",
+          p.sphere if p.sphere > 0 else "—", p.note] for p in patterns])
+    return lines + [""]
+
+# =============================================================================
+# DISPATCH
+# =============================================================================
+
+
+def _kind(result):
+    """Renderer key of a result: a result object or a tuple of them."""
+    if isinstance(result, tuple) and result:
+        result = result[0]
+    for kind, cls in (('calculation', Calculation), ('validation', Validation),
+                      ('shells', ShellTable), ('hierarchy', HierarchyLevel),
+                      ('sequences', SequencePattern)):
+        if isinstance(result, cls):
+            return kind
+    raise TypeError(f"Cannot render {type(result).__name__}")
+
+
+_TEXT = {'calculation': _text_calculation, 'validation': _text_validation,
+         'shells': _text_shells, 'hierarchy': _text_hierarchy, 'sequences': _text_sequences}
+_MARKDOWN = {'calculation': _md_calculation, 'validation': _md_validation,
+             'shells': _md_shells, 'hierarchy': _md_hierarchy, 'sequences': _md_sequences}
+
+
+def to_jsonable(result):
+    """Plain dict/list form of a result object or a tuple of them."""
+    if isinstance(result, tuple):
+        return [r.to_dict() for r in result]
+    return result.to_dict()
+
+
+def render_string(result, fmt='text'):
+    """Rendered result as one string."""
+    if fmt == 'json':
+        return json.dumps(to_jsonable(result), ensure_ascii=False) + "\n"
+    if fmt == 'text':
+        lines = _TEXT[_kind(result)](result)
+    elif fmt == 'markdown':
+        lines = _MARKDOWN[_kind(result)](result)
+    else:
+        raise ValueError(f"Unknown format: {fmt} (expected one of {', '.join(FORMATS)})")
+    return "\n".join(lines) + "\n"
+
+
+@traced('calculator.render')
+def render(results, fmt='text', stream=None):
+    """
+    Render one result, or a list of results, and write it in one call.
+
+    Parameters:
+    -----------
+    results : result object, tuple of result objects, or list of those
+    fmt : {'text', 'json', 'markdown'}
+        JSON output of a list is one document per line (JSON Lines).
+    stream : text file-like (default: sys.stdout)
+    """
+    if not isinstance(results, list):
+        results = [results]
+    stream = sys.stdout if stream is None else stream
+    stream.write("".join(render_string(result, fmt) for result in results))
@@ -0,0 +1,372 @@
+#!/usr/bin/env python3
+"""
+Calculator Service
+Local HTTP/JSON front end of the calculator (asyncio, standard library only).
+
+One long-running process serves the calculator to other tools, so they do
+not pay the interpreter start-up for every calculate_next_magic call.
+
+Endpoints (JSON in, JSON out):
+
+    POST /calculate  {"M_n": 82, "c_start": 10, "c_high_j": 14}
+                     or a list of such objects (batch)
+    GET  /calculate?M_n=82&c_start=10&c_high_j=14
+    POST /sequence   {"start": 0, "count": 8} or a list of such objects
+    GET  /sequence?start=0&count=8
+    GET  /validate   validation chain 0 → 184
+    GET  /stats      request counts, cache hits, latency p50/p99, throughput
+    GET  /health
+
+Results are kept in an LRU cache keyed on the endpoint and its parameters
+and bounded by the number of results it holds: one per calculation, one per
+shell of a /sequence response. The server binds to 127.0.0.1 by default and needs no network
+access beyond the loopback interface.
+
+Author: André Luís Tomaz Dionísio
+Institution: EPHEC Brussels, Belgium
+Date: December 2025
+
+Usage:
+    python calculator_service.py [--host 127.0.0.1] [--port 8765] [--cache-size 65536]
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from collections import OrderedDict, deque
+from urllib.parse import parse_qsl, urlsplit
+
+import instrumentation
+from calculator_report import compute_calculation, compute_validation
+from instrumentation import span
+from magic_sequence import MagicSequence
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+DEFAULT_CACHE_SIZE = 65_536
+LATENCY_WINDOW = 10_000        # most recent requests kept for percentiles
+MAX_BODY_BYTES = 16 * 1024 * 1024
+MAX_BATCH = 100_000
+MAX_SEQUENCE_COUNT = 10_000
+MAX_SEQUENCE_START = 100_000
+
+ENDPOINTS = ('/calculate', '/sequence', '/validate', '/stats', '/health')
+
+_REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found',
+            405: 'Method Not Allowed', 413: 'Payload Too Large',
+            500: 'Internal Server Error'}
+
+
+class RequestError(Exception):
+    """Client error, reported as a JSON {"error": ...} response."""
+
+    def __init__(self, message, status=400):
+        super().__init__(message)
+        self.status = status
+
+
+class LRUCache:
+    """
+    Mapping that evicts the least recently used entries once the total
+    weight of its entries exceeds maxsize.
+    """
+
+    def __init__(self, maxsize=DEFAULT_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.weight = 0
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+
+    def get_or_compute(self, key, compute, weight=1):
+        """Cached value of `key`, computed on a miss; entries heavier than maxsize are not kept."""
+        try:
+            value, _ = self._data[key]
+        except KeyError:
+            self.misses += 1
+            value = compute()
+            if weight <= self.maxsize:
+                self._data[key] = (value, weight)
+                self.weight += weight
+                while self.weight > self.maxsize:
+                    _, (_, evicted) = self._data.popitem(last=False)
+                    self.weight -= evicted
+            return value
+        self.hits += 1
+        self._data.move_to_end(key)
+        return value
+
+    def __len__(self):
+        return len(self._data)
+
+    def info(self):
+        total = self.hits + self.misses
+        return {'size': len(self._data), 'weight': self.weight, 'maxsize': self.maxsize,
+                'hits': self.hits, 'misses': self.misses,
+                'hit_rate': self.hits / total if total else 0.0}
+
+
+class Metrics:
+    """Request counters and a sliding window of latencies."""
+
+    def __init__(self, window=LATENCY_WINDOW):
+        self.started = time.monotonic()
+        self.requests = 0
+        self.items = 0
+        self.errors = 0
+        self.per_endpoint = {}
+        self._latencies = deque(maxlen=window)
+        self._finished = deque(maxlen=window)
+
+    def record(self, endpoint, seconds, items, ok):
+        self.requests += 1
+        self.items += items
+        self.errors += not ok
+        self.per_endpoint[endpoint] = self.per_endpoint.get(endpoint, 0) + 1
+        self._latencies.append(seconds)
+        self._finished.append(time.monotonic())
+
+    def snapshot(self):
+        uptime = time.monotonic() - self.started
+        latencies = sorted(self._latencies)
+
+        def percentile(q):
+            if not latencies:
+                return 0.0
+            return latencies[min(len(latencies) - 1, int(q * len(latencies)))] * 1e3
+
+        recent = 0.0
+        if len(self._finished) > 1:
+            span = self._finished[-1] - self._finished[0]
+            recent = (len(self._finished) - 1) / span if span > 0 else 0.0
+        return {
+            'uptime_s': uptime,
+            'requests': self.requests,
+            'items': self.items,
+            'errors': self.errors,
+            'per_endpoint': dict(self.per_endpoint),
+            'latency_ms': {'p50': percentile(0.50), 'p99': percentile(0.99),
+                           'max': latencies[-1] * 1e3 if latencies else 0.0,
+                           'window': len(latencies)},
+            'throughput_rps': {'overall': self.requests / uptime if uptime else 0.0,
+                               'recent': recent},
+        }
+
+# =============================================================================
+# REQUEST HANDLING
+# =============================================================================
+
+
+def _int_param(params, name, default=None):
+    value = params.get(name, default)
+    if value is None:
+        raise RequestError(f"missing parameter {name!r}")
+    if isinstance(value, bool):
+        raise RequestError(f"{name} must be an integer")
+    if isinstance(value, str):
+        try:
+            return int(value)
+        except ValueError:
+            raise RequestError(f"{name} must be an integer") from None
+    if not isinstance(value, int):
+        raise RequestError(f"{name} must be an integer")
+    return value
+
+
+def _as_batch(payload):
+    """(items, is_batch) from a single object or a list of objects."""
+    if isinstance(payload, list):
+        if len(payload) > MAX_BATCH:
+            raise RequestError(f"batch larger than {MAX_BATCH} items", 413)
+        if not all(isinstance(item, dict) for item in payload):
+            raise RequestError("batch items must be JSON objects")
+        return payload, True
+    if isinstance(payload, dict):
+        return [payload], False
+    raise RequestError("expected a JSON object or a list of objects")
+
+
+class CalculatorService:
+    """Endpoint logic, independent of the HTTP transport."""
+
+    def __init__(self, cache_size=DEFAULT_CACHE_SIZE):
+        self.cache = LRUCache(cache_size)
+        self.metrics = Metrics()
+        self.sequence = MagicSequence()
+
+    def calculate(self, params):
+        key = ('calculate', _int_param(params, 'M_n'), _int_param(params, 'c_start'),
+               _int_param(params, 'c_high_j'))
+        return self.cache.get_or_compute(
+            key, lambda: compute_calculation(*key[1:]).to_dict())
+
+    def shells(self, params):
+        start = _int_param(params, 'start', 0)
+        count = _int_param(params, 'count', 8)
+        if not (0 <= start <= MAX_SEQUENCE_START and 0 <= count <= MAX_SEQUENCE_COUNT):
+            raise RequestError(f"need 0 <= start <= {MAX_SEQUENCE_START} "
+                               f"and 0 <= count <= {MAX_SEQUENCE_COUNT}")
+        return self.cache.get_or_compute(
+            ('sequence', start, count),
+            lambda: [s._asdict() for s in self.sequence.iter_shells(start, start + count)],
+            weight=max(count, 1))
+
+    def validate(self, params):
+        return self.cache.get_or_compute(('validate',),
+                                         lambda: compute_validation().to_dict())
+
+    def handle(self, method, target, body):
+        """
+        Dispatch one request.
+
+        Returns:
+        --------
+        (status, response object, number of items computed)
+        """
+        url = urlsplit(target)
+        path = url.path.rstrip('/') or '/'
+        query = dict(parse_qsl(url.query))
+
+        if path == '/health':
+            return 200, {'status': 'ok'}, 0
+        if path == '/stats':
+            stats = self.metrics.snapshot()
+            stats['cache'] = self.cache.info()
+            return 200, stats, 0
+
+        endpoints = {'/calculate': self.calculate, '/sequence': self.shells,
+                     '/validate': self.validate}
+        if path not in endpoints:
+            raise RequestError(f"unknown endpoint {path}", 404)
+        if method == 'GET':
+            items, is_batch = [query], False
+        elif method == 'POST':
+            try:
+                payload = json.loads(body) if body.strip() else {}
+            except ValueError as e:
+                raise RequestError(f"invalid JSON: {e}") from None
+            items, is_batch = _as_batch(payload)
+        else:
+            raise RequestError(f"method {method} not allowed", 405)
+
+        handler = endpoints[path]
+        with span('service' + path.replace('/', '.'), items=len(items)):
+            results = [handler(item) for item in items]
+        return 200, (results if is_batch else results[0]), len(results)
+
+# =============================================================================
+# HTTP TRANSPORT
+# =============================================================================
+
+
+def _response(status, obj, keep_alive):
+    body = json.dumps(obj, ensure_ascii=False).encode('utf-8')
+    head = (f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+            f"Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+    return head.encode('ascii') + body
+
+
+async def _read_request(reader):
+    """(method, target, keep_alive, body) or None at end of stream."""
+    request_line = await reader.readline()
+    if not request_line.strip():
+        return None
+    try:
+        method, target, version = request_line.decode('latin-1').split()
+    except ValueError:
+        raise RequestError("malformed request line") from None
+
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+    keep_alive = (headers.get('connection', '').lower() != 'close'
+                  and version.upper() != 'HTTP/1.0')
+
+    try:
+        length = int(headers.get('content-length') or 0)
+    except ValueError:
+        raise RequestError("invalid Content-Length") from None
+    if length > MAX_BODY_BYTES:
+        raise RequestError("request body too large", 413)
+    body = await reader.readexactly(length) if length > 0 else b''
+    return method.upper(), target, keep_alive, body
+
+
+async def _serve_connection(service, reader, writer):
+    """Serve requests on one (keep-alive) connection."""
+    try:
+        while True:
+            try:
+                request = await _read_request(reader)
+            except RequestError as e:
+                writer.write(_response(e.status, {'error': str(e)}, False))
+                break
+            if request is None:
+                break
+            method, target, keep_alive, body = request
+
+            start = time.perf_counter()
+            items = 0
+            try:
+                status, obj, items = service.handle(method, target, body)
+            except RequestError as e:
+                status, obj = e.status, {'error': str(e)}
+            except Exception as e:  # keep serving other requests
+                status, obj = 500, {'error': f"{type(e).__name__}: {e}"}
+            writer.write(_response(status, obj, keep_alive))
+            path = urlsplit(target).path.rstrip('/')
+            service.metrics.record(path if path in ENDPOINTS else 'other',
+                                   time.perf_counter() - start, items, status == 200)
+            await writer.drain()
+            if not keep_alive:
+                break
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass
+    finally:
+        writer.close()
+
+
+async def start_server(host=DEFAULT_HOST, port=DEFAULT_PORT, cache_size=DEFAULT_CACHE_SIZE):
+    """Start the service; returns (asyncio.Server, CalculatorService)."""
+    service = CalculatorService(cache_size)
+    server = await asyncio.start_server(
+        lambda r, w: _serve_connection(service, r, w), host, port)
+    return server, service
+
+
+async def serve(host=DEFAULT_HOST, port=DEFAULT_PORT, cache_size=DEFAULT_CACHE_SIZE):
+    server, _ = await start_server(host, port, cache_size)
+    bound = server.sockets[0].getsockname()
+    print(f"Calculator service on http://{bound[0]}:{bound[1]}  "
+          f"(cache size {cache_size}; Ctrl+C to stop)")
+    async with server:
+        await server.serve_forever()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Local HTTP/JSON calculator service.")
+    parser.add_argument('--host', default=DEFAULT_HOST)
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--cache-size', type=int, default=DEFAULT_CACHE_SIZE,
+                        help="cached results, one per calculation or shell (default: %(default)s)")
+    instrumentation.add_arguments(parser)
+    args = parser.parse_args(argv)
+    recorder = instrumentation.start_from_args(args)
+    try:
+        asyncio.run(serve(args.host, args.port, args.cache_size))
+    except KeyboardInterrupt:
+        print("\nStopped.")
+    finally:
+        instrumentation.finish_from_args(args, recorder)
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+Doubly-Magic Scoring
+====================
+
+Applies the Δn hierarchy to protons and neutrons independently over the
+dense (Z, N) grid, in one broadcast:
+
+    s(x)     = Δn of the shell that starts at x, if x is a magic number of
+               the chain (2 → 2, 8 → 6, 20 → 2, 28 → 12, 50 → 20, 82 → 30,
+               126 → 42, 184 → 56, ...), else 0
+    doubly   : s(Z) > 0 and s(N) > 0, score = min(s(Z), s(N))
+    semi     : exactly one of them > 0, score = that one
+
+With the minimum, ⁴He and ⁴⁰Ca land on Δn = 2, ¹⁶O on 6, ⁵⁶Ni on 12, ¹⁰⁰Sn
+on 20 and ²⁰⁸Pb on 30, the levels of the stability hierarchy.
+
+Candidates within a band around the valley of stability (Green's formula,
+see woods_saxon.beta_stability_Z) are ranked doubly- before semi-magic, then
+by score, by the distance to the valley and by A. Doubly-magic candidates in the band without a
+measured mass are the "islands".
+
+Author: André Luís Tomaz Dionísio
+Institution: EPHEC Brussels, Belgium
+Date: December 2025
+
+Usage:
+    python doubly_magic.py                  # ranked doubly-magic table + islands
+    python doubly_magic.py --semi --valley-band 2 --top 30
+"""
+
+import argparse
+import time
+from collections import namedtuple
+
+import numpy as np
+
+from magic_sequence import MagicSequence
+from nuclide_index import NuclideIndex, MISSING
+from woods_saxon import beta_stability_Z
+
+DEFAULT_LIMIT = 200
+DEFAULT_TOP = 20
+
+# |Z - Z_stable(A)| kept by default: wide enough for ¹⁰⁰Sn (+7) and the
+# Z = 126, N = 184 island (+11)
+DEFAULT_VALLEY_BAND = 12
+
+# Candidate kinds on the grid
+NONE, SEMI, DOUBLY = 0, 1, 2
+KIND_NAMES = {SEMI: 'semi', DOUBLY: 'doubly'}
+
+# Examples listed per hierarchy level
+MAX_EXAMPLES = 3
+
+_SUPERSCRIPTS = str.maketrans('0123456789', '⁰¹²³⁴⁵⁶⁷⁸⁹')
+
+# Scores on the dense grid, Z along axis 0 and N along axis 1
+MagicGrid = namedtuple('MagicGrid', ['proton', 'neutron', 'kind', 'score', 'valley'])
+
+# One ranked nuclide; valley = Z - Z_stable(A), measured = in the mass table
+# with an experimental (not '#') mass
+Candidate = namedtuple('Candidate', ['Z', 'N', 'A', 'kind', 'score', 'proton_score',
+                                     'neutron_score', 'valley', 'measured', 'label'])
+
+# =============================================================================
+# SCORES
+# =============================================================================
+
+
+def nucleon_scores(limit=DEFAULT_LIMIT, sequence=None):
+    """s(x) for x = 0, ..., limit: Δn of the shell starting at magic number x, else 0."""
+    sequence = sequence or MagicSequence()
+    scores = np.zeros(limit + 1, dtype=np.int64)
+    for shell in sequence.iter_shells(1):
+        if shell.M_n > limit:
+            break
+        scores[shell.M_n] = shell.delta_n
+    return scores
+
+
+def score_grid(limit=DEFAULT_LIMIT, sequence=None):
+    """Proton/neutron scores, kind, combined score and valley distance for Z, N ≤ limit."""
+    s = nucleon_scores(limit, sequence)
+    proton, neutron = s[:, None], s[None, :]
+    magic_z, magic_n = proton > 0, neutron > 0
+    kind = (magic_z.astype(np.int8) + magic_n.astype(np.int8))
+    score = np.where(kind == DOUBLY, np.minimum(proton, neutron),
+                     np.maximum(proton, neutron))
+    Z, N = np.ogrid[:limit + 1, :limit + 1]
+    valley = Z - beta_stability_Z(Z + N)
+    return MagicGrid(np.broadcast_to(proton, kind.shape), np.broadcast_to(neutron, kind.shape),
+                     kind, score, valley)
+
+# =============================================================================
+# RANKING
+# =============================================================================
+
+
+def nuclide_label(Z, N, index=None):
+    """'²⁰⁸Pb' when the element is in the mass table, else 'Z=126 N=184'."""
+    row = MISSING if index is None else index.row(Z, N)
+    if row == MISSING:
+        isotopes = () if index is None else index.isotopes(Z)
+        if not len(isotopes):
+            return f"Z={Z} N={N}"
+        row = isotopes[0]
+    element = str(index.table['element'][row]).strip()
+    return f"{str(Z + N).translate(_SUPERSCRIPTS)}{element}"
+
+
+def rank_candidates(grid, index=None, kinds=(DOUBLY,), valley_band=None,
+                    measured=None, top=None):
+    """
+    Ranked candidates of the given kinds.
+
+    Parameters:
+    -----------
+    grid : MagicGrid
+    index : NuclideIndex or None
+        Mass table used for 'measured' and the element symbols.
+    kinds : iterable of SEMI/DOUBLY
+    valley_band : int or None
+        Keep only |Z - Z_stable(A)| ≤ valley_band.
+    measured : bool or None
+        Keep only measured (True) or only unmeasured (False) nuclides.
+    top : int or None
+        Number of candidates returned.
+
+    Returns:
+    --------
+    list of Candidate: doubly- before semi-magic, then by score (descending),
+    |valley|, A
+    """
+    keep = np.isin(grid.kind, list(kinds))
+    if valley_band is not None:
+        keep &= np.abs(grid.valley) <= valley_band
+    Z, N = np.nonzero(keep)
+
+    is_measured = np.zeros(len(Z), dtype=bool)
+    if index is not None:
+        rows = index.rows(Z, N)
+        found = rows != MISSING
+        is_measured[found] = ~index.table['estimated'][rows[found]]
+    if measured is not None:
+        select = is_measured == measured
+        Z, N, is_measured = Z[select], N[select], is_measured[select]
+
+    score = grid.score[Z, N]
+    valley = grid.valley[Z, N]
+    kind = grid.kind[Z, N]
+    order = np.lexsort((Z + N, np.abs(valley), -score, -kind))[:top]
+    candidates = []
+    for i in order:
+        z, n = int(Z[i]), int(N[i])
+        candidates.append(Candidate(z, n, z + n, KIND_NAMES[int(grid.kind[z, n])],
+                                    int(score[i]), int(grid.proton[z, n]),
+                                    int(grid.neutron[z, n]), int(valley[i]),
+                                    bool(is_measured[i]), nuclide_label(z, n, index)))
+    return candidates
+
+
+def islands(grid, index, valley_band=DEFAULT_VALLEY_BAND, top=None):
+    """Doubly-magic candidates near the valley without a measured mass, best first."""
+    return rank_candidates(grid, index, valley_band=valley_band, measured=False, top=top)
+
+
+def hierarchy_examples(levels, grid=None, index=None, max_examples=MAX_EXAMPLES,
+                       valley_band=DEFAULT_VALLEY_BAND):
+    """
+    Example nuclides for each Δn level of the stability hierarchy.
+
+    Measured doubly-magic nuclides near the valley with that score, closest
+    to the valley first; a level without any gets its best unmeasured
+    candidate, marked as predicted.
+
+    Returns:
+    --------
+    dict : Δn → list of labels
+    """
+    grid = grid if grid is not None else score_grid()
+    index = index if index is not None else NuclideIndex.load()
+    candidates = rank_candidates(grid, index, valley_band=valley_band)
+    examples = {}
+    for delta_n in levels:
+        level = [c for c in candidates if c.score == delta_n]
+        found = [c for c in level if c.measured]
+        if found:
+            examples[delta_n] = [c.label for c in found[:max_examples]]
+        elif level:
+            examples[delta_n] = [f"{level[0].label} (predicted)"]
+        else:
+            examples[delta_n] = []
+    return examples
+
+
+def main(argv=None):
+    """Print the ranked candidates and the island predictions."""
+    parser = argparse.ArgumentParser(description="Score doubly- and semi-magic nuclides.")
+    parser.add_argument('--limit', type=int, default=DEFAULT_LIMIT,
+                        help="largest Z and N on the grid (default: %(default)s)")
+    parser.add_argument('--top', type=int, default=DEFAULT_TOP,
+                        help="rows per table (default: %(default)s)")
+    parser.add_argument('--semi', action='store_true',
+                        help="rank semi-magic candidates as well")
+    parser.add_argument('--valley-band', type=int, default=DEFAULT_VALLEY_BAND,
+                        help="only candidates with |Z - Z_stable(A)| ≤ this, "
+                             "negative for all (default: %(default)s)")
+    parser.add_argument('--mass-table', default=None, help="path to mass.mas20")
+    args = parser.parse_args(argv)
+
+    index = NuclideIndex.load(args.mass_table)
+    start = time.perf_counter()
+    grid = score_grid(args.limit)
+    kinds = (DOUBLY, SEMI) if args.semi else (DOUBLY,)
+    band = args.valley_band if args.valley_band >= 0 else None
+    ranked = rank_candidates(grid, index, kinds, band, top=args.top)
+    predicted = islands(grid, index, band, top=args.top)
+    elapsed = time.perf_counter() - start
+
+    print("\n" + "="*78)
+    print(f"MAGIC SCORING: Δn hierarchy on the (Z, N) grid up to {args.limit}")
+    print("="*78)
+    for title, rows in (("Ranked candidates", ranked), ("Islands (no measured mass)", predicted)):
+        print(f"\n{title}:")
+        print(f"{'Nuclide':>14} | {'Z':>4} | {'N':>4} | {'Kind':>6} | {'Score':>5} | "
+              f"{'s(Z)':>4} | {'s(N)':>4} | {'Valley':>6} | Measured")
+        print("-"*78)
+        for c in rows:
+            print(f"{c.label:>14} | {c.Z:4} | {c.N:4} | {c.kind:>6} | {c.score:5} | "
+                  f"{c.proton_score:4} | {c.neutron_score:4} | {c.valley:+6} | "
+                  f"{'yes' if c.measured else 'no'}")
+    print("-"*78)
+    print(f"Grid {grid.kind.shape[0]}×{grid.kind.shape[1]}: "
+          f"{int((grid.kind == DOUBLY).sum())} doubly-magic, "
+          f"{int((grid.kind == SEMI).sum())} semi-magic cells   "
+          f"Time: {elapsed * 1000:.1f} ms")
+    print("="*78 + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
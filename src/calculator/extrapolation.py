@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+"""
+Superheavy Extrapolation: rule variants beyond 126
+==================================================
+
+Runs several plausible continuations of the (c_start, c_high_j) rule out to
+N ≈ 450 and compares the magic numbers and Δn values they predict:
+
+    published     the article's rule (c_start = c_high_j - 4 from shell 4)
+    orbital       parameters read off the spin-orbit level tables
+    oscillator    no spin-orbit lowering at all: c_start = 2k, c_high_j = 2k + 2
+    strong_so     beyond 126 the intruder also displaces the next orbital of
+                  the decreasing sequence (c_start = c_high_j - 6)
+    weak_so       beyond 126 the intruder stays in its own shell
+                  (c_start = c_high_j - 2, as in the sd shell)
+    high_intruder beyond 126 the intruder comes from one oscillator shell
+                  higher (c_high_j = 2k + 4, c_start = c_high_j - 4)
+
+Only variants that reproduce the known magic numbers up to 126 count
+towards the agreement column; the oscillator is shown for reference but
+already departs at 28.
+
+Each variant runs in its own worker process and its shells are cached as
+JSON under build/extrapolation/, keyed by the variant, its parameters and
+the source of its rule; an entry computed to a higher limit is reused.
+Adding a variant, or editing one, only recomputes that variant.
+
+Author: André Luís Tomaz Dionísio
+Institution: EPHEC Brussels, Belgium
+Date: December 2025
+
+Usage:
+    python extrapolation.py                        # all variants up to 450
+    python extrapolation.py --limit 600 --variants published strong_so
+    python extrapolation.py --no-cache --workers 1
+"""
+
+import argparse
+import functools
+import hashlib
+import inspect
+import json
+import os
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+from magic_sequence import KNOWN_MAGIC_NUMBERS, MagicSequence, published_rule
+from orbital_filling import orbital_rule
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.normpath(os.path.join(HERE, '..', '..'))
+DEFAULT_CACHE_DIR = os.path.join(REPO_ROOT, 'build', 'extrapolation')
+
+DEFAULT_LIMIT = 450
+
+# Last experimentally established magic number; variants only differ beyond it
+LAST_KNOWN = KNOWN_MAGIC_NUMBERS[-1]
+FIRST_EXTRAPOLATED_SHELL = len(KNOWN_MAGIC_NUMBERS)
+
+# name, one-line description, rule (picklable: module-level function or partial)
+RuleVariant = namedtuple('RuleVariant', ['name', 'description', 'rule'])
+
+# Shells of one variant up to the limit; shells are Shell._asdict() rows
+VariantResult = namedtuple('VariantResult', ['name', 'key', 'shells', 'seconds', 'cached'])
+
+# One row of the comparison: predictions maps variant → Δn of the shell
+# closing at `magic`, agree counts the voters (variants that reproduce
+# KNOWN_MAGIC_NUMBERS) that predict it
+ComparisonRow = namedtuple('ComparisonRow', ['magic', 'predictions', 'agree', 'voters'])
+
+# =============================================================================
+# VARIANTS
+# =============================================================================
+
+
+def oscillator_rule(index):
+    """Harmonic oscillator without spin-orbit: every shell is c_start = 2k, ..., 2."""
+    return 2 * index, 2 * index + 2
+
+
+def continued_rule(index, offset, intruder_step=0, from_shell=FIRST_EXTRAPOLATED_SHELL):
+    """
+    published_rule up to `from_shell`, then c_high_j = 2k + 2 + intruder_step
+    and c_start = c_high_j - offset.
+    """
+    if index < from_shell:
+        return published_rule(index)
+    c_high_j = 2 * index + 2 + intruder_step
+    return c_high_j - offset, c_high_j
+
+
+VARIANTS = (
+    RuleVariant('published', "article rule, c_start = c_high_j - 4", published_rule),
+    RuleVariant('orbital', "spin-orbit level tables", orbital_rule),
+    RuleVariant('oscillator', "no spin-orbit, (2k, 2k + 2)", oscillator_rule),
+    RuleVariant('strong_so', "beyond 126: c_start = c_high_j - 6",
+                functools.partial(continued_rule, offset=6)),
+    RuleVariant('weak_so', "beyond 126: c_start = c_high_j - 2",
+                functools.partial(continued_rule, offset=2)),
+    RuleVariant('high_intruder', "beyond 126: c_high_j = 2k + 4",
+                functools.partial(continued_rule, offset=4, intruder_step=2)),
+)
+VARIANTS_BY_NAME = {variant.name: variant for variant in VARIANTS}
+
+# =============================================================================
+# COMPUTATION AND CACHE
+# =============================================================================
+
+
+def _rule_sources(func):
+    """
+    Source files a rule depends on: its whole module when it is defined
+    elsewhere; otherwise its own source plus the modules of the functions it
+    calls, so that adding a variant here does not invalidate the others.
+    """
+    path = inspect.getsourcefile(func)
+    if os.path.abspath(path) != os.path.abspath(__file__):
+        with open(path, encoding='utf-8') as f:
+            return [f.read()]
+    sources = [inspect.getsource(func)]
+    for name in func.__code__.co_names:
+        called = func.__globals__.get(name)
+        if inspect.isfunction(called) and called.__module__ != func.__module__:
+            sources += _rule_sources(called)
+    return sources
+
+
+def variant_key(variant):
+    """Cache key of a variant: name, rule parameters and rule sources."""
+    rule = variant.rule
+    func = rule.func if isinstance(rule, functools.partial) else rule
+    params = (sorted(rule.keywords.items()), list(rule.args)) \
+        if isinstance(rule, functools.partial) else None
+    digest = hashlib.sha256()
+    digest.update(json.dumps([variant.name, func.__qualname__, params]).encode())
+    for source in _rule_sources(func):
+        digest.update(source.encode())
+    return digest.hexdigest()[:16]
+
+
+def run_variant(variant, limit):
+    """All shells of `variant` whose closure is ≤ limit (plus the one crossing it)."""
+    start = time.perf_counter()
+    shells = []
+    for shell in MagicSequence(rule=variant.rule).iter_shells():
+        shells.append(dict(shell._asdict()))
+        if shell.M_next > limit:
+            break
+    return shells, time.perf_counter() - start
+
+
+def _up_to(shells, limit):
+    """Leading shells up to the first closure beyond `limit`."""
+    for i, shell in enumerate(shells):
+        if shell['M_next'] > limit:
+            return shells[:i + 1]
+    return shells
+
+
+def _cache_path(cache_dir, name, key):
+    return os.path.join(cache_dir, f"{name}-{key}.json")
+
+
+def _read_cache(path):
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_cache(path, data):
+    """Write one variant's entry and drop its entries under older keys."""
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    tmp = path + '.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=1)
+    os.replace(tmp, path)
+    prefix = data['variant'] + '-'
+    for name in os.listdir(directory):
+        stale = os.path.join(directory, name)
+        if (name.startswith(prefix) and name.endswith('.json') and stale != path
+                and len(name) == len(os.path.basename(path))):
+            os.remove(stale)
+
+
+def _run_named(name, limit):
+    """run_variant by name, for worker processes."""
+    return run_variant(VARIANTS_BY_NAME[name], limit)
+
+
+def extrapolate(variants=VARIANTS, limit=DEFAULT_LIMIT, cache_dir=DEFAULT_CACHE_DIR,
+                workers=None):
+    """
+    Shells of every variant up to `limit`, computing only those not cached.
+
+    Parameters:
+    -----------
+    variants : sequence of RuleVariant
+        Variants outside VARIANTS are run in-process.
+    limit : int
+        Largest magic number of interest.
+    cache_dir : str or None
+        Directory of the per-variant JSON cache (None disables it).
+    workers : int or None
+        Process pool size for the variants to compute (1 = in-process).
+
+    Returns:
+    --------
+    list of VariantResult, in the order of `variants`
+    """
+    results = {}
+    missing = []
+    keys = {variant.name: variant_key(variant) for variant in variants}
+    for variant in variants:
+        key = keys[variant.name]
+        data = _read_cache(_cache_path(cache_dir, variant.name, key)) if cache_dir else None
+        if data is not None and data.get('key') == key and data['limit'] >= limit:
+            results[variant.name] = VariantResult(variant.name, key,
+                                                  _up_to(data['shells'], limit),
+                                                  data['seconds'], True)
+        else:
+            missing.append(variant)
+
+    pooled = [v for v in missing if VARIANTS_BY_NAME.get(v.name) is v]
+    local = [v for v in missing if v not in pooled]
+    computed = [(v, run_variant(v, limit)) for v in local]
+    if pooled and (workers == 1 or len(pooled) == 1):
+        computed += [(v, run_variant(v, limit)) for v in pooled]
+    elif pooled:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [(v, pool.submit(_run_named, v.name, limit)) for v in pooled]
+            computed += [(v, future.result()) for v, future in futures]
+
+    for variant, (shells, seconds) in computed:
+        key = keys[variant.name]
+        if cache_dir:
+            _write_cache(_cache_path(cache_dir, variant.name, key),
+                         {'key': key, 'variant': variant.name, 'limit': limit,
+                          'shells': shells, 'seconds': seconds})
+        results[variant.name] = VariantResult(variant.name, key, shells, seconds, False)
+    return [results[variant.name] for variant in variants]
+
+# =============================================================================
+# COMPARISON
+# =============================================================================
+
+
+def reproduces_known(result):
+    """True if the variant's first closures are exactly KNOWN_MAGIC_NUMBERS."""
+    closures = tuple(shell['M_next'] for shell in result.shells[:len(KNOWN_MAGIC_NUMBERS)])
+    return closures == KNOWN_MAGIC_NUMBERS
+
+
+def compare_variants(results, limit=DEFAULT_LIMIT, start=LAST_KNOWN):
+    """
+    One row per magic number in [start, limit] predicted by any variant.
+
+    Agreement is counted only over the variants that reproduce
+    KNOWN_MAGIC_NUMBERS; the others still appear in `predictions`.
+
+    Returns:
+    --------
+    list of ComparisonRow, by magic number
+    """
+    voters = {result.name for result in results if reproduces_known(result)}
+    closures = {}
+    for result in results:
+        for shell in result.shells:
+            if start <= shell['M_next'] <= limit:
+                closures.setdefault(shell['M_next'], {})[result.name] = shell['delta_n']
+    return [ComparisonRow(magic, predictions, len(voters & predictions.keys()), len(voters))
+            for magic, predictions in sorted(closures.items())]
+
+
+def main(argv=None):
+    """Run the variants and print the comparison table."""
+    parser = argparse.ArgumentParser(
+        description="Compare continuations of the (c_start, c_high_j) rule beyond 126.")
+    parser.add_argument('--limit', type=int, default=DEFAULT_LIMIT,
+                        help="largest magic number (default: %(default)s)")
+    parser.add_argument('--variants', nargs='+', choices=list(VARIANTS_BY_NAME),
+                        metavar='VARIANT',
+                        help=f"variants to run: {', '.join(VARIANTS_BY_NAME)} (default: all)")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="process pool size (default: all CPUs)")
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR,
+                        help="per-variant result cache (default: build/extrapolation)")
+    parser.add_argument('--no-cache', action='store_true', help="recompute every variant")
+    args = parser.parse_args(argv)
+
+    variants = [VARIANTS_BY_NAME[name] for name in args.variants] if args.variants \
+        else list(VARIANTS)
+    start = time.perf_counter()
+    results = extrapolate(variants, args.limit, None if args.no_cache else args.cache_dir,
+                          args.workers)
+    rows = compare_variants(results, args.limit)
+    elapsed = time.perf_counter() - start
+
+    names = [variant.name for variant in variants]
+    voters = {result.name for result in results if reproduces_known(result)}
+    width = max(9, *(len(name) for name in names))
+    print("\n" + "="*(14 + (width + 3) * len(names)))
+    print(f"EXTRAPOLATION BEYOND {LAST_KNOWN}: magic numbers (Δn of the closing shell)")
+    print("="*(14 + (width + 3) * len(names)))
+    for variant in variants:
+        note = "" if variant.name in voters else f"  (misses {LAST_KNOWN} or below, not counted)"
+        print(f"  {variant.name:<{width}} {variant.description}{note}")
+    print(f"\n{'Magic':>6} | " + " | ".join(f"{name:>{width}}" for name in names)
+          + " | Agree")
+    print("-"*(14 + (width + 3) * len(names)))
+    for row in rows:
+        cells = [f"{row.predictions[name]:>{width}}" if name in row.predictions
+                 else f"{'·':>{width}}" for name in names]
+        mark = " ✓" if row.voters and row.agree == row.voters else ""
+        print(f"{row.magic:6} | " + " | ".join(cells) + f" | {row.agree}/{row.voters}{mark}")
+    print("-"*(14 + (width + 3) * len(names)))
+    for result in results:
+        state = "cached" if result.cached else f"computed in {result.seconds * 1000:.1f} ms"
+        print(f"  {result.name:<{width}} {len(result.shells):3} shells, {state}")
+    print(f"Total: {elapsed:.2f} s")
+    print("="*(14 + (width + 3) * len(names)) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
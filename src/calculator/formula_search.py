@@ -0,0 +1,439 @@
+#!/usr/bin/env python3
+"""
+Formula Search: how special is Δn = c_start(c_start + 2)/4?
+============================================================
+
+Enumerates small integer expression trees over the shell features
+c_start, c_high_j, l (of the high-j orbital, c_high_j = 2l + 2) and the
+shell index k, with the constants 1-4 and +, -, ×, // (floor division by a
+positive divisor), and keeps every formula that reproduces the number of
+nucleons below the high-j orbital, M_next - M_n - c_high_j, on every shell
+of the chain.
+
+The search is bottom-up by tree size (number of nodes):
+
+- every tree is evaluated as one int64 vector over the chain shells plus a
+  few random probe shells, all pairs of smaller trees at once with NumPy
+  broadcasting;
+- trees with the same vector are the same formula for the search; they are
+  deduplicated by a 64-bit hash of the vector, so only the first (smallest)
+  tree of each class is kept. The probe shells keep formulas that merely
+  agree on the chain apart;
+- trees are pruned when a value leaves ±MAX_ABS_VALUE or a divisor is not
+  positive, + and × are only built in one operand order, and at the largest
+  size only trees that fit the chain are kept;
+- each size level is split into chunks that fan out over a process pool.
+
+Author: André Luís Tomaz Dionísio
+Institution: EPHEC Brussels, Belgium
+Date: December 2025
+
+Usage:
+    python formula_search.py                            # published chain, up to 7 nodes
+    python formula_search.py --max-size 9 --workers 4
+    python formula_search.py --source orbital --shells 40
+"""
+
+import argparse
+import os
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from magic_number_calculator import calculate_delta_n
+from magic_sequence import KNOWN_MAGIC_NUMBERS, published_rule
+from orbital_filling import shell_parameters
+
+FEATURES = ('c_start', 'c_high_j', 'l', 'k')
+CONSTANTS = (1, 2, 3, 4)
+OPERATORS = ('+', '-', '*', '//')
+COMMUTATIVE = {'+', '*'}
+
+DEFAULT_MAX_SIZE = 7
+DEFAULT_ORBITAL_SHELLS = 40
+PROBE_SHELLS = 8
+MAX_ABS_VALUE = 10**6
+
+# Upper bound on the (left, right) pairs evaluated by one task
+CHUNK_PAIRS = 200_000
+
+# Leaves have no operator; their children point nowhere
+LEAF = -1
+
+# The chain the formulas are fitted to: one row per shell
+ChainData = namedtuple('ChainData', ['source', 'features', 'target'])
+
+# One surviving formula (an equivalence class, represented by its smallest tree)
+Formula = namedtuple('Formula', ['expression', 'size', 'depth', 'features'])
+
+FormulaSearchResult = namedtuple('FormulaSearchResult',
+                                 ['solutions', 'candidates', 'distinct', 'levels',
+                                  'reference', 'seconds'])
+
+# =============================================================================
+# DATA
+# =============================================================================
+
+
+def chain_data(source='published', shells=None):
+    """
+    Features and target of the first `shells` shells of a chain.
+
+    source='published' uses published_rule and the known magic numbers (at
+    most len(KNOWN_MAGIC_NUMBERS) shells); source='orbital' reads both the
+    parameters and the target off the spin-orbit level tables.
+    """
+    if shells is not None and shells < 1:
+        raise ValueError(f"at least one shell is needed, {shells} requested")
+    if source == 'published':
+        shells = len(KNOWN_MAGIC_NUMBERS) if shells is None else shells
+        if shells > len(KNOWN_MAGIC_NUMBERS):
+            raise ValueError(f"the published chain has {len(KNOWN_MAGIC_NUMBERS)} "
+                             f"known shells, {shells} requested")
+        c_start, c_high_j = np.array([published_rule(k) for k in range(shells)]).T
+        magic = np.array((0,) + KNOWN_MAGIC_NUMBERS[:shells])
+        target = np.diff(magic) - c_high_j
+    elif source == 'orbital':
+        shells = DEFAULT_ORBITAL_SHELLS if shells is None else shells
+        params = [shell_parameters(k) for k in range(shells)]
+        c_start = np.array([p.c_start for p in params])
+        c_high_j = np.array([p.c_high_j for p in params])
+        target = np.array([p.capacity for p in params]) - c_high_j
+    else:
+        raise ValueError(f"unknown source: {source} (published or orbital)")
+
+    features = {'c_start': c_start, 'c_high_j': c_high_j,
+                'l': c_high_j // 2 - 1, 'k': np.arange(shells)}
+    return ChainData(source, {name: np.asarray(v, dtype=np.int64)
+                              for name, v in features.items()},
+                     np.asarray(target, dtype=np.int64))
+
+
+def probe_features(count=PROBE_SHELLS, seed=0):
+    """Random shells (even capacities, l = c_high_j/2 - 1) that separate formulas."""
+    rng = np.random.default_rng(seed)
+    c_high_j = 2 * rng.integers(1, 21, count)
+    return {'c_start': 2 * rng.integers(0, 21, count), 'c_high_j': c_high_j,
+            'l': c_high_j // 2 - 1, 'k': rng.integers(0, 41, count)}
+
+
+def _hash_weights(columns, seed=1):
+    rng = np.random.default_rng(seed)
+    return rng.integers(0, 2**63, columns, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+
+
+def hash_rows(values, weights):
+    """64-bit hash of each row of an int64 array (wraps modulo 2**64)."""
+    return (values.view(np.uint64) * weights).sum(axis=-1, dtype=np.uint64)
+
+# =============================================================================
+# EXPRESSION BANK
+# =============================================================================
+
+
+class ExpressionBank:
+    """
+    Distinct trees found so far, grouped by size.
+
+    Per size: values (n, columns), hashes, operator codes, global ids of the
+    children, depth and a bitmask of the features used. Global ids run over
+    the sizes in the order they were added.
+    """
+
+    def __init__(self, columns):
+        self.values = {}
+        self.hashes = {}
+        self.ops = {}
+        self.left = {}
+        self.right = {}
+        self.depth = {}
+        self.mask = {}
+        self.offset = {}
+        self.names = []
+        self.total = 0
+        self.columns = columns
+
+    def add(self, size, values, hashes, ops, left, right, depth, mask):
+        self.values[size] = values
+        self.hashes[size] = hashes
+        self.ops[size] = ops
+        self.left[size] = left
+        self.right[size] = right
+        self.depth[size] = depth
+        self.mask[size] = mask
+        self.offset[size] = self.total
+        self.total += len(values)
+
+    def locate(self, gid):
+        """(size, local index) of a global id."""
+        for size in sorted(self.offset, reverse=True):
+            if gid >= self.offset[size]:
+                return size, gid - self.offset[size]
+        raise IndexError(gid)
+
+    def expression(self, gid, top=True):
+        """Infix text of a tree, parenthesizing every non-leaf subtree."""
+        size, i = self.locate(gid)
+        op = int(self.ops[size][i])
+        if op == LEAF:
+            return self.names[i]
+        text = (f"{self.expression(int(self.left[size][i]), False)} "
+                f"{OPERATORS[op]} {self.expression(int(self.right[size][i]), False)}")
+        return text if top else f"({text})"
+
+    def formula(self, size, i):
+        mask = int(self.mask[size][i])
+        used = tuple(name for bit, name in enumerate(FEATURES) if mask & (1 << bit))
+        return Formula(self.expression(self.offset[size] + i), size,
+                       int(self.depth[size][i]), used)
+
+
+def _leaves(columns):
+    """Values, names and feature masks of the leaf trees."""
+    values, names, masks = [], [], []
+    for bit, name in enumerate(FEATURES):
+        values.append(columns[name])
+        names.append(name)
+        masks.append(1 << bit)
+    for constant in CONSTANTS:
+        values.append(np.full(len(columns['k']), constant, dtype=np.int64))
+        names.append(str(constant))
+        masks.append(0)
+    return np.array(values, dtype=np.int64), names, np.array(masks)
+
+# =============================================================================
+# SEARCH
+# =============================================================================
+
+# Bank and fit data of the current level, set in each worker by _init_worker
+_STATE = None
+
+
+def _init_worker(state):
+    global _STATE
+    _STATE = state
+
+
+def _combine(task):
+    """
+    Evaluate op(left, right) for a block of left trees against all right trees.
+
+    Returns (values, hashes, left ids, right ids, evaluated) of the valid,
+    locally distinct results; with fits_only, only those that fit the target.
+    """
+    op, size_a, size_b, start, stop, fits_only = task
+    values, offsets, target, weights = _STATE
+    A = values[size_a][start:stop]
+    B = values[size_b]
+    symbol = OPERATORS[op]
+
+    pairs = np.ones((len(A), len(B)), dtype=bool)
+    if symbol in COMMUTATIVE and size_a == size_b:
+        pairs &= np.arange(start, stop)[:, None] <= np.arange(len(B))[None, :]
+    evaluated = int(pairs.sum())
+
+    left, right = A[:, None, :], B[None, :, :]
+    if symbol == '+':
+        out = left + right
+    elif symbol == '-':
+        out = left - right
+    elif symbol == '*':
+        out = left * right
+    else:
+        positive = np.all(B > 0, axis=1)
+        pairs &= positive[None, :]
+        out = left // np.where(right > 0, right, 1)
+    pairs &= np.all(np.abs(out) <= MAX_ABS_VALUE, axis=2)
+    if fits_only:
+        pairs &= np.all(out[:, :, :len(target)] == target, axis=2)
+
+    i, j = np.nonzero(pairs)
+    out = out[i, j]
+    hashes = hash_rows(out, weights)
+    hashes, first = np.unique(hashes, return_index=True)
+    return (out[first], hashes, offsets[size_a] + start + i[first],
+            offsets[size_b] + j[first], evaluated)
+
+
+def _level_tasks(bank, size, fits_only):
+    """(op, size_a, size_b, start, stop, fits_only) blocks building trees of `size`."""
+    tasks = []
+    for size_a in range(1, size - 1, 2):
+        size_b = size - 1 - size_a
+        if size_a not in bank.values or size_b not in bank.values:
+            continue
+        n_a, n_b = len(bank.values[size_a]), len(bank.values[size_b])
+        if not n_a or not n_b:
+            continue
+        step = max(1, CHUNK_PAIRS // n_b)
+        for op, symbol in enumerate(OPERATORS):
+            if symbol in COMMUTATIVE and size_a > size_b:
+                continue
+            tasks.extend((op, size_a, size_b, start, min(start + step, n_a), fits_only)
+                         for start in range(0, n_a, step))
+    return tasks
+
+
+def search_formulas(data=None, max_size=DEFAULT_MAX_SIZE, workers=None,
+                    probes=PROBE_SHELLS):
+    """
+    Every distinct formula of at most `max_size` nodes that fits the chain.
+
+    Parameters:
+    -----------
+    data : ChainData or None
+        Chain to fit (default: chain_data()).
+    max_size : int
+        Largest tree, in nodes (leaves + operators).
+    workers : int or None
+        Process pool size per level (None = os.cpu_count(), 1 = in-process).
+    probes : int
+        Random probe shells used to tell formulas apart.
+
+    Returns:
+    --------
+    FormulaSearchResult: solutions ranked by size, depth, number of features
+    and text; candidates = trees evaluated, distinct = equivalence classes
+    kept; levels = (size, candidates, distinct) per size; reference = the
+    solution equivalent to calculate_delta_n, or None.
+    """
+    start_time = time.perf_counter()
+    data = data if data is not None else chain_data()
+    workers = os.cpu_count() if workers is None else workers
+    probe = probe_features(probes)
+    columns = {name: np.concatenate([data.features[name], probe[name]])
+               for name in FEATURES}
+    weights = _hash_weights(len(columns['k']))
+
+    bank = ExpressionBank(len(columns['k']))
+    leaf_values, bank.names, leaf_masks = _leaves(columns)
+    leaf_hashes = hash_rows(leaf_values, weights)
+    _, first = np.unique(leaf_hashes, return_index=True)
+    first.sort()
+    bank.names = [bank.names[i] for i in first]
+    none = np.full(len(first), LEAF)
+    bank.add(1, leaf_values[first], leaf_hashes[first], none, none, none,
+             np.ones(len(first), dtype=np.int64), leaf_masks[first])
+    seen = np.sort(leaf_hashes[first])
+
+    candidates = len(leaf_values)
+    levels = [(1, candidates, len(first))]
+    for size in range(3, max_size + 1, 2):
+        fits_only = size + 2 > max_size
+        tasks = _level_tasks(bank, size, fits_only)
+        state = (bank.values, bank.offset, data.target, weights)
+        if workers <= 1 or len(tasks) <= 1:
+            _init_worker(state)
+            results = [_combine(task) for task in tasks]
+        else:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                     initargs=(state,)) as pool:
+                results = list(pool.map(_combine, tasks))
+
+        evaluated = sum(r[4] for r in results)
+        candidates += evaluated
+        if results:
+            values = np.concatenate([r[0] for r in results])
+            hashes = np.concatenate([r[1] for r in results])
+            left = np.concatenate([r[2] for r in results])
+            right = np.concatenate([r[3] for r in results])
+            ops = np.concatenate([np.full(len(r[0]), task[0])
+                                  for r, task in zip(results, tasks)])
+        else:
+            values = np.empty((0, bank.columns), dtype=np.int64)
+            hashes = left = right = ops = np.empty(0, dtype=np.int64)
+
+        # Global dedupe: drop classes already in the bank, then repeats within the level
+        new = ~np.isin(hashes, seen)
+        _, first = np.unique(hashes[new], return_index=True)
+        keep = np.flatnonzero(new)[np.sort(first)]
+        left, right = left[keep], right[keep]
+        depth = 1 + np.maximum(_gather(bank, bank.depth, left),
+                               _gather(bank, bank.depth, right))
+        mask = _gather(bank, bank.mask, left) | _gather(bank, bank.mask, right)
+        bank.add(size, values[keep], hashes[keep], ops[keep], left, right, depth, mask)
+        seen = np.union1d(seen, hashes[keep])
+        levels.append((size, evaluated, len(keep)))
+
+    solutions = []
+    reference = None
+    n = len(data.target)
+    reference_hash = hash_rows(calculate_delta_n(columns['c_start'])[None, :], weights)[0]
+    for size in sorted(bank.values):
+        fits = np.flatnonzero(np.all(bank.values[size][:, :n] == data.target, axis=1))
+        for i in fits:
+            formula = bank.formula(size, i)
+            solutions.append(formula)
+            if bank.hashes[size][i] == reference_hash:
+                reference = formula
+    solutions.sort(key=lambda f: (f.size, f.depth, len(f.features), f.expression))
+    return FormulaSearchResult(solutions, candidates, bank.total, levels, reference,
+                               time.perf_counter() - start_time)
+
+
+def _gather(bank, field, gids):
+    """field[size][local] for an array of global ids."""
+    result = np.zeros(len(gids), dtype=np.int64)
+    for size, offset in bank.offset.items():
+        inside = (gids >= offset) & (gids < offset + len(bank.values[size]))
+        result[inside] = field[size][gids[inside] - offset]
+    return result
+
+
+def main(argv=None):
+    """Run the search and print the ranked formulas."""
+    parser = argparse.ArgumentParser(
+        description="Search integer formulas reproducing Δn along the magic chain.")
+    parser.add_argument('--source', choices=('published', 'orbital'), default='published',
+                        help="chain to fit (default: %(default)s)")
+    parser.add_argument('--shells', type=int, default=None,
+                        help="shells of the chain to fit (default: all known / "
+                             f"{DEFAULT_ORBITAL_SHELLS} for orbital)")
+    parser.add_argument('--max-size', type=int, default=DEFAULT_MAX_SIZE,
+                        help="largest expression, in nodes (default: %(default)s)")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="process pool size (default: all CPUs)")
+    parser.add_argument('--show', type=int, default=15,
+                        help="ranked formulas to print (default: %(default)s)")
+    args = parser.parse_args(argv)
+    try:
+        data = chain_data(args.source, args.shells)
+    except ValueError as e:
+        parser.error(str(e))
+
+    result = search_formulas(data, args.max_size, args.workers)
+
+    print("\n" + "="*70)
+    print(f"FORMULA SEARCH: {args.source} chain, {len(data.target)} shells, "
+          f"up to {args.max_size} nodes")
+    print("="*70)
+    print(f"\nTarget (M_next - M_n - c_high_j): {data.target.tolist()}")
+    print(f"\n{'Size':>4} | {'Candidates':>12} | {'Distinct':>10}")
+    print("-"*34)
+    for size, evaluated, distinct in result.levels:
+        print(f"{size:4} | {evaluated:12,} | {distinct:10,}")
+    print("-"*34)
+    print(f"Candidates evaluated: {result.candidates:,}")
+    print(f"Distinct formulas:    {result.distinct:,}")
+    print(f"Elapsed:              {result.seconds:.2f} s "
+          f"({result.candidates / result.seconds:,.0f} candidates/s, "
+          f"{os.cpu_count()} CPUs)")
+
+    print(f"\nFormulas fitting every shell: {len(result.solutions)}")
+    for rank, formula in enumerate(result.solutions[:args.show], 1):
+        marker = '  ← calculate_delta_n' if formula == result.reference else ''
+        print(f"  {rank:3}. [{formula.size} nodes, depth {formula.depth}] "
+              f"{formula.expression}{marker}")
+    if result.reference is None:
+        print("\ncalculate_delta_n is not within the searched size")
+    else:
+        rank = result.solutions.index(result.reference) + 1
+        print(f"\ncalculate_delta_n ranks {rank} of {len(result.solutions)}")
+    print("="*70 + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,382 @@
+#!/usr/bin/env python3
+"""
+Instrumentation: opt-in timing spans, counters and profiling hooks
+==================================================================
+
+The calculator and the figure generators mark their stages with named spans
+and counters:
+
+    from instrumentation import span, count, traced
+
+    with span('figure1.polyfit', points=9):
+        z = np.polyfit(x, y, 1)
+    count('figure3.rectangles', len(sequence))
+
+Nothing is recorded until a Recorder is enabled. While disabled, span()
+returns a shared no-op context manager and count() returns immediately, so
+the stages cost one global lookup each.
+
+    recorder = enable(memory=True, profile=True)
+    ...                                  # run the code of interest
+    disable()
+    recorder.write('trace.json')                  # Chrome trace (chrome://tracing,
+    recorder.write('spans.json', format='json')   #  ui.perfetto.dev) or plain JSON
+    recorder.dump_profile('run.prof')             # cProfile stats (snakeviz, pstats)
+
+memory=True adds the tracemalloc peak (bytes above the allocation level at
+entry) of every span; profile=True runs cProfile for the whole recording.
+Both slow the measured code down, so compare span times only between runs
+of the same mode.
+
+Author: André Luís Tomaz Dionísio
+Institution: EPHEC Brussels, Belgium
+Date: December 2025
+
+Usage (on the command line):
+    python magic_numbers.py --trace trace.json figures figure3 --headless
+    python generate_figures.py --trace spans.json --trace-format json --trace-memory
+"""
+
+import os
+import time
+from functools import wraps
+
+TRACE_FORMATS = ('chrome', 'json')
+
+_recorder = None
+
+# =============================================================================
+# RECORDER
+# =============================================================================
+
+
+class SpanRecord:
+    """One finished span; times in nanoseconds of time.perf_counter_ns()."""
+
+    __slots__ = ('name', 'start_ns', 'end_ns', 'depth', 'pid', 'tid', 'args',
+                 'peak_bytes')
+
+    def __init__(self, name, start_ns, end_ns, depth, pid, tid, args, peak_bytes=None):
+        self.name = name
+        self.start_ns = start_ns
+        self.end_ns = end_ns
+        self.depth = depth
+        self.pid = pid
+        self.tid = tid
+        self.args = args
+        self.peak_bytes = peak_bytes
+
+    @property
+    def seconds(self):
+        return (self.end_ns - self.start_ns) / 1e9
+
+    def to_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class _NullSpan:
+    """Shared no-op context manager returned by span() while disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return None
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    """Active span of an enabled Recorder (see span())."""
+
+    __slots__ = ('recorder', 'name', 'args', 'start_ns', 'depth', 'base_bytes', 'peak')
+
+    def __init__(self, recorder, name, args):
+        self.recorder = recorder
+        self.name = name
+        self.args = args
+
+    def __enter__(self):
+        stack = self.recorder._stack()
+        self.depth = len(stack)
+        if self.recorder.memory:
+            self.base_bytes = self.recorder._memory_enter(stack)
+            self.peak = 0
+        stack.append(self)
+        self.start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        end_ns = time.perf_counter_ns()
+        stack = self.recorder._stack()
+        stack.pop()
+        peak_bytes = self.recorder._memory_exit(self, stack) if self.recorder.memory else None
+        self.recorder.spans.append(SpanRecord(
+            self.name, self.start_ns, end_ns, self.depth, os.getpid(),
+            self.recorder._get_ident(), self.args, peak_bytes))
+        return False
+
+
+class Recorder:
+    """
+    Collects spans and counters while enabled.
+
+    Parameters:
+    -----------
+    memory : bool
+        Record the tracemalloc peak of every span.
+    profile : bool
+        Run cProfile while the recorder is enabled.
+    """
+
+    def __init__(self, memory=False, profile=False):
+        import threading
+        self.memory = memory
+        self.profile = None
+        self.spans = []
+        self.counters = {}
+        self._local = threading.local()
+        self._get_ident = threading.get_ident
+        self._started_tracemalloc = False
+        if profile:
+            import cProfile
+            self.profile = cProfile.Profile()
+
+    # -- lifecycle -------------------------------------------------------
+
+    def start(self):
+        if self.memory:
+            import tracemalloc
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracemalloc = True
+        if self.profile is not None:
+            self.profile.enable()
+
+    def stop(self):
+        if self.profile is not None:
+            self.profile.disable()
+        if self._started_tracemalloc:
+            import tracemalloc
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    # -- recording -------------------------------------------------------
+
+    def _stack(self):
+        try:
+            return self._local.stack
+        except AttributeError:
+            self._local.stack = []
+            return self._local.stack
+
+    @staticmethod
+    def _memory_enter(stack):
+        # Nested spans reset the tracemalloc peak; fold the peak seen so far
+        # into the enclosing span first
+        import tracemalloc
+        current, peak = tracemalloc.get_traced_memory()
+        if stack:
+            stack[-1].peak = max(stack[-1].peak, peak)
+        tracemalloc.reset_peak()
+        return current
+
+    @staticmethod
+    def _memory_exit(active, stack):
+        import tracemalloc
+        peak = max(active.peak, tracemalloc.get_traced_memory()[1])
+        if stack:
+            stack[-1].peak = max(stack[-1].peak, peak)
+        return peak - active.base_bytes
+
+    def count(self, name, value=1):
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    def merge(self, state):
+        """Add spans and counters exported by another process (see state())."""
+        self.spans.extend(SpanRecord(**record) for record in state['spans'])
+        for name, value in state['counters'].items():
+            self.count(name, value)
+
+    def state(self):
+        """Picklable spans and counters, e.g. to return them from a worker."""
+        return {'spans': [record.to_dict() for record in self.spans],
+                'counters': dict(self.counters)}
+
+    # -- reporting -------------------------------------------------------
+
+    def summary(self):
+        """{span name: {'count', 'total_s', 'mean_s', 'max_s'[, 'max_peak_bytes']}}."""
+        summary = {}
+        for record in self.spans:
+            entry = summary.setdefault(record.name, {'count': 0, 'total_s': 0.0, 'max_s': 0.0})
+            entry['count'] += 1
+            entry['total_s'] += record.seconds
+            entry['max_s'] = max(entry['max_s'], record.seconds)
+            if record.peak_bytes is not None:
+                entry['max_peak_bytes'] = max(entry.get('max_peak_bytes', 0),
+                                              record.peak_bytes)
+        for entry in summary.values():
+            entry['mean_s'] = entry['total_s'] / entry['count']
+        return summary
+
+    def to_dict(self):
+        """Plain JSON document: spans (start order), counters and summary."""
+        spans = sorted(self.spans, key=lambda record: record.start_ns)
+        origin = spans[0].start_ns if spans else 0
+        return {
+            'spans': [dict(record.to_dict(), start_s=(record.start_ns - origin) / 1e9,
+                           seconds=record.seconds) for record in spans],
+            'counters': dict(self.counters),
+            'summary': self.summary(),
+        }
+
+    def chrome_trace(self):
+        """Trace Event Format document (complete events plus final counters)."""
+        spans = sorted(self.spans, key=lambda record: record.start_ns)
+        origin = spans[0].start_ns if spans else 0
+        events = []
+        for record in spans:
+            args = dict(record.args)
+            if record.peak_bytes is not None:
+                args['peak_bytes'] = record.peak_bytes
+            events.append({'name': record.name, 'cat': record.name.split('.')[0],
+                           'ph': 'X', 'ts': (record.start_ns - origin) / 1e3,
+                           'dur': (record.end_ns - record.start_ns) / 1e3,
+                           'pid': record.pid, 'tid': record.tid, 'args': args})
+        end = max((record.end_ns for record in spans), default=origin)
+        for name, value in sorted(self.counters.items()):
+            events.append({'name': name, 'ph': 'C', 'ts': (end - origin) / 1e3,
+                           'pid': os.getpid(), 'args': {name: value}})
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def write(self, path, format='chrome'):
+        """Write the spans as a Chrome trace ('chrome') or plain JSON ('json')."""
+        import json
+        if format not in TRACE_FORMATS:
+            raise ValueError(f"Unknown trace format: {format}")
+        document = self.chrome_trace() if format == 'chrome' else self.to_dict()
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(document, f, indent=1)
+        return path
+
+    def dump_profile(self, path):
+        """Write the cProfile statistics (pstats format); None without profile."""
+        if self.profile is None:
+            return None
+        self.profile.dump_stats(path)
+        return path
+
+    def format_summary(self, limit=None):
+        """Console table of the spans by total time."""
+        rows = sorted(self.summary().items(), key=lambda item: -item[1]['total_s'])
+        lines = [f"{'Span':<28} | {'Count':>6} | {'Total ms':>10} | {'Mean ms':>9} | "
+                 f"{'Max ms':>9}" + (" | Peak MiB" if self.memory else "")]
+        lines.append("-" * len(lines[0]))
+        for name, entry in rows[:limit]:
+            line = (f"{name:<28} | {entry['count']:6} | {entry['total_s'] * 1e3:10.2f} | "
+                    f"{entry['mean_s'] * 1e3:9.3f} | {entry['max_s'] * 1e3:9.2f}")
+            if 'max_peak_bytes' in entry:
+                line += f" | {entry['max_peak_bytes'] / 2**20:8.2f}"
+            lines.append(line)
+        for name, value in sorted(self.counters.items()):
+            lines.append(f"counter {name}: {value:,}")
+        return "\n".join(lines)
+
+# =============================================================================
+# MODULE-LEVEL API
+# =============================================================================
+
+
+def enabled():
+    return _recorder is not None
+
+
+def current():
+    """The enabled Recorder, or None."""
+    return _recorder
+
+
+def enable(memory=False, profile=False):
+    """Start recording spans and counters; returns the new Recorder."""
+    global _recorder
+    if _recorder is not None:
+        raise RuntimeError("instrumentation is already enabled")
+    recorder = Recorder(memory=memory, profile=profile)
+    recorder.start()
+    _recorder = recorder
+    return recorder
+
+
+def disable():
+    """Stop recording; returns the Recorder that was active (or None)."""
+    global _recorder
+    recorder, _recorder = _recorder, None
+    if recorder is not None:
+        recorder.stop()
+    return recorder
+
+
+def span(name, **args):
+    """Context manager timing one stage; a no-op while disabled."""
+    if _recorder is None:
+        return _NULL_SPAN
+    return _Span(_recorder, name, args)
+
+
+def count(name, value=1):
+    """Add `value` to a counter; a no-op while disabled."""
+    if _recorder is not None:
+        _recorder.count(name, value)
+
+
+def traced(name=None):
+    """Decorator wrapping every call of a function in span(name)."""
+    def decorate(func):
+        label = name or func.__qualname__
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if _recorder is None:
+                return func(*args, **kwargs)
+            with _Span(_recorder, label, {}):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def add_arguments(parser):
+    """Add the --trace options of an entry point to an argparse parser."""
+    group = parser.add_argument_group('instrumentation')
+    group.add_argument('--trace', metavar='FILE', default=None,
+                       help="record timing spans and write them to FILE")
+    group.add_argument('--trace-format', choices=TRACE_FORMATS, default='chrome',
+                       help="chrome (Trace Event Format) or json (default: %(default)s)")
+    group.add_argument('--trace-memory', action='store_true',
+                       help="add the tracemalloc peak of every span")
+    group.add_argument('--profile', metavar='FILE', default=None,
+                       help="also run cProfile and write its stats to FILE")
+
+
+def start_from_args(args):
+    """Enable a Recorder when --trace or --profile was given (and none is active)."""
+    if (args.trace or args.profile) and not enabled():
+        return enable(memory=args.trace_memory, profile=bool(args.profile))
+    return None
+
+
+def finish_from_args(args, recorder, stream=None):
+    """Stop the Recorder returned by start_from_args and write its outputs."""
+    import sys
+    if recorder is None:
+        return
+    disable()
+    stream = sys.stderr if stream is None else stream
+    print(recorder.format_summary(), file=stream)
+    if args.trace:
+        print(f"Trace written: {recorder.write(args.trace, args.trace_format)}", file=stream)
+    if args.profile:
+        print(f"Profile written: {recorder.dump_profile(args.profile)}", file=stream)
@@ -5,8 +5,15 @@ Based on: "A Phenomenological Pattern for Nuclear Magic Numbers"
 Author: André Luís Tomaz Dionísio
 Institution: EPHEC Brussels, Belgium
 Date: December 2025
+
+Usage:
+    python magic_number_calculator.py                 # interactive menu
+    python magic_number_calculator.py batch [FILE]    # stream CSV/JSONL rows
 """
 
+import sys
+
+
 def calculate_delta_n(c_start):
     """
     Calculate Δn from the decreasing sequence formula.
@@ -45,142 +52,53 @@ def calculate_next_magic(M_n, c_start, c_high_j):
 
 def display_calculation(M_n, c_start, c_high_j):
     """Display detailed calculation steps."""
-    print(f"\n{'='*60}")
-    print(f"Calculating next magic number after M_n = {M_n}")
-    print(f"{'='*60}")
-    print(f"\nGiven parameters:")
-    print(f"  c_start  = {c_start}")
-    print(f"  c_high-j = {c_high_j}")
-    
-    delta_n, C_total, M_next = calculate_next_magic(M_n, c_start, c_high_j)
-    
-    print(f"\nStep 1: Calculate Δn")
-    print(f"  Δn = c_start × (c_start + 2) / 4")
-    print(f"  Δn = {c_start} × {c_start + 2} / 4")
-    print(f"  Δn = {c_start * (c_start + 2)} / 4")
-    print(f"  Δn = {delta_n}")
-    
-    # Show decreasing sequence
-    if c_start > 0:
-        sequence = list(range(c_start, 0, -2))
-        print(f"\n  This is the sum of: {' + '.join(map(str, sequence))}")
-        print(f"  Sum verification: {sum(sequence)} = {delta_n} ✓")
-    
-    print(f"\nStep 2: Calculate C_total")
-    print(f"  C_total = Δn + c_high-j")
-    print(f"  C_total = {delta_n} + {c_high_j}")
-    print(f"  C_total = {C_total}")
-    
-    print(f"\nStep 3: Calculate M_{{n+1}}")
-    print(f"  M_{{n+1}} = M_n + C_total")
-    print(f"  M_{{n+1}} = {M_n} + {C_total}")
-    print(f"  M_{{n+1}} = {M_next}")
-    
-    print(f"\n{'='*60}")
-    print(f"RESULT: Next magic number is {M_next}")
-    print(f"{'='*60}\n")
-    
-    return M_next
+    from calculator_report import compute_calculation, render
+
+    result = compute_calculation(M_n, c_start, c_high_j)
+    render(result)
+    return result.M_next
 
 
 def validate_all_magic_numbers():
     """Validate all known magic numbers using the formula."""
-    # Parameters table: (M_n, c_start, c_high_j, expected_M_next)
-    parameters = [
-        (0,   0,  2,   2),
-        (2,   2,  4,   8),
-        (8,   4,  6,  20),
-        (20,  2,  6,  28),
-        (28,  6, 10,  50),
-        (50,  8, 12,  82),
-        (82, 10, 14, 126),
-        (126, 12, 16, 184),
-    ]
-    
-    print("\n" + "="*70)
-    print("VALIDATION: All Known Magic Numbers (0 → 184)")
-    print("="*70)
-    print(f"\n{'M_n':>5} | {'c_start':>8} | {'c_high-j':>8} | {'Δn':>6} | "
-          f"{'C_total':>8} | {'M_next':>7} | {'Expected':>8}")
-    print("-"*70)
-    
-    all_valid = True
-    for M_n, c_start, c_high_j, expected in parameters:
-        delta_n, C_total, M_next = calculate_next_magic(M_n, c_start, c_high_j)
-        status = "✓" if M_next == expected else "✗"
-        
-        print(f"{M_n:5} | {c_start:8} | {c_high_j:8} | {delta_n:6} | "
-              f"{C_total:8} | {M_next:7} | {expected:8} {status}")
-        
-        if M_next != expected:
-            all_valid = False
-    
-    print("-"*70)
-    if all_valid:
-        print("ALL VALIDATIONS PASSED! ✓✓✓")
-    else:
-        print("VALIDATION FAILED!")
-    print("="*70 + "\n")
+    from calculator_report import compute_validation, render
+
+    validation = compute_validation()
+    render(validation)
+    return validation.all_valid
 
 
 def show_stability_hierarchy():
     """Display the stability hierarchy based on Δn values."""
-    print("\n" + "="*60)
-    print("STABILITY HIERARCHY (based on Δn)")
-    print("="*60)
-    
-    hierarchy = [
-        (2,  "LOCAL",     "⁴He, ⁴⁰Ca"),
-        (6,  "SUBSHELL",  "¹²C, ¹⁶O"),
-        (12, "REGIONAL",  "²⁰Ne, ²⁸Si, ⁵⁶Ni"),
-        (20, "STRONG",    "¹⁰⁰Sn"),
-        (30, "MAJOR",     "²⁰⁸Pb"),
-        (42, "COMPLETE",  "predicted 184"),
-    ]
-    
-    print(f"\n{'Δn':>4} | {'Level':>10} | {'Examples'}")
-    print("-"*60)
-    for delta_n, level, examples in hierarchy:
-        print(f"{delta_n:4} | {level:>10} | {examples}")
-    
-    print("\n" + "="*60)
-    print("Higher Δn = Greater Nuclear Stability")
-    print("="*60 + "\n")
+    from calculator_report import stability_hierarchy, render
+
+    render(stability_hierarchy())
 
 
 def show_decreasing_sequences():
     """Display the decreasing sequence pattern for all magic numbers."""
-    print("\n" + "="*70)
-    print("DECREASING SEQUENCE PATTERN")
-    print("="*70)
-    
-    patterns = [
-        (2,   [],                      2,  ""),
-        (8,   [4, 2],                  0,  ""),
-        (20,  [6, 4, 2],               0,  ""),
-        (28,  [],                      8,  "← sphere closure"),
-        (50,  [6, 4, 2],              10,  ""),
-        (82,  [8, 6, 4, 2],           12,  ""),
-        (126, [10, 8, 6, 4, 2],       14,  ""),
-        (184, [12, 10, 8, 6, 4, 2],   16,  "(predicted)"),
-    ]
-    
-    print(f"\n{'Magic':>6} | {'Decreasing Sequence':>30} | {'Sphere':>8} | {'Note'}")
-    print("-"*70)
-    
-    for magic, sequence, sphere, note in patterns:
-        if sequence:
-            seq_str = "→".join(map(str, sequence))
-        else:
-            seq_str = "—"
-        
-        sphere_str = str(sphere) if sphere > 0 else "—"
-        
-        print(f"{magic:6} | {seq_str:>30} | {sphere_str:>8} | {note}")
-    
-    print("\n" + "="*70)
-    print("Pattern: Start higher → Descend by 2 → Reach 2 → Start even higher")
-    print("="*70 + "\n")
+    from calculator_report import decreasing_sequences, render
+
+    render(decreasing_sequences())
+
+
+def show_closed_shell_binding():
+    """Display BE/A of doubly-magic nuclides from the AME2020 mass table."""
+    from nuclide_index import NuclideIndex
+    from magic_sequence import KNOWN_MAGIC_NUMBERS
+
+    index = NuclideIndex.load()
+
+    print("\n" + "="*60)
+    print("DOUBLY-MAGIC NUCLIDES (AME2020)")
+    print("="*60)
+    print(f"\n{'Z':>4} | {'N':>4} | {'A':>4} | {'Nuclide':>8} | {'BE/A (MeV)':>10}")
+    print("-"*60)
+    for row in index.select(index.doubly(KNOWN_MAGIC_NUMBERS)):
+        nuclide = f"{row['A']}{row['element']}"
+        print(f"{row['Z']:4} | {row['N']:4} | {row['A']:4} | {nuclide:>8} | "
+              f"{row['be_per_a']:10.4f}")
+    print("="*60 + "\n")
 
 
 def interactive_mode():
@@ -214,8 +132,19 @@ def interactive_mode():
             break
 
 
-def main():
+def main(argv=None):
     """Main function to run the calculator."""
+    argv = sys.argv[1:] if argv is None else argv
+    if argv:
+        if argv[0] == 'batch':
+            # numpy is only needed (and imported) for batch mode
+            from batch_stream import main as batch_main
+            return batch_main(argv[1:])
+        print(f"Unknown command: {argv[0]}\n"
+              f"Usage: magic_number_calculator.py [batch [FILE] [options]]",
+              file=sys.stderr)
+        return 2
+
     print("\n" + "="*70)
     print("MAGIC NUMBER CALCULATOR")
     print("Based on: A Phenomenological Pattern for Nuclear Magic Numbers")
@@ -229,9 +158,10 @@ def main():
         print("3. Show stability hierarchy")
         print("4. Show decreasing sequence patterns")
         print("5. Interactive mode")
-        print("6. Exit")
+        print("6. Show doubly-magic binding energies (AME2020)")
+        print("7. Exit")
         
-        choice = input("\nEnter choice (1-6): ").strip()
+        choice = input("\nEnter choice (1-7): ").strip()
         
         if choice == '1':
             validate_all_magic_numbers()
@@ -250,12 +180,14 @@ def main():
         elif choice == '5':
             interactive_mode()
         elif choice == '6':
+            show_closed_shell_binding()
+        elif choice == '7':
             print("\nThank you for using the Magic Number Calculator!")
             print("For more information, see the full article.\n")
-            break
+            return 0
         else:
-            print("Invalid choice! Please enter 1-6.")
+            print("Invalid choice! Please enter 1-7.")
 
 
 if __name__ == "__main__":
-    main()
+    exit(main())
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Magic Sequence Generator
+Lazy, memoized chain 0 → 2 → 8 → 20 → ... to arbitrary shell depth.
+
+Author: André Luís Tomaz Dionísio
+Institution: EPHEC Brussels, Belgium
+Date: December 2025
+
+Each shell is derived from the previous one with calculate_next_magic:
+
+    M_{n+1} = M_n + c_start × (c_start + 2) / 4 + c_high_j
+
+where c_high_j = 2l + 2 is the capacity of the high-j (intruder) orbital
+and, from 28 onwards, c_start = c_high_j - 4.
+"""
+
+from collections import namedtuple
+
+from magic_number_calculator import calculate_next_magic
+
+# One step of the chain: M_n → M_next
+Shell = namedtuple('Shell', ['index', 'M_n', 'c_start', 'c_high_j',
+                             'delta_n', 'C_total', 'M_next'])
+
+# Known (experimentally established) magic numbers
+KNOWN_MAGIC_NUMBERS = (2, 8, 20, 28, 50, 82, 126)
+
+DEFAULT_MEMO_SIZE = 4096
+
+
+def published_rule(index):
+    """
+    (c_start, c_high_j) for shell `index` as published in the article.
+
+    - Shells 0-2 (s, p, sd): the high-j orbital belongs to the shell itself,
+      l = index, c_high_j = 2l + 2 and c_start = c_high_j - 2.
+    - Shell 3 (20 → 28): 1f7/2 sphere closure, c_start = 2, c_high_j = 6.
+    - Shells 4+: intruder with l = index, c_high_j = 2l + 2, c_start = c_high_j - 4.
+    """
+    if index == 3:
+        return 2, 6
+    c_high_j = 2 * index + 2
+    if index < 3:
+        return c_high_j - 2, c_high_j
+    return c_high_j - 4, c_high_j
+
+
+class MagicSequence:
+    """
+    Lazy generator of magic-number shells with a bounded prefix memo.
+
+    Shells with index < memo_size are stored once computed, so repeated
+    prefix queries are O(1). Deeper shells are streamed and never stored,
+    apart from the furthest one reached, from which later queries resume.
+    """
+
+    def __init__(self, rule=published_rule, memo_size=DEFAULT_MEMO_SIZE):
+        self.rule = rule
+        self.memo_size = memo_size
+        self._memo = []
+        self._frontier = None
+
+    def _step(self, index, M_n):
+        """Compute shell `index` starting from magic number M_n."""
+        c_start, c_high_j = self.rule(index)
+        delta_n, C_total, M_next = calculate_next_magic(M_n, c_start, c_high_j)
+        return Shell(index, M_n, c_start, c_high_j, delta_n, C_total, M_next)
+
+    def _resume_point(self, start):
+        """Closest already computed shell at or before `start`."""
+        if start < len(self._memo):
+            return self._memo[start]
+        if self._frontier is not None and self._frontier.index <= start:
+            return self._frontier
+        if self._memo:
+            return self._memo[-1]
+        return None
+
+    def iter_shells(self, start=0, stop=None):
+        """Yield shells start, start+1, ... (up to stop, exclusive) lazily."""
+        shell = self._resume_point(start)
+        if shell is None:
+            shell = self._step(0, 0)
+            self._remember(shell)
+
+        while stop is None or shell.index < stop:
+            if shell.index >= start:
+                yield shell
+            shell = self._next(shell)
+
+    def _next(self, shell):
+        """Shell following `shell`, from the memo when available."""
+        index = shell.index + 1
+        if index < len(self._memo):
+            return self._memo[index]
+        shell = self._step(index, shell.M_next)
+        self._remember(shell)
+        return shell
+
+    def _remember(self, shell):
+        if shell.index == len(self._memo) and shell.index < self.memo_size:
+            self._memo.append(shell)
+        if self._frontier is None or shell.index > self._frontier.index:
+            self._frontier = shell
+
+    def __iter__(self):
+        return self.iter_shells()
+
+    def shell(self, index):
+        """Return shell `index` (O(1) once memoized)."""
+        if index < 0:
+            raise IndexError("shell index must be non-negative")
+        return next(self.iter_shells(index, index + 1))
+
+    def prefix(self, count):
+        """List of the first `count` shells."""
+        return list(self.iter_shells(0, count))
+
+    def magic_number(self, index):
+        """M_index, with M_0 = 0."""
+        if index == 0:
+            return 0
+        return self.shell(index - 1).M_next
+
+    def magic_numbers(self, count=None):
+        """Yield 0, 2, 8, 20, ... lazily (count values, or forever)."""
+        if count is not None and count <= 0:
+            return
+        yield 0
+        stop = None if count is None else count - 1
+        for shell in self.iter_shells(0, stop):
+            yield shell.M_next
+
+
+def main():
+    """Print the first shells and a deep-chain example."""
+    sequence = MagicSequence()
+
+    print("\n" + "="*70)
+    print("MAGIC SEQUENCE GENERATOR")
+    print("="*70)
+    print(f"\n{'n':>4} | {'M_n':>8} | {'c_start':>8} | {'c_high-j':>8} | "
+          f"{'Δn':>6} | {'C_total':>8} | {'M_next':>8}")
+    print("-"*70)
+    for s in sequence.iter_shells(0, 12):
+        print(f"{s.index:4} | {s.M_n:8} | {s.c_start:8} | {s.c_high_j:8} | "
+              f"{s.delta_n:6} | {s.C_total:8} | {s.M_next:8}")
+
+    deep = 5000
+    print("-"*70)
+    print(f"M_{deep} = {sequence.magic_number(deep)}")
+    print("="*70 + "\n")
+
+
+if __name__ == "__main__":
+    main()
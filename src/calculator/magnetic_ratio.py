@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""
+Magnetic Ratio vs N/Z
+=====================
+
+Tests the claim of discoveries/MAGNETIC_COUPLING_ADDITION.txt that
+|μp/μn| ≈ 1.46 matches N/Z, against every nuclide of the mass table:
+
+    N/Z, its deviation from the ratio, BE/A and the distance to the nearest
+    magic number (|Z - M| + |N - M'|, known magic numbers) per nuclide;
+    Pearson and Spearman correlations of |deviation| with BE/A and with the
+    magic distance, for all nuclides and for A ≥ HEAVY_A;
+    binned statistics over A.
+
+Every step is a vectorized pass over the table, so a full run takes a few
+milliseconds and can be repeated for each ratio definition:
+
+    codata     |μp/μn| with the CODATA 2022 moments (1.45990)
+    quark      the naive quark-model value 3/2
+    <number>   any other ratio
+
+Author: André Luís Tomaz Dionísio
+Institution: EPHEC Brussels, Belgium
+Date: December 2025
+
+Usage:
+    python magnetic_ratio.py                       # CODATA ratio, all nuclides
+    python magnetic_ratio.py --ratio quark --measured-only
+    python magnetic_ratio.py --ratio 1.5 --plot magnetic_ratio.png
+"""
+
+import argparse
+import time
+from collections import namedtuple
+
+import numpy as np
+
+from magic_sequence import KNOWN_MAGIC_NUMBERS
+from nuclide_index import NuclideIndex
+
+# Nucleon magnetic moments in nuclear magnetons (CODATA 2022)
+MU_PROTON = 2.79284734
+MU_NEUTRON = -1.91304276
+
+RATIO_DEFINITIONS = {
+    'codata': abs(MU_PROTON / MU_NEUTRON),
+    'quark': 1.5,
+}
+DEFAULT_RATIO = 'codata'
+
+# Nuclides "near the ratio": |N/Z - ratio| ≤ NEAR_FRACTION × ratio
+NEAR_FRACTION = 0.05
+HEAVY_A = 100
+DEFAULT_BIN_WIDTH = 20
+
+# Per-nuclide columns (NumPy arrays of equal length)
+NuclideRatios = namedtuple('NuclideRatios', ['Z', 'N', 'A', 'n_over_z', 'deviation',
+                                             'be_per_a', 'magic_distance'])
+
+Correlation = namedtuple('Correlation', ['subset', 'x', 'y', 'count', 'pearson', 'spearman'])
+
+RatioBin = namedtuple('RatioBin', ['a_low', 'a_high', 'count', 'mean_n_over_z',
+                                   'std_n_over_z', 'mean_deviation', 'mean_be_per_a',
+                                   'near'])
+
+MagneticRatioAnalysis = namedtuple('MagneticRatioAnalysis',
+                                   ['definition', 'ratio', 'nuclides', 'correlations',
+                                    'bins', 'seconds'])
+
+# =============================================================================
+# PER-NUCLIDE QUANTITIES
+# =============================================================================
+
+
+def resolve_ratio(definition):
+    """(name, value) of a ratio definition: a key of RATIO_DEFINITIONS or a number."""
+    if definition in RATIO_DEFINITIONS:
+        return definition, RATIO_DEFINITIONS[definition]
+    try:
+        return str(definition), float(definition)
+    except ValueError:
+        raise ValueError(f"unknown ratio definition: {definition} (use "
+                         f"{', '.join(RATIO_DEFINITIONS)} or a number)") from None
+
+
+def magic_distance(numbers, magic=KNOWN_MAGIC_NUMBERS):
+    """|x - M| for the magic number M nearest to each x."""
+    numbers = np.asarray(numbers, dtype=np.int64)
+    magic = np.asarray(sorted(magic), dtype=np.int64)
+    right = np.clip(np.searchsorted(magic, numbers), 0, len(magic) - 1)
+    left = np.clip(right - 1, 0, len(magic) - 1)
+    return np.minimum(np.abs(numbers - magic[left]), np.abs(numbers - magic[right]))
+
+
+def nuclide_ratios(table, ratio, measured_only=False):
+    """N/Z, deviation from `ratio`, BE/A and magic distance of every Z ≥ 1 nuclide."""
+    keep = (table['Z'] > 0) & np.isfinite(table['be_per_a'])
+    if measured_only:
+        keep &= ~table['estimated']
+    Z = np.asarray(table['Z'][keep], dtype=np.int64)
+    N = np.asarray(table['N'][keep], dtype=np.int64)
+    n_over_z = N / Z
+    return NuclideRatios(Z, N, Z + N, n_over_z, n_over_z - ratio,
+                         np.asarray(table['be_per_a'][keep], dtype=float),
+                         magic_distance(Z) + magic_distance(N))
+
+# =============================================================================
+# STATISTICS
+# =============================================================================
+
+
+def _ranks(values):
+    """Ranks with ties averaged (1-based)."""
+    _, inverse, counts = np.unique(values, return_inverse=True, return_counts=True)
+    average = np.cumsum(counts) - (counts - 1) / 2
+    return average[inverse]
+
+
+def _pearson(x, y):
+    if len(x) < 3 or np.std(x) == 0 or np.std(y) == 0:
+        return np.nan
+    return float(np.corrcoef(x, y)[0, 1])
+
+
+def correlations(nuclides, heavy_a=HEAVY_A):
+    """Pearson and Spearman correlations of |deviation| with BE/A and magic distance."""
+    results = []
+    subsets = (('all', np.ones(len(nuclides.A), dtype=bool)),
+               (f'A >= {heavy_a}', nuclides.A >= heavy_a))
+    for subset, mask in subsets:
+        x = np.abs(nuclides.deviation[mask])
+        for name, y in (('BE/A', nuclides.be_per_a[mask]),
+                        ('magic distance', nuclides.magic_distance[mask])):
+            results.append(Correlation(subset, '|N/Z - ratio|', name, int(mask.sum()),
+                                       _pearson(x, y), _pearson(_ranks(x), _ranks(y))))
+    return results
+
+
+def binned_statistics(nuclides, ratio, width=DEFAULT_BIN_WIDTH):
+    """Statistics of N/Z per A bin of `width`, with np.bincount (no loop over nuclides)."""
+    if not len(nuclides.A):
+        return []
+    bins = nuclides.A // width
+    size = int(bins.max()) + 1
+    count = np.bincount(bins, minlength=size)
+    filled = count > 0
+    safe = np.where(filled, count, 1)
+
+    def mean(values):
+        return np.bincount(bins, weights=values, minlength=size) / safe
+
+    mean_nz = mean(nuclides.n_over_z)
+    std_nz = np.sqrt(np.maximum(mean(nuclides.n_over_z ** 2) - mean_nz ** 2, 0))
+    near = mean(np.abs(nuclides.deviation) <= NEAR_FRACTION * ratio)
+    mean_dev = mean(nuclides.deviation)
+    mean_be = mean(nuclides.be_per_a)
+    return [RatioBin(int(b * width), int((b + 1) * width - 1), int(count[b]),
+                     float(mean_nz[b]), float(std_nz[b]), float(mean_dev[b]),
+                     float(mean_be[b]), float(near[b]))
+            for b in np.flatnonzero(filled)]
+
+
+def analyze(table=None, definition=DEFAULT_RATIO, measured_only=False,
+            bin_width=DEFAULT_BIN_WIDTH):
+    """
+    Full analysis for one ratio definition.
+
+    Parameters:
+    -----------
+    table : mass table structured array or None
+        Default: the AME2020 table (or the reference nuclides).
+    definition : str
+        Key of RATIO_DEFINITIONS or a number.
+    measured_only : bool
+        Skip nuclides whose mass is estimated ('#' in AME2020).
+    bin_width : int
+        Width of the A bins.
+
+    Returns:
+    --------
+    MagneticRatioAnalysis
+    """
+    if table is None:
+        table = NuclideIndex.load().table
+    name, ratio = resolve_ratio(definition)
+    start = time.perf_counter()
+    nuclides = nuclide_ratios(table, ratio, measured_only)
+    result = MagneticRatioAnalysis(name, ratio, nuclides, correlations(nuclides),
+                                   binned_statistics(nuclides, ratio, bin_width), 0.0)
+    return result._replace(seconds=time.perf_counter() - start)
+
+# =============================================================================
+# FIGURE
+# =============================================================================
+
+
+def plot_analysis(analysis, path):
+    """N/Z vs A (coloured by BE/A) with the ratio and the binned means, and BE/A vs |deviation|."""
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+
+    nuclides = analysis.nuclides
+    centres = np.array([(b.a_low + b.a_high) / 2 for b in analysis.bins])
+    means = np.array([b.mean_n_over_z for b in analysis.bins])
+    stds = np.array([b.std_n_over_z for b in analysis.bins])
+
+    fig, (left, right) = plt.subplots(1, 2, figsize=(12, 5))
+    points = left.scatter(nuclides.A, nuclides.n_over_z, c=nuclides.be_per_a, s=4,
+                          cmap='viridis', rasterized=True)
+    fig.colorbar(points, ax=left, label='BE/A (MeV)')
+    left.errorbar(centres, means, yerr=stds, fmt='o-', color='black', markersize=3,
+                  linewidth=1, label='Binned mean ± std')
+    left.axhline(analysis.ratio, color='red', linestyle='--',
+                 label=f'Ratio ({analysis.definition}) = {analysis.ratio:.4f}')
+    left.set_xlabel('Mass number A')
+    left.set_ylabel('N/Z')
+    left.legend(loc='upper left', fontsize=9)
+
+    points = right.scatter(np.abs(nuclides.deviation), nuclides.be_per_a,
+                           c=nuclides.magic_distance, s=4, cmap='plasma_r', rasterized=True)
+    fig.colorbar(points, ax=right, label='Distance to the nearest magic numbers')
+    right.set_xlabel('|N/Z - ratio|')
+    right.set_ylabel('BE/A (MeV)')
+    fig.tight_layout()
+    fig.savefig(path, dpi=300)
+    plt.close(fig)
+    return path
+
+
+def main(argv=None):
+    """Run the analysis and print correlations and binned statistics."""
+    parser = argparse.ArgumentParser(description="N/Z against the nucleon magnetic ratio.")
+    parser.add_argument('--ratio', default=DEFAULT_RATIO,
+                        help=f"{', '.join(RATIO_DEFINITIONS)} or a number "
+                             "(default: %(default)s)")
+    parser.add_argument('--measured-only', action='store_true',
+                        help="skip nuclides with estimated masses")
+    parser.add_argument('--bin-width', type=int, default=DEFAULT_BIN_WIDTH,
+                        help="width of the A bins (default: %(default)s)")
+    parser.add_argument('--mass-table', default=None, help="path to mass.mas20")
+    parser.add_argument('--plot', metavar='PATH', help="write the figure to PATH")
+    args = parser.parse_args(argv)
+
+    table = NuclideIndex.load(args.mass_table).table
+    try:
+        result = analyze(table, args.ratio, args.measured_only, args.bin_width)
+    except ValueError as e:
+        parser.error(str(e))
+    nuclides = result.nuclides
+
+    print("\n" + "="*78)
+    print(f"MAGNETIC RATIO vs N/Z: {result.definition} = {result.ratio:.5f}")
+    print("="*78)
+    near = np.abs(nuclides.deviation) <= NEAR_FRACTION * result.ratio
+    print(f"\nNuclides: {len(nuclides.A)}   within ±{NEAR_FRACTION:.0%} of the ratio: "
+          f"{int(near.sum())} ({near.mean() if len(near) else 0:.1%})")
+    print(f"\n{'Subset':>10} | {'x':>14} | {'y':>14} | {'n':>5} | {'Pearson':>8} | "
+          f"{'Spearman':>8}")
+    print("-"*78)
+    for c in result.correlations:
+        print(f"{c.subset:>10} | {c.x:>14} | {c.y:>14} | {c.count:5} | "
+              f"{c.pearson:8.3f} | {c.spearman:8.3f}")
+    print(f"\n{'A':>9} | {'n':>4} | {'<N/Z>':>6} | {'σ':>6} | {'<dev>':>7} | "
+          f"{'<BE/A>':>7} | near")
+    print("-"*78)
+    for b in result.bins:
+        print(f"{b.a_low:4}-{b.a_high:<4} | {b.count:4} | {b.mean_n_over_z:6.3f} | "
+              f"{b.std_n_over_z:6.3f} | {b.mean_deviation:+7.3f} | "
+              f"{b.mean_be_per_a:7.3f} | {b.near:.0%}")
+    print("-"*78)
+    print(f"Time: {result.seconds * 1000:.1f} ms")
+    if args.plot:
+        print(f"✓ Figure saved: {plot_analysis(result, args.plot)}")
+    print("="*78 + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+AME2020 Mass Table Loader
+=========================
+
+Parses the AME2020 evaluation (mass.mas20, fixed-width text) into a compact
+NumPy structured array. The first parse is cached next to the source file as
+a .npy and later loads memory-map that cache instead of re-parsing the text.
+
+Author: André Luís Tomaz Dionísio
+Institution: EPHEC Brussels, Belgium
+Date: December 2025
+
+Data:
+    Download mass.mas20 from https://www-nds.iaea.org/amdc/ and place it at
+    data/mass.mas20, or point the AME2020_MASS_TABLE environment variable
+    at it.
+
+Usage:
+    python mass_table.py [path/to/mass.mas20]
+"""
+
+import os
+import sys
+import time
+import warnings
+
+import numpy as np
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+DEFAULT_MASS_TABLE = os.path.join(REPO_ROOT, 'data', 'mass.mas20')
+MASS_TABLE_ENV = 'AME2020_MASS_TABLE'
+
+# One row per nuclide; energies from the file are in keV, BE/A is kept in MeV
+MASS_DTYPE = np.dtype([
+    ('Z', 'i2'),
+    ('N', 'i2'),
+    ('A', 'i2'),
+    ('element', 'U3'),
+    ('mass_excess', 'f8'),      # keV
+    ('be_per_a', 'f8'),         # MeV
+    ('be_per_a_unc', 'f8'),     # MeV
+    ('estimated', '?'),         # '#' values (not experimental)
+])
+
+# Column slices of mass.mas20, from its Fortran format
+# a1,i3,i5,i5,i5,1x,a3,a4,1x,f14.6,f12.6,f13.5,1x,f10.5,...
+_COLUMNS = {
+    'N': slice(4, 9),
+    'Z': slice(9, 14),
+    'A': slice(14, 19),
+    'element': slice(20, 23),
+    'mass_excess': slice(28, 42),
+    'be_per_a': slice(54, 67),
+    'be_per_a_unc': slice(68, 78),
+}
+
+# BE/A (MeV) of the article's reference nuclides, used only when the AME2020
+# file is not available locally: (Z, N, element, BE/A)
+REFERENCE_BE_PER_A = [
+    (2, 2, 'He', 7.074),
+    (4, 4, 'Be', 6.476),
+    (6, 6, 'C', 7.680),
+    (8, 8, 'O', 7.976),
+    (10, 10, 'Ne', 8.032),
+    (14, 14, 'Si', 8.448),
+    (20, 20, 'Ca', 8.551),
+    (28, 28, 'Ni', 8.643),
+    (50, 50, 'Sn', 8.667),
+    (82, 126, 'Pb', 7.867),
+]
+
+# =============================================================================
+# PARSING
+# =============================================================================
+
+
+def _parse_value(text):
+    """Parse an AME number; '#' replaces the decimal point of estimates."""
+    text = text.strip()
+    estimated = '#' in text
+    if not text or '*' in text:
+        return np.nan, estimated
+    return float(text.replace('#', '.')), estimated
+
+
+def _parse_line(line):
+    """Parse one data line of mass.mas20, or return None for header lines."""
+    if len(line) < 78:
+        return None
+    try:
+        N = int(line[_COLUMNS['N']])
+        Z = int(line[_COLUMNS['Z']])
+        A = int(line[_COLUMNS['A']])
+    except ValueError:
+        return None
+    element = line[_COLUMNS['element']].strip()
+    if A != N + Z or not element.isalpha():
+        return None
+
+    mass_excess, est_mass = _parse_value(line[_COLUMNS['mass_excess']])
+    be_per_a, est_be = _parse_value(line[_COLUMNS['be_per_a']])
+    be_per_a_unc, _ = _parse_value(line[_COLUMNS['be_per_a_unc']])
+
+    return (Z, N, A, element, mass_excess,
+            be_per_a / 1000.0, be_per_a_unc / 1000.0, est_mass or est_be)
+
+
+def parse_mass_table(path):
+    """Parse the fixed-width AME2020 text file into a structured array."""
+    with open(path, encoding='ascii', errors='replace') as f:
+        rows = [row for row in map(_parse_line, f) if row is not None]
+    if not rows:
+        raise ValueError(f"No AME2020 data rows found in {path}")
+    return np.array(rows, dtype=MASS_DTYPE)
+
+
+# =============================================================================
+# CACHED LOADING
+# =============================================================================
+
+
+def default_mass_table_path():
+    """Path of the AME2020 file ($AME2020_MASS_TABLE or data/mass.mas20)."""
+    return os.environ.get(MASS_TABLE_ENV, DEFAULT_MASS_TABLE)
+
+
+def cache_path_for(path):
+    """The .npy cache written next to the mass table."""
+    return path + '.npy'
+
+
+def load_mass_table(path=None, use_cache=True):
+    """
+    Load the AME2020 mass table as a structured array (see MASS_DTYPE).
+
+    The parsed table is cached as <path>.npy; later calls memory-map it
+    (read-only) as long as it is newer than the text file.
+
+    Raises:
+    -------
+    FileNotFoundError
+        If the AME2020 file does not exist.
+    """
+    path = path or default_mass_table_path()
+    if not os.path.exists(path):
+        raise FileNotFoundError(
+            f"AME2020 mass table not found: {path} "
+            f"(set {MASS_TABLE_ENV} or place mass.mas20 in data/)")
+
+    cache = cache_path_for(path)
+    if (use_cache and os.path.exists(cache)
+            and os.path.getmtime(cache) >= os.path.getmtime(path)):
+        table = np.load(cache, mmap_mode='r')
+        if table.dtype == MASS_DTYPE:
+            return table
+
+    table = parse_mass_table(path)
+    if use_cache:
+        try:
+            np.save(cache, table)
+        except OSError as e:
+            warnings.warn(f"Could not write mass table cache {cache}: {e}")
+    return table
+
+
+def reference_mass_table():
+    """Structured array holding only REFERENCE_BE_PER_A."""
+    rows = [(Z, N, Z + N, element, np.nan, be, np.nan, False)
+            for Z, N, element, be in REFERENCE_BE_PER_A]
+    return np.array(rows, dtype=MASS_DTYPE)
+
+
+def load_mass_table_or_reference(path=None):
+    """load_mass_table(), falling back to the reference nuclides with a warning."""
+    try:
+        return load_mass_table(path)
+    except FileNotFoundError as e:
+        warnings.warn(f"{e}; using the {len(REFERENCE_BE_PER_A)} reference nuclides")
+        return reference_mass_table()
+
+
+def main():
+    """Parse (or load from cache) and summarize the mass table."""
+    path = sys.argv[1] if len(sys.argv) > 1 else None
+
+    start = time.perf_counter()
+    table = load_mass_table(path)
+    elapsed = time.perf_counter() - start
+
+    print("\n" + "="*60)
+    print("AME2020 MASS TABLE")
+    print("="*60)
+    print(f"  Nuclides:     {len(table)}")
+    print(f"  Z range:      {table['Z'].min()} - {table['Z'].max()}")
+    print(f"  N range:      {table['N'].min()} - {table['N'].max()}")
+    print(f"  Estimated:    {int(table['estimated'].sum())}")
+    print(f"  Load time:    {elapsed * 1000:.1f} ms")
+    print(f"  Memory-mapped: {isinstance(table, np.memmap)}")
+    print("="*60 + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
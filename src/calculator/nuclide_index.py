@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Nuclide Index
+=============
+
+Fast lookups over the AME2020 mass table (see mass_table.py):
+
+- point lookups by (Z, N) through a dense (Z, N) → row grid, O(1)
+- isotopes of Z, isotones of N and isobars of A through sorted secondary
+  indexes with offset arrays, O(k) for k results
+- element symbol → Z
+
+Author: André Luís Tomaz Dionísio
+Institution: EPHEC Brussels, Belgium
+Date: December 2025
+"""
+
+import numpy as np
+
+from mass_table import load_mass_table_or_reference
+
+MISSING = -1
+
+
+def _sorted_index(keys, size):
+    """Stable argsort of keys plus offsets so rows of key k are order[off[k]:off[k+1]]."""
+    order = np.argsort(keys, kind='stable').astype(np.int32)
+    counts = np.bincount(keys, minlength=size)
+    offsets = np.zeros(size + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+    return order, offsets
+
+
+class NuclideIndex:
+    """
+    Lookup layer over a mass table structured array.
+
+    All query methods return row numbers into `table` (int32 arrays, or an
+    int for point lookups); use `select` to get the records themselves.
+    """
+
+    def __init__(self, table):
+        self.table = table
+        Z = np.asarray(table['Z'], dtype=np.int64)
+        N = np.asarray(table['N'], dtype=np.int64)
+        A = np.asarray(table['A'], dtype=np.int64)
+
+        self.z_max = int(Z.max()) if len(Z) else 0
+        self.n_max = int(N.max()) if len(N) else 0
+        self.a_max = int(A.max()) if len(A) else 0
+
+        self.grid = np.full((self.z_max + 1, self.n_max + 1), MISSING, dtype=np.int32)
+        self.grid[Z, N] = np.arange(len(table), dtype=np.int32)
+
+        self._by_z = _sorted_index(Z, self.z_max + 1)
+        self._by_n = _sorted_index(N, self.n_max + 1)
+        self._by_a = _sorted_index(A, self.a_max + 1)
+
+        self.symbols = {}
+        for element, z in zip(table['element'], Z):
+            self.symbols.setdefault(str(element).strip().lower(), int(z))
+
+    @classmethod
+    def load(cls, path=None):
+        """Build the index over the AME2020 table (or the reference nuclides)."""
+        return cls(load_mass_table_or_reference(path))
+
+    # -------------------------------------------------------------------------
+    # Point lookups
+    # -------------------------------------------------------------------------
+
+    def row(self, Z, N):
+        """Row of nuclide (Z, N), or MISSING."""
+        if 0 <= Z <= self.z_max and 0 <= N <= self.n_max:
+            return int(self.grid[Z, N])
+        return MISSING
+
+    def rows(self, Z, N):
+        """Vectorized row(): arrays of Z and N → array of rows (MISSING if absent)."""
+        Z, N = np.broadcast_arrays(np.asarray(Z, dtype=np.int64),
+                                   np.asarray(N, dtype=np.int64))
+        inside = (Z >= 0) & (Z <= self.z_max) & (N >= 0) & (N <= self.n_max)
+        result = np.full(Z.shape, MISSING, dtype=np.int32)
+        result[inside] = self.grid[Z[inside], N[inside]]
+        return result
+
+    def get(self, Z, N):
+        """Record of nuclide (Z, N), or None."""
+        row = self.row(Z, N)
+        return None if row == MISSING else self.table[row]
+
+    def __contains__(self, key):
+        return self.row(*key) != MISSING
+
+    def z_of(self, symbol):
+        """Proton number of an element symbol (case-insensitive)."""
+        try:
+            return self.symbols[symbol.strip().lower()]
+        except KeyError:
+            raise KeyError(f"Unknown element symbol: {symbol}") from None
+
+    # -------------------------------------------------------------------------
+    # Slice queries
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def _slice(index, key, key_max):
+        order, offsets = index
+        if not 0 <= key <= key_max:
+            return order[:0]
+        return order[offsets[key]:offsets[key + 1]]
+
+    def isotopes(self, Z):
+        """Rows with proton number Z, in table order."""
+        return self._slice(self._by_z, Z, self.z_max)
+
+    def isotones(self, N):
+        """Rows with neutron number N, in table order."""
+        return self._slice(self._by_n, N, self.n_max)
+
+    def isobars(self, A):
+        """Rows with mass number A, in table order."""
+        return self._slice(self._by_a, A, self.a_max)
+
+    def by_symbol(self, symbol):
+        """Rows of all isotopes of an element given by its symbol."""
+        return self.isotopes(self.z_of(symbol))
+
+    def isotones_of(self, numbers):
+        """Rows with N in `numbers` (e.g. the magic numbers)."""
+        parts = [self.isotones(n) for n in numbers]
+        return np.concatenate(parts) if parts else np.empty(0, dtype=np.int32)
+
+    def isotopes_of(self, numbers):
+        """Rows with Z in `numbers`."""
+        parts = [self.isotopes(z) for z in numbers]
+        return np.concatenate(parts) if parts else np.empty(0, dtype=np.int32)
+
+    def doubly(self, numbers):
+        """Rows with both Z and N in `numbers`, ordered by Z then N."""
+        numbers = np.asarray(sorted(numbers))
+        rows = self.rows(numbers[:, None], numbers[None, :]).ravel()
+        return rows[rows != MISSING]
+
+    def dense(self, field, fill=np.nan):
+        """Field values on the dense (Z, N) grid, `fill` where no nuclide exists."""
+        values = np.asarray(self.table[field])
+        grid = np.full(self.grid.shape, fill, dtype=np.result_type(values, fill))
+        present = self.grid != MISSING
+        grid[present] = values[self.grid[present]]
+        return grid
+
+    def select(self, rows):
+        """Records for the given rows."""
+        return self.table[rows]
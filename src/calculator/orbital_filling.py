@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+Orbital Filling Engine
+Derives c_start and c_high_j of every shell from the spin-orbit level scheme.
+
+Author: André Luís Tomaz Dionísio
+Institution: EPHEC Brussels, Belgium
+Date: December 2025
+
+Level scheme (no literal tables):
+
+- Oscillator shell N holds the orbitals l = N, N-2, ..., 1 or 0, each split
+  by the spin-orbit force into j = l + 1/2 and j = l - 1/2 with capacity
+  c = 2j + 1 (2l + 2 and 2l).
+- From N = 3 on, the high-j orbital j = N + 1/2 (the intruder, c = 2l + 2)
+  is pushed down and closes shell N: 1f7/2 → 28, 1g9/2 → 50, 1h11/2 → 82...
+  The rest of oscillator shell N completes shell N + 1.
+
+For each shell, c_high_j is the capacity of its highest-j orbital and
+c_start the largest capacity among the others (0 when there are none). For
+shells 4+ the others are exactly c_start, c_start - 2, ..., 2, so their sum
+is Δn = c_start(c_start + 2)/4 and calculate_next_magic reproduces the
+closure derived from the level table.
+
+The orbitals inside a shell are ordered by a schematic Nilsson energy
+(κ = 0.0637, μ = 0.42, in units of ħω); the order is only used for display,
+shell membership follows from the scheme above.
+
+Note: the article writes the 20 → 28 step as c_start = 2, c_high_j = 6.
+The level scheme gives c_start = 0, c_high_j = 8 (1f7/2 alone); both add
+8 nucleons, so every magic number is the same.
+
+Usage:
+    python orbital_filling.py                    # level table + validation
+    python orbital_filling.py --shells 10 --validate 10000
+"""
+
+import argparse
+import time
+from collections import namedtuple
+from functools import lru_cache
+
+import numpy as np
+
+from magic_number_calculator import calculate_next_magic
+from magic_sequence import published_rule
+
+# First oscillator shell whose high-j orbital intrudes into the shell below
+FIRST_INTRUDER_SHELL = 3
+
+# Schematic Nilsson parameters (units of ħω), used to order the orbitals
+NILSSON_KAPPA = 0.0637
+NILSSON_MU = 0.42
+
+# Level tables grow linearly with the shell index, parameters do not
+LEVEL_CACHE_SIZE = 256
+PARAMETER_CACHE_SIZE = 65_536
+DEFAULT_VALIDATION_SHELLS = 5000
+
+# Spectroscopic letters as used in the article (1j15/2 for l = 7)
+ORBITAL_LETTERS = 'spdfghijklmnoqrtuvwxyz'
+
+LEVEL_DTYPE = np.dtype([('N', np.int64), ('n', np.int64), ('l', np.int64),
+                        ('j2', np.int64), ('capacity', np.int64),
+                        ('intruder', np.bool_), ('energy', np.float64)], align=True)
+
+# Parameters of one shell as derived from its level table
+ShellParameters = namedtuple('ShellParameters', ['index', 'c_start', 'c_high_j',
+                                                 'capacity', 'decreasing'])
+
+# Shell-by-shell result of validate_orbital_pattern()
+OrbitalValidation = namedtuple('OrbitalValidation', ['shells', 'failures',
+                                                     'published_differences',
+                                                     'last_magic', 'seconds'])
+
+# =============================================================================
+# LEVEL TABLES
+# =============================================================================
+
+
+def nilsson_energy(N, l, j2, kappa=NILSSON_KAPPA, mu=NILSSON_MU):
+    """Schematic single-particle energy (ħω); works on scalars and arrays."""
+    N, l, j2 = np.asarray(N), np.asarray(l), np.asarray(j2)
+    l_dot_s = np.where(j2 == 2 * l + 1, l / 2, -(l + 1) / 2)
+    return N + 1.5 - kappa * (2 * l_dot_s + mu * (l * (l + 1) - N * (N + 3) / 2))
+
+
+def oscillator_orbitals(N):
+    """(l, j2) arrays of the spin-orbit orbitals of oscillator shell N (j2 = 2j)."""
+    l = np.arange(N, -1, -2)
+    split = l[l > 0]
+    return np.concatenate([l, split]), np.concatenate([2 * l + 1, 2 * split - 1])
+
+
+def shell_quantum_numbers(index):
+    """
+    Membership of magic shell `index` (M_index → M_index+1) in the scheme.
+
+    Returns:
+    --------
+    (N, l, j2, intruder) : arrays, one entry per orbital (unordered)
+    """
+    if index < 0:
+        raise IndexError("shell index must be non-negative")
+    own_l, own_j2 = oscillator_orbitals(index)
+    if index < FIRST_INTRUDER_SHELL:
+        return (np.full(len(own_l), index), own_l, own_j2,
+                np.zeros(len(own_l), dtype=bool))
+
+    # Intruder: the high-j orbital j = N + 1/2 of oscillator shell N = index
+    N, l, j2 = [index], [index], [2 * index + 1]
+    if index - 1 >= FIRST_INTRUDER_SHELL:
+        # What oscillator shell index - 1 left after lowering its own high-j orbital
+        rest_l, rest_j2 = oscillator_orbitals(index - 1)
+        rest_l, rest_j2 = rest_l[1:], rest_j2[1:]  # element 0 is j = l + 1/2, l = N
+        N = np.concatenate([np.full(len(rest_l), index - 1), N])
+        l = np.concatenate([rest_l, l])
+        j2 = np.concatenate([rest_j2, j2])
+    intruder = np.zeros(len(l), dtype=bool)
+    intruder[-1] = True
+    return np.asarray(N), np.asarray(l), np.asarray(j2), intruder
+
+
+@lru_cache(maxsize=LEVEL_CACHE_SIZE)
+def shell_levels(index):
+    """
+    Orbitals of magic shell `index` (M_index → M_index+1), in filling order.
+
+    Returns a read-only structured array with fields N, n, l, j2 (= 2j),
+    capacity, intruder and energy. The LRU cache keeps LEVEL_CACHE_SIZE tables.
+    """
+    N, l, j2, intruder = shell_quantum_numbers(index)
+    levels = np.empty(len(l), dtype=LEVEL_DTYPE)
+    levels['N'] = N
+    levels['n'] = (N - l) // 2 + 1
+    levels['l'] = l
+    levels['j2'] = j2
+    levels['capacity'] = j2 + 1
+    levels['intruder'] = intruder
+    levels['energy'] = nilsson_energy(N, l, j2)
+    levels = levels[np.argsort(levels['energy'], kind='stable')]
+    levels.flags.writeable = False
+    return levels
+
+
+def orbital_label(level):
+    """Spectroscopic label of one level row, e.g. '1g9/2'."""
+    l = int(level['l'])
+    letter = ORBITAL_LETTERS[l] if l < len(ORBITAL_LETTERS) else f"[l={l}]"
+    return f"{int(level['n'])}{letter}{int(level['j2'])}/2"
+
+# =============================================================================
+# SHELL PARAMETERS
+# =============================================================================
+
+
+def split_capacities(capacities):
+    """
+    (c_start, c_high_j, decreasing) of the orbital capacities of one shell.
+
+    c_high_j is the largest capacity (the highest-j orbital), c_start the
+    largest of the others (0 if none). decreasing is True when the others
+    are exactly c_start, c_start - 2, ..., 2.
+    """
+    capacities = np.asarray(capacities)
+    if not len(capacities):
+        return 0, 0, True
+    top = int(np.argmax(capacities))
+    rest = np.sort(np.delete(capacities, top))[::-1]
+    c_start = int(rest[0]) if len(rest) else 0
+    return (c_start, int(capacities[top]),
+            bool(np.array_equal(rest, np.arange(c_start, 0, -2))))
+
+
+@lru_cache(maxsize=PARAMETER_CACHE_SIZE)
+def shell_parameters(index):
+    """c_start and c_high_j of shell `index`, read off its orbitals."""
+    capacities = shell_quantum_numbers(index)[2] + 1
+    c_start, c_high_j, decreasing = split_capacities(capacities)
+    return ShellParameters(index, c_start, c_high_j, int(capacities.sum()), decreasing)
+
+
+def orbital_rule(index):
+    """(c_start, c_high_j) of shell `index`; a drop-in rule for MagicSequence."""
+    params = shell_parameters(index)
+    return params.c_start, params.c_high_j
+
+
+def magic_numbers_from_levels(count):
+    """M_0, ..., M_count as cumulative level-table capacities (int64 array)."""
+    capacities = [shell_parameters(k).capacity for k in range(count)]
+    return np.concatenate([[0], np.cumsum(capacities, dtype=np.int64)])
+
+# =============================================================================
+# VALIDATION
+# =============================================================================
+
+
+def validate_orbital_pattern(count=DEFAULT_VALIDATION_SHELLS):
+    """
+    Check the pattern shell by shell from the level tables alone.
+
+    For every shell k < count:
+    - the non-high-j capacities form the decreasing sequence c_start, ..., 2,
+    - calculate_next_magic(M_k, c_start, c_high_j) gives M_k plus the total
+      capacity of the shell's orbitals,
+    - the published chain reaches the same magic number.
+
+    Returns:
+    --------
+    OrbitalValidation: failures lists (index, reason); published_differences
+    lists (index, orbital (c_start, c_high_j), published (c_start, c_high_j))
+    for shells whose parameters differ although the closure is the same.
+    """
+    start = time.perf_counter()
+    failures = []
+    differences = []
+    M_n = M_published = 0
+    for k in range(count):
+        params = shell_parameters(k)
+        if not params.decreasing:
+            failures.append((k, "capacities are not c_start, c_start - 2, ..., 2"))
+        _, _, M_next = calculate_next_magic(M_n, params.c_start, params.c_high_j)
+        if M_next != M_n + params.capacity:
+            failures.append((k, f"M_next {M_next} != {M_n + params.capacity}"))
+
+        published = published_rule(k)
+        M_published = calculate_next_magic(M_published, *published)[2]
+        if M_published != M_next:
+            failures.append((k, f"published chain gives {M_published}, levels {M_next}"))
+        elif published != (params.c_start, params.c_high_j):
+            differences.append((k, (params.c_start, params.c_high_j), published))
+        M_n = M_next
+    return OrbitalValidation(count, failures, differences, M_n,
+                             time.perf_counter() - start)
+
+
+def main(argv=None):
+    """Print the level table of the first shells and validate the pattern."""
+    parser = argparse.ArgumentParser(description="Spin-orbit orbital filling engine.")
+    parser.add_argument('--shells', type=int, default=8, help="shells to list")
+    parser.add_argument('--validate', type=int, default=DEFAULT_VALIDATION_SHELLS,
+                        help="shells to validate (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    print("\n" + "="*78)
+    print("ORBITAL FILLING: SPIN-ORBIT LEVEL SCHEME")
+    print("="*78)
+    magic = magic_numbers_from_levels(args.shells)
+    for k in range(args.shells):
+        params = shell_parameters(k)
+        orbitals = ' '.join(orbital_label(level) + ('*' if level['intruder'] else '')
+                            for level in shell_levels(k))
+        print(f"\n{magic[k]:>4} → {magic[k + 1]:<4} c_start = {params.c_start:<3} "
+              f"c_high-j = {params.c_high_j:<3} {orbitals}")
+    print("\n(* intruder from the next oscillator shell, c = 2l + 2)")
+
+    result = validate_orbital_pattern(args.validate)
+    print("\n" + "-"*78)
+    print(f"Validated {result.shells:,} shells in {result.seconds:.2f} s "
+          f"(last magic number {result.last_magic:,})")
+    for index, orbital, published in result.published_differences:
+        print(f"  shell {index}: levels give (c_start, c_high_j) = {orbital}, "
+              f"article uses {published}; same closure")
+    if result.failures:
+        print(f"✗ {len(result.failures)} failure(s), first: {result.failures[:5]}")
+    else:
+        print("✓ Pattern derived from the level tables at every shell")
+    print("="*78 + "\n")
+    return 1 if result.failures else 0
+
+
+if __name__ == "__main__":
+    exit(main())
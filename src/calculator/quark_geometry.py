@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+"""
+Quark-Geometry Angle Search
+===========================
+
+Fits the two opening angles of GEOMETRIC_NUCLEAR_MODEL.txt to the CODATA
+nucleon magnetic moments. Each nucleon is an isosceles quark triangle with
+the odd quark at the apex and the like pair at the base:
+
+    proton  (uud): apex d, base u u, opening angle θ₁
+    neutron (udd): apex u, base d d, opening angle θ₂
+
+with the model's quark moments μu = +2.50 and μd = -2.20 (nuclear magnetons).
+The like pair's moments point along the two edges from the apex, so only
+cos(θ/2) of them lies on the bisector, and the spin-flavour weights of the
+quark model give
+
+    μ(θ) = (4 μ_like cos(θ/2) - μ_odd) / 3
+
+which is the naive quark model (4μu - μd)/3 for θ = 0.
+
+The apex assignment departs on purpose from the diagrams of the model
+document, which draw the proton with u at the apex over a d-d base (and the
+neutron the other way round), i.e. the quark content of the opposite
+nucleon; here each triangle holds its nucleon's actual quarks.
+
+The search evaluates
+
+    cost(θ₁, θ₂) = Σ ((prediction - CODATA) / CODATA)²   over μp, μn, μp/μn
+
+on a dense grid over [0°, 180°]² with NumPy broadcasting, split into row
+blocks across processes, then refines the best grid points with a
+Nelder-Mead simplex. The model is separable for μp and μn, so the closed-form
+angles are printed as a check of the search.
+
+Author: André Luís Tomaz Dionísio
+Institution: EPHEC Brussels, Belgium
+Date: December 2025
+
+Usage:
+    python quark_geometry.py                       # 10^7-point grid, all CPUs
+    python quark_geometry.py --points 1e6 --workers 1
+    python quark_geometry.py --mu-up 1.85 --mu-down -0.97
+"""
+
+import argparse
+import math
+import os
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from magnetic_ratio import MU_NEUTRON, MU_PROTON
+
+# Quark magnetic moments of the model (nuclear magnetons)
+MU_UP = 2.50
+MU_DOWN = -2.20
+
+# Angles proposed in the model document (force balance, degrees)
+DOCUMENT_ANGLES = (128.0, 110.8)
+
+ANGLE_RANGE = (0.0, 180.0)
+DEFAULT_POINTS = 10**7
+DEFAULT_SEEDS = 4
+
+# Grid cells per block (rows × columns), bounds the memory of one worker
+BLOCK_CELLS = 2**20
+
+# Nelder-Mead stopping criteria
+SIMPLEX_TOLERANCE = 1e-12
+MAX_ITERATIONS = 2000
+
+# Quark moments of one evaluation
+QuarkMoments = namedtuple('QuarkMoments', ['up', 'down'])
+
+DEFAULT_QUARKS = QuarkMoments(MU_UP, MU_DOWN)
+
+# Best grid point: angles in degrees and cost
+GridPoint = namedtuple('GridPoint', ['theta1', 'theta2', 'cost'])
+
+# Refined fit: angles, predicted moments and ratio, cost, simplex iterations
+GeometryFit = namedtuple('GeometryFit', ['theta1', 'theta2', 'mu_p', 'mu_n', 'ratio',
+                                         'cost', 'iterations'])
+
+GeometrySearch = namedtuple('GeometrySearch', ['quarks', 'points', 'spacing', 'grid', 'fit',
+                                               'grid_seconds', 'refine_seconds', 'workers'])
+
+# =============================================================================
+# MODEL
+# =============================================================================
+
+
+def nucleon_moment(like, odd, theta):
+    """μ(θ) = (4 μ_like cos(θ/2) - μ_odd) / 3, θ in degrees (array or scalar)."""
+    return (4 * like * np.cos(np.radians(theta) / 2) - odd) / 3
+
+
+def proton_moment(theta1, quarks=DEFAULT_QUARKS):
+    """Proton (uud) moment for opening angle θ₁ at the d quark."""
+    return nucleon_moment(quarks.up, quarks.down, theta1)
+
+
+def neutron_moment(theta2, quarks=DEFAULT_QUARKS):
+    """Neutron (udd) moment for opening angle θ₂ at the u quark."""
+    return nucleon_moment(quarks.down, quarks.up, theta2)
+
+
+def cost(mu_p, mu_n):
+    """Sum of squared relative residuals of μp, μn and μp/μn (broadcasts)."""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ratio = mu_p / mu_n
+    total = ((mu_p - MU_PROTON) / MU_PROTON) ** 2 + ((mu_n - MU_NEUTRON) / MU_NEUTRON) ** 2 \
+        + ((ratio - MU_PROTON / MU_NEUTRON) / (MU_PROTON / MU_NEUTRON)) ** 2
+    return np.where(np.isfinite(total), total, np.inf)
+
+
+def angle_cost(angles, quarks=DEFAULT_QUARKS):
+    """cost at (θ₁, θ₂), clipped to ANGLE_RANGE."""
+    theta1, theta2 = np.clip(angles, *ANGLE_RANGE)
+    return float(cost(proton_moment(theta1, quarks), neutron_moment(theta2, quarks)))
+
+
+def exact_angles(quarks=DEFAULT_QUARKS):
+    """
+    Closed-form angles reproducing μp and μn, each None when out of reach.
+
+    Returns:
+    --------
+    tuple : (θ₁, θ₂) in degrees
+    """
+    angles = []
+    for like, odd, target in ((quarks.up, quarks.down, MU_PROTON),
+                              (quarks.down, quarks.up, MU_NEUTRON)):
+        c = (3 * target + odd) / (4 * like)
+        angles.append(math.degrees(2 * math.acos(c)) if 0 <= c <= 1 else None)
+    return tuple(angles)
+
+# =============================================================================
+# GRID SEARCH
+# =============================================================================
+
+
+def grid_angles(side):
+    """The `side` angles of one grid axis."""
+    return np.linspace(*ANGLE_RANGE, side)
+
+
+def _grid_block(task):
+    """
+    Cost of rows [start, stop) of the grid against every column.
+
+    Returns (costs, rows, columns) of the block's `keep` best cells.
+    """
+    start, stop, side, quarks, keep = task
+    angles = grid_angles(side)
+    mu_p = proton_moment(angles[start:stop], quarks)[:, None]
+    mu_n = neutron_moment(angles, quarks)[None, :]
+    block = cost(mu_p, mu_n).ravel()
+    keep = min(keep, block.size)
+    best = np.argpartition(block, keep - 1)[:keep]
+    rows, columns = np.divmod(best, side)
+    return block[best], rows + start, columns
+
+
+def grid_search(points=DEFAULT_POINTS, quarks=DEFAULT_QUARKS,
+                workers=None, keep=DEFAULT_SEEDS):
+    """
+    Best cells of a side × side grid (side² ≥ points), row blocks per process.
+
+    Parameters:
+    -----------
+    points : int
+        Minimum number of grid points.
+    quarks : QuarkMoments
+    workers : int or None
+        Process pool size (None = os.cpu_count(), 1 = in-process).
+    keep : int
+        Number of best cells returned.
+
+    Returns:
+    --------
+    tuple : (list of GridPoint by cost, side)
+    """
+    side = math.isqrt(max(int(points) - 1, 0)) + 1
+    rows = max(1, BLOCK_CELLS // side)
+    tasks = [(start, min(start + rows, side), side, quarks, keep)
+             for start in range(0, side, rows)]
+    workers = os.cpu_count() if workers is None else workers
+    if workers <= 1 or len(tasks) <= 1:
+        results = [_grid_block(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_grid_block, tasks))
+
+    costs = np.concatenate([r[0] for r in results])
+    rows = np.concatenate([r[1] for r in results])
+    columns = np.concatenate([r[2] for r in results])
+    angles = grid_angles(side)
+    order = np.argsort(costs, kind='stable')[:keep]
+    return [GridPoint(float(angles[rows[i]]), float(angles[columns[i]]), float(costs[i]))
+            for i in order], side
+
+# =============================================================================
+# LOCAL REFINEMENT
+# =============================================================================
+
+
+def nelder_mead(f, x0, step, tolerance=SIMPLEX_TOLERANCE, max_iterations=MAX_ITERATIONS):
+    """
+    Minimize f from x0 with the Nelder-Mead simplex (standard coefficients).
+
+    Returns:
+    --------
+    tuple : (x, f(x), iterations)
+    """
+    x0 = np.asarray(x0, dtype=float)
+    simplex = np.vstack([x0, x0 + np.diag(np.full(len(x0), float(step)))])
+    values = np.array([f(x) for x in simplex])
+    iterations = 0
+    while iterations < max_iterations:
+        order = np.argsort(values)
+        simplex, values = simplex[order], values[order]
+        if values[-1] - values[0] <= tolerance * (abs(values[0]) + tolerance):
+            break
+        iterations += 1
+        centroid = simplex[:-1].mean(axis=0)
+        reflected = centroid + (centroid - simplex[-1])
+        f_reflected = f(reflected)
+        if f_reflected < values[0]:
+            expanded = centroid + 2 * (centroid - simplex[-1])
+            f_expanded = f(expanded)
+            if f_expanded < f_reflected:
+                simplex[-1], values[-1] = expanded, f_expanded
+            else:
+                simplex[-1], values[-1] = reflected, f_reflected
+        elif f_reflected < values[-2]:
+            simplex[-1], values[-1] = reflected, f_reflected
+        else:
+            outside = f_reflected < values[-1]
+            contracted = centroid + (0.5 if outside else -0.5) * (centroid - simplex[-1])
+            f_contracted = f(contracted)
+            if f_contracted < min(f_reflected, values[-1]):
+                simplex[-1], values[-1] = contracted, f_contracted
+            else:
+                simplex[1:] = simplex[0] + 0.5 * (simplex[1:] - simplex[0])
+                values[1:] = [f(x) for x in simplex[1:]]
+    best = int(np.argmin(values))
+    return simplex[best], float(values[best]), iterations
+
+
+def refine(seeds, spacing, quarks=DEFAULT_QUARKS):
+    """Nelder-Mead from every seed (step = grid spacing); the best result as a GeometryFit."""
+    best = None
+    for seed in seeds:
+        x, value, iterations = nelder_mead(lambda a: angle_cost(a, quarks),
+                                           (seed.theta1, seed.theta2), spacing)
+        if best is None or value < best[1]:
+            best = (np.clip(x, *ANGLE_RANGE), value, iterations)
+    (theta1, theta2), value, iterations = best
+    mu_p, mu_n = float(proton_moment(theta1, quarks)), float(neutron_moment(theta2, quarks))
+    return GeometryFit(float(theta1), float(theta2), mu_p, mu_n, mu_p / mu_n, value, iterations)
+
+
+def search(points=DEFAULT_POINTS, quarks=DEFAULT_QUARKS, workers=None,
+           seeds=DEFAULT_SEEDS):
+    """Grid search followed by local refinement of its `seeds` best cells."""
+    workers = os.cpu_count() if workers is None else workers
+    start = time.perf_counter()
+    grid, side = grid_search(points, quarks, workers, seeds)
+    grid_seconds = time.perf_counter() - start
+    spacing = (ANGLE_RANGE[1] - ANGLE_RANGE[0]) / (side - 1)
+    start = time.perf_counter()
+    fit = refine(grid, spacing, quarks)
+    return GeometrySearch(quarks, side * side, spacing, grid, fit, grid_seconds,
+                          time.perf_counter() - start, workers)
+
+
+def main(argv=None):
+    """Run the search and print the best-fit angles against CODATA."""
+    parser = argparse.ArgumentParser(
+        description="Fit the quark-triangle angles θ₁, θ₂ to the nucleon magnetic moments.")
+    parser.add_argument('--points', type=float, default=DEFAULT_POINTS,
+                        help="minimum number of grid points (default: %(default).0e)")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="process pool size (default: all CPUs)")
+    parser.add_argument('--seeds', type=int, default=DEFAULT_SEEDS,
+                        help="grid points refined locally (default: %(default)s)")
+    parser.add_argument('--mu-up', type=float, default=MU_UP,
+                        help="up-quark moment (default: %(default)s)")
+    parser.add_argument('--mu-down', type=float, default=MU_DOWN,
+                        help="down-quark moment (default: %(default)s)")
+    args = parser.parse_args(argv)
+    if args.points < 4 or args.seeds < 1:
+        parser.error("--points must be at least 4 and --seeds at least 1")
+
+    quarks = QuarkMoments(args.mu_up, args.mu_down)
+    result = search(int(args.points), quarks, args.workers, args.seeds)
+    fit = result.fit
+
+    print("\n" + "="*78)
+    print(f"QUARK GEOMETRY: μu = {quarks.up:+.2f}, μd = {quarks.down:+.2f}")
+    print("="*78)
+    print(f"\nGrid: {result.points:,} points, spacing {result.spacing:.4f}°, "
+          f"{result.workers} worker(s), {result.grid_seconds:.2f} s")
+    print(f"{'':>16} | {'θ₁ (°)':>9} | {'θ₂ (°)':>9} | {'Cost':>10}")
+    print("-"*78)
+    for i, point in enumerate(result.grid, 1):
+        print(f"{'Grid #' + str(i):>16} | {point.theta1:9.4f} | {point.theta2:9.4f} | "
+              f"{point.cost:10.3e}")
+    print(f"{'Nelder-Mead':>16} | {fit.theta1:9.4f} | {fit.theta2:9.4f} | {fit.cost:10.3e}"
+          f"   ({fit.iterations} iterations, {result.refine_seconds * 1000:.1f} ms)")
+    exact = exact_angles(quarks)
+    print(f"{'Closed form':>16} | "
+          + " | ".join(f"{a:9.4f}" if a is not None else f"{'—':>9}" for a in exact))
+
+    print(f"\n{'':>16} | {'Model':>9} | {'CODATA':>9} | {'Error':>8}")
+    print("-"*78)
+    for name, value, target in (("μp", fit.mu_p, MU_PROTON), ("μn", fit.mu_n, MU_NEUTRON),
+                                ("μp/μn", fit.ratio, MU_PROTON / MU_NEUTRON)):
+        print(f"{name:>16} | {value:9.5f} | {target:9.5f} | {(value - target) / target:+8.2e}")
+
+    theta1, theta2 = DOCUMENT_ANGLES
+    mu_p, mu_n = float(proton_moment(theta1, quarks)), float(neutron_moment(theta2, quarks))
+    print(f"\nDocument angles θ₁ = {theta1}°, θ₂ = {theta2}°: μp = {mu_p:.4f}, "
+          f"μn = {mu_n:.4f}, cost = {float(cost(mu_p, mu_n)):.3e}")
+    print("="*78 + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
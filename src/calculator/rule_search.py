@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Rule Search: (c_start, c_high_j) assignments that reproduce the magic numbers
+==============================================================================
+
+Enumerates candidate (c_start, c_high_j) pairs shell by shell and keeps every
+chain 0 → ... that lands exactly on 2, 8, 20, 28, 50, 82, 126. A branch is
+pruned as soon as its partial chain overshoots the next known magic number.
+The first-shell branches are spread over a process pool and surviving rule
+sets are streamed out as they are found.
+
+Author: André Luís Tomaz Dionísio
+Institution: EPHEC Brussels, Belgium
+Date: December 2025
+
+Usage:
+    python rule_search.py                      # strict: one shell per magic number
+    python rule_search.py --extra-shells 1     # allow one non-magic intermediate closure
+    python rule_search.py --max-c 24 --jsonl rules.jsonl
+"""
+
+import argparse
+import bisect
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from magic_number_calculator import calculate_delta_n
+from magic_sequence import KNOWN_MAGIC_NUMBERS, published_rule
+
+DEFAULT_MAX_C = 20
+
+
+def candidate_pairs(max_c=DEFAULT_MAX_C):
+    """
+    All (c_start, c_high_j) pairs with even capacities up to max_c.
+
+    c_start may be 0 (no decreasing sequence); c_high_j must be positive.
+    """
+    capacities = range(0, max_c + 1, 2)
+    return [(c_start, c_high_j)
+            for c_start in capacities
+            for c_high_j in capacities
+            if c_high_j > 0]
+
+
+def _search_branch(first_pair, pairs, targets, max_shells, monotonic):
+    """
+    Depth-first search of every chain that starts with `first_pair`.
+
+    Returns (rules, evaluated) where rules is a list of tuples of pairs and
+    evaluated counts every (partial chain, pair) candidate examined.
+    """
+    totals = [(c_start, c_high_j, calculate_delta_n(c_start) + c_high_j)
+              for c_start, c_high_j in pairs]
+    rules = []
+    evaluated = 1
+    chain = [first_pair]
+
+    first_total = calculate_delta_n(first_pair[0]) + first_pair[1]
+    if first_total > targets[0]:
+        return rules, evaluated
+
+    def extend(M, hit, last_high_j):
+        nonlocal evaluated
+        if hit == len(targets):
+            rules.append(tuple(chain))
+            return
+        # Not enough shells left to reach the remaining magic numbers
+        if max_shells - len(chain) < len(targets) - hit:
+            return
+        target = targets[hit]
+        for c_start, c_high_j, total in totals:
+            evaluated += 1
+            if monotonic and c_high_j < last_high_j:
+                continue
+            M_next = M + total
+            if M_next > target:
+                continue
+            if M_next < target and max_shells - len(chain) - 1 < len(targets) - hit:
+                continue
+            chain.append((c_start, c_high_j))
+            extend(M_next, hit + (M_next == target), c_high_j)
+            chain.pop()
+
+    hit = 1 if first_total == targets[0] else 0
+    extend(first_total, hit, first_pair[1])
+    return rules, evaluated
+
+
+class SearchStats:
+    """Running counters for a search."""
+
+    def __init__(self):
+        self.evaluated = 0
+        self.found = 0
+        self.branches = 0
+        self.start = time.perf_counter()
+
+    @property
+    def elapsed(self):
+        return time.perf_counter() - self.start
+
+    @property
+    def rate(self):
+        return self.evaluated / self.elapsed if self.elapsed > 0 else 0.0
+
+
+def search_rules(targets=KNOWN_MAGIC_NUMBERS, max_c=DEFAULT_MAX_C,
+                 extra_shells=0, monotonic=False, workers=None, stats=None):
+    """
+    Stream every rule set (one (c_start, c_high_j) pair per shell) whose
+    chain reproduces `targets` in order.
+
+    Parameters:
+    -----------
+    targets : sequence of int
+        Magic numbers that must all be hit, in order.
+    max_c : int
+        Largest capacity tried for c_start and c_high_j.
+    extra_shells : int
+        Number of additional, non-magic closures allowed in a chain.
+    monotonic : bool
+        Require c_high_j to be non-decreasing along the chain.
+    workers : int or None
+        Process pool size (None = os.cpu_count(), 1 = run in-process).
+    stats : SearchStats or None
+        Updated in place with evaluated/found counts.
+
+    Yields:
+    -------
+    tuple of (c_start, c_high_j) pairs
+    """
+    targets = tuple(targets)
+    pairs = candidate_pairs(max_c)
+    max_shells = len(targets) + extra_shells
+    stats = stats if stats is not None else SearchStats()
+    args = (pairs, targets, max_shells, monotonic)
+
+    if workers == 1:
+        results = (_search_branch(first, *args) for first in pairs)
+        for rules, evaluated in results:
+            stats.evaluated += evaluated
+            stats.branches += 1
+            for rule in rules:
+                stats.found += 1
+                yield rule
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_search_branch, first, *args) for first in pairs]
+        for future in as_completed(futures):
+            rules, evaluated = future.result()
+            stats.evaluated += evaluated
+            stats.branches += 1
+            for rule in rules:
+                stats.found += 1
+                yield rule
+
+
+def distance_from_published(rule):
+    """Number of shells whose (c_start, c_high_j) differ from published_rule."""
+    return sum(1 for index, pair in enumerate(rule)
+               if pair != published_rule(index))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Search (c_start, c_high_j) rules reproducing the magic numbers.")
+    parser.add_argument('--max-c', type=int, default=DEFAULT_MAX_C,
+                        help="largest capacity tried (default: %(default)s)")
+    parser.add_argument('--extra-shells', type=int, default=0,
+                        help="non-magic intermediate closures allowed")
+    parser.add_argument('--monotonic', action='store_true',
+                        help="require non-decreasing c_high_j")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="process pool size (default: all CPUs)")
+    parser.add_argument('--jsonl', metavar='PATH',
+                        help="stream surviving rules to PATH ('-' for stdout)")
+    parser.add_argument('--show', type=int, default=10,
+                        help="rules closest to the published pattern to print")
+    args = parser.parse_args()
+
+    stats = SearchStats()
+    if args.jsonl == '-':
+        out = sys.stdout
+    elif args.jsonl:
+        out = open(args.jsonl, 'w')
+    else:
+        out = None
+
+    closest = []
+    try:
+        for rule in search_rules(max_c=args.max_c, extra_shells=args.extra_shells,
+                                 monotonic=args.monotonic, workers=args.workers,
+                                 stats=stats):
+            distance = distance_from_published(rule)
+            if out is not None:
+                out.write(json.dumps({'rule': rule, 'distance': distance}) + "\n")
+            bisect.insort(closest, (distance, rule))
+            del closest[args.show:]
+    finally:
+        if out is not None and out is not sys.stdout:
+            out.close()
+
+    report = sys.stderr if out is sys.stdout else sys.stdout
+    print("\n" + "="*70, file=report)
+    print("RULE SEARCH: reproducing " + ", ".join(map(str, KNOWN_MAGIC_NUMBERS)),
+          file=report)
+    print("="*70, file=report)
+    print(f"\nCandidates evaluated: {stats.evaluated:,}", file=report)
+    print(f"Rule sets found:      {stats.found:,}", file=report)
+    print(f"Elapsed:              {stats.elapsed:.2f} s "
+          f"({stats.rate:,.0f} candidates/s, {os.cpu_count()} CPUs)", file=report)
+    print("\nClosest to the published pattern (distance = shells changed):",
+          file=report)
+    for distance, rule in closest:
+        pairs = " ".join(f"({c_start},{c_high_j})" for c_start, c_high_j in rule)
+        print(f"  {distance:2} | {pairs}", file=report)
+    print("="*70 + "\n", file=report)
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
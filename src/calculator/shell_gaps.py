@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Shell-Gap Detection
+===================
+
+Two-nucleon separation energies and shell-gap indicators over the whole
+mass table, computed on the dense (Z, N) grid without per-nuclide loops:
+
+    S2n(Z, N) = B(Z, N) - B(Z, N-2)
+    δ2n(Z, N) = S2n(Z, N) - S2n(Z, N+2)
+
+(and S2p, δ2p along Z). A shell closure at N shows up as a peak of δ2n,
+because S2n drops sharply once the shell is full. The peaks are located
+automatically and compared with the magic numbers from calculate_next_magic.
+
+Author: André Luís Tomaz Dionísio
+Institution: EPHEC Brussels, Belgium
+Date: December 2025
+
+Usage:
+    python shell_gaps.py [path/to/mass.mas20]
+"""
+
+import sys
+import time
+import warnings
+from collections import namedtuple
+
+import numpy as np
+
+from magic_sequence import MagicSequence
+from nuclide_index import NuclideIndex
+
+ShellGaps = namedtuple('ShellGaps', ['B', 'S2n', 'S2p', 'delta_2n', 'delta_2p'])
+
+PeakComparison = namedtuple('PeakComparison',
+                            ['peaks', 'predicted', 'matched', 'missed', 'extra'])
+
+
+def total_binding_energy(index):
+    """Total binding energy B(Z, N) in MeV on the dense grid (NaN if unknown)."""
+    Z, N = np.indices(index.grid.shape)
+    return index.dense('be_per_a') * (Z + N)
+
+
+def _two_step_difference(values, axis):
+    """values[..., i] - values[..., i-2] along axis, NaN for the first two."""
+    result = np.full_like(values, np.nan)
+    head = [slice(None)] * values.ndim
+    tail = [slice(None)] * values.ndim
+    head[axis] = slice(2, None)
+    tail[axis] = slice(None, -2)
+    result[tuple(head)] = values[tuple(head)] - values[tuple(tail)]
+    return result
+
+
+def _gap_indicator(separation, axis):
+    """δ(i) = S(i) - S(i+2) along axis, NaN for the last two."""
+    result = np.full_like(separation, np.nan)
+    head = [slice(None)] * separation.ndim
+    tail = [slice(None)] * separation.ndim
+    head[axis] = slice(None, -2)
+    tail[axis] = slice(2, None)
+    result[tuple(head)] = separation[tuple(head)] - separation[tuple(tail)]
+    return result
+
+
+def compute_shell_gaps(index):
+    """S2n, S2p, δ2n and δ2p on the dense (Z, N) grid of `index`."""
+    B = total_binding_energy(index)
+    S2n = _two_step_difference(B, axis=1)
+    S2p = _two_step_difference(B, axis=0)
+    return ShellGaps(B, S2n, S2p, _gap_indicator(S2n, axis=1), _gap_indicator(S2p, axis=0))
+
+
+def gap_profile(delta, axis):
+    """
+    Median shell-gap indicator per nucleon number.
+
+    axis=0 collapses over Z (neutron profile, indexed by N);
+    axis=1 collapses over N (proton profile, indexed by Z).
+    """
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', category=RuntimeWarning)
+        return np.nanmedian(delta, axis=axis)
+
+
+def find_peaks(profile, threshold=None, min_value=None, even_only=True):
+    """
+    Indices of local maxima of `profile` that stand out from the rest.
+
+    A peak must exceed both neighbours two steps away (same parity) and
+    `threshold` (default: median + 2 × MAD of the finite profile values).
+    With even_only, odd nucleon numbers are ignored: δ2n at N_magic + 1
+    straddles the closure and would otherwise show up as a second peak.
+    """
+    finite = np.isfinite(profile)
+    if even_only:
+        finite[1::2] = False
+    if not finite.any():
+        return np.empty(0, dtype=int)
+    if threshold is None:
+        values = profile[finite]
+        median = np.median(values)
+        mad = np.median(np.abs(values - median))
+        threshold = median + 2.0 * 1.4826 * mad
+    if min_value is not None:
+        threshold = max(threshold, min_value)
+
+    padded = np.pad(profile, 2, constant_values=-np.inf)
+    padded[~np.isfinite(padded)] = -np.inf
+    padded[2:-2][~finite] = -np.inf
+    centre = padded[2:-2]
+    is_peak = ((centre > padded[:-4]) & (centre >= padded[4:])
+               & (centre > threshold) & finite)
+    return np.flatnonzero(is_peak)
+
+
+def compare_with_pattern(peaks, limit, sequence=None):
+    """Compare detected peaks with magic numbers up to `limit`."""
+    sequence = sequence or MagicSequence()
+    predicted = []
+    for magic in sequence.magic_numbers():
+        if magic > limit:
+            break
+        if magic > 0:
+            predicted.append(magic)
+
+    peak_set = set(int(p) for p in peaks)
+    matched = [m for m in predicted if m in peak_set]
+    missed = [m for m in predicted if m not in peak_set]
+    extra = sorted(peak_set.difference(predicted))
+    return PeakComparison(sorted(peak_set), predicted, matched, missed, extra)
+
+
+def detect_shell_closures(index):
+    """Full pipeline: gaps → profiles → peaks → comparison for N and Z."""
+    gaps = compute_shell_gaps(index)
+    neutron_profile = gap_profile(gaps.delta_2n, axis=0)
+    proton_profile = gap_profile(gaps.delta_2p, axis=1)
+    neutrons = compare_with_pattern(find_peaks(neutron_profile), index.n_max)
+    protons = compare_with_pattern(find_peaks(proton_profile), index.z_max)
+    return gaps, neutrons, protons
+
+
+def main():
+    """Detect shell closures over the AME2020 table and print the comparison."""
+    path = sys.argv[1] if len(sys.argv) > 1 else None
+    index = NuclideIndex.load(path)
+
+    start = time.perf_counter()
+    _, neutrons, protons = detect_shell_closures(index)
+    elapsed = time.perf_counter() - start
+
+    print("\n" + "="*70)
+    print("SHELL-GAP DETECTION (δ2n / δ2p peaks vs. predicted magic numbers)")
+    print("="*70)
+    for name, result in (("Neutrons (δ2n)", neutrons), ("Protons (δ2p)", protons)):
+        print(f"\n{name}:")
+        print(f"  Peaks found: {result.peaks}")
+        print(f"  Predicted:   {result.predicted}")
+        print(f"  Matched:     {result.matched}")
+        print(f"  Missed:      {result.missed}")
+        print(f"  Extra:       {result.extra}")
+    print(f"\nNuclides: {len(index.table)}   Time: {elapsed * 1000:.1f} ms")
+    print("="*70 + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
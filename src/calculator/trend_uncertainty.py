@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+Trend Uncertainty: bootstrap and Monte Carlo errors for the Δn–BE/A fit
+=======================================================================
+
+Resamples the straight-line fit of Figure 1 many times (10^5–10^6
+replicates) as one batched least-squares solve per chunk instead of a Python
+loop of np.polyfit calls:
+
+- bootstrap: resample the nuclides with replacement (multinomial weights)
+- noise:     perturb BE/A with Gaussian measurement noise
+- both:      both at once
+
+For a line y = a·x + b the weighted normal equations have a closed form, so a
+chunk of R replicates only needs a few (R × n) array reductions. Replicates
+are drawn in fixed blocks of RNG_BLOCK, each from its own child seed, and a
+chunk is a run of whole blocks; results therefore depend on `seed` only, not
+on the chunk size or the number of worker processes.
+
+The nuclides of the Figure 1 trend (nuclear_data, TREND_OUTLIERS) are
+defined here and shared with generate_figures.py.
+
+Author: André Luís Tomaz Dionísio
+Institution: EPHEC Brussels, Belgium
+Date: December 2025
+"""
+
+import argparse
+import math
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from nuclide_index import NuclideIndex, MISSING
+
+DEFAULT_CHUNK_SIZE = 50_000
+DEFAULT_LEVEL = 0.95
+
+# Replicates per random stream; fixed so that the draws do not depend on
+# chunk_size (which only bounds memory)
+RNG_BLOCK = 1_000
+
+# Nuclides shown in Figure 1. BE/A, A, N and Z come from the AME2020 mass
+# table (see mass_table.py); only the pattern parameters are listed here.
+# Magic vs. subshell is derived from N and Z.
+FigureNuclide = namedtuple('FigureNuclide',
+                           ['Z', 'N', 'c_start', 'delta_n', 'label'])
+
+nuclear_data = [
+    FigureNuclide(2, 2, 2, 2, r'$^4$He'),
+    FigureNuclide(4, 4, 4, 6, r'$^8$Be'),
+    FigureNuclide(6, 6, 4, 6, r'$^{12}$C'),
+    FigureNuclide(8, 8, 4, 6, r'$^{16}$O'),
+    FigureNuclide(10, 10, 6, 12, r'$^{20}$Ne'),
+    FigureNuclide(14, 14, 6, 12, r'$^{28}$Si'),
+    FigureNuclide(20, 20, 2, 2, r'$^{40}$Ca'),
+    FigureNuclide(28, 28, 6, 12, r'$^{56}$Ni'),
+    FigureNuclide(50, 50, 8, 20, r'$^{100}$Sn'),
+    FigureNuclide(82, 126, 10, 30, r'$^{208}$Pb'),
+]
+
+# Nuclide excluded from the trend line
+TREND_OUTLIERS = {(4, 4)}  # 8Be
+
+TrendUncertainty = namedtuple('TrendUncertainty', [
+    'slope', 'intercept',            # best fit
+    'slope_ci', 'intercept_ci',      # (low, high) at `level`
+    'x', 'lower', 'upper',           # confidence band of the line
+    'level', 'replicates',
+])
+
+
+def fit_line(x, y, w=None):
+    """
+    Batched weighted least-squares line fit.
+
+    x : (n,) abscissae shared by all replicates
+    y : (n,) or (R, n) ordinates
+    w : None, (n,) or (R, n) non-negative weights
+
+    Returns (slope, intercept), each of shape () or (R,).
+    Degenerate replicates (all weight on one x value) give NaN.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    w = np.ones_like(x) if w is None else np.asarray(w, dtype=float)
+
+    S = w.sum(axis=-1)
+    Sx = (w * x).sum(axis=-1)
+    Sxx = (w * x * x).sum(axis=-1)
+    Sy = (w * y).sum(axis=-1)
+    Sxy = (w * x * y).sum(axis=-1)
+
+    D = S * Sxx - Sx * Sx
+    with np.errstate(divide='ignore', invalid='ignore'):
+        degenerate = np.abs(D) <= 1e-12 * np.maximum(S * Sxx, 1.0)
+        slope = np.where(degenerate, np.nan, (S * Sxy - Sx * Sy) / D)
+        intercept = (Sy - slope * Sx) / S
+    return slope, intercept
+
+
+def _draw_block(x, y, sigma, size, mode, seed):
+    """Weights (or None) and ordinates of one block of `size` replicates."""
+    rng = np.random.default_rng(seed)
+    n = len(x)
+    w = None
+    Y = y
+    if mode in ('bootstrap', 'both'):
+        # Multinomial counts via one bincount over the drawn indices
+        picks = rng.integers(0, n, (size, n)) + n * np.arange(size)[:, None]
+        w = np.bincount(picks.ravel(), minlength=size * n).reshape(size, n).astype(float)
+    if mode in ('noise', 'both'):
+        Y = y + sigma * rng.standard_normal((size, n))
+    elif w is not None:
+        Y = np.broadcast_to(y, w.shape)
+    return w, Y
+
+
+def _replicate_chunk(x, y, sigma, blocks, mode):
+    """Slopes and intercepts for one chunk, given as (size, seed) blocks."""
+    draws = [_draw_block(x, y, sigma, size, mode, seed) for size, seed in blocks]
+    w = None if draws[0][0] is None else np.concatenate([d[0] for d in draws])
+    Y = np.concatenate([np.broadcast_to(d[1], (size, len(x)))
+                        for d, (size, _) in zip(draws, blocks)])
+    return fit_line(x, Y, w)
+
+
+def _replicate_chunks(x, y, sigma, chunks, mode):
+    """Run several chunks in one process (worker entry point)."""
+    results = [_replicate_chunk(x, y, sigma, blocks, mode) for blocks in chunks]
+    return (np.concatenate([r[0] for r in results]),
+            np.concatenate([r[1] for r in results]))
+
+
+def resample_fits(x, y, replicates=100_000, sigma=None, mode='bootstrap',
+                  chunk_size=DEFAULT_CHUNK_SIZE, seed=None, workers=1):
+    """
+    Slopes and intercepts of `replicates` resampled line fits.
+
+    Parameters:
+    -----------
+    x, y : array_like
+        Data points of the fit.
+    replicates : int
+        Number of bootstrap / Monte Carlo replicates.
+    sigma : float or array_like or None
+        Measurement uncertainty of y for the noise modes; NaN or None entries
+        fall back to the residual standard deviation of the best fit.
+    mode : {'bootstrap', 'noise', 'both'}
+    chunk_size : int
+        Replicates per batched solve (rounded to whole RNG_BLOCKs); bounds
+        memory at ~3 × chunk_size × n floats and does not change the draws.
+    seed : int or None
+        Seed of the SeedSequence from which every RNG_BLOCK derives its RNG.
+    workers : int
+        Number of worker processes (1 = in-process).
+
+    Returns:
+    --------
+    (slopes, intercepts) : arrays with degenerate replicates removed
+    """
+    if mode not in ('bootstrap', 'noise', 'both'):
+        raise ValueError(f"Unknown resampling mode: {mode}")
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+
+    slope, intercept = fit_line(x, y)
+    residual_sd = np.std(y - (slope * x + intercept), ddof=2) if len(x) > 2 else 0.0
+    sigma = np.broadcast_to(np.nan if sigma is None else np.asarray(sigma, float), x.shape)
+    sigma = np.where(np.isfinite(sigma), sigma, residual_sd)
+
+    sizes = [min(RNG_BLOCK, replicates - start)
+             for start in range(0, replicates, RNG_BLOCK)]
+    blocks = list(zip(sizes, np.random.SeedSequence(seed).spawn(len(sizes))))
+    per_chunk = max(1, chunk_size // RNG_BLOCK)
+    chunks = [blocks[i:i + per_chunk] for i in range(0, len(blocks), per_chunk)]
+
+    if workers <= 1 or len(chunks) == 1:
+        slopes, intercepts = _replicate_chunks(x, y, sigma, chunks, mode)
+    else:
+        # Contiguous runs of chunks keep the replicates in seed order
+        step = math.ceil(len(chunks) / workers)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_replicate_chunks, x, y, sigma, chunks[i:i + step], mode)
+                       for i in range(0, len(chunks), step)]
+            parts = [f.result() for f in futures]
+        slopes = np.concatenate([p[0] for p in parts])
+        intercepts = np.concatenate([p[1] for p in parts])
+
+    keep = np.isfinite(slopes) & np.isfinite(intercepts)
+    return slopes[keep], intercepts[keep]
+
+
+def confidence_band(slopes, intercepts, x_grid, level=DEFAULT_LEVEL,
+                    chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Pointwise (lower, upper) percentiles of slope·x + intercept on x_grid.
+
+    The grid is processed in blocks so that at most ~chunk_size × 16 values
+    are materialized at once.
+    """
+    x_grid = np.asarray(x_grid, dtype=float)
+    alpha = (1.0 - level) / 2.0
+    block = max(1, (16 * chunk_size) // max(len(slopes), 1))
+    lower = np.empty_like(x_grid)
+    upper = np.empty_like(x_grid)
+    for start in range(0, len(x_grid), block):
+        xs = x_grid[start:start + block]
+        lines = slopes[:, None] * xs[None, :] + intercepts[:, None]
+        lower[start:start + block], upper[start:start + block] = np.quantile(
+            lines, [alpha, 1.0 - alpha], axis=0)
+    return lower, upper
+
+
+def trend_uncertainty(x, y, x_grid, replicates=100_000, sigma=None,
+                      mode='bootstrap', level=DEFAULT_LEVEL,
+                      chunk_size=DEFAULT_CHUNK_SIZE, seed=None, workers=1):
+    """Best fit plus slope/intercept intervals and the line's confidence band."""
+    slope, intercept = fit_line(x, y)
+    slopes, intercepts = resample_fits(x, y, replicates, sigma, mode,
+                                       chunk_size, seed, workers)
+    alpha = (1.0 - level) / 2.0
+    slope_ci = tuple(np.quantile(slopes, [alpha, 1.0 - alpha]))
+    intercept_ci = tuple(np.quantile(intercepts, [alpha, 1.0 - alpha]))
+    lower, upper = confidence_band(slopes, intercepts, x_grid, level, chunk_size)
+    return TrendUncertainty(float(slope), float(intercept), slope_ci, intercept_ci,
+                            np.asarray(x_grid, dtype=float), lower, upper,
+                            level, len(slopes))
+
+
+def main():
+    """Resample the Figure 1 trend and report the intervals."""
+    parser = argparse.ArgumentParser(description="Bootstrap the Δn–BE/A trend.")
+    parser.add_argument('--replicates', type=int, default=1_000_000)
+    parser.add_argument('--mode', choices=['bootstrap', 'noise', 'both'],
+                        default='bootstrap')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--workers', type=int, default=1)
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE)
+    args = parser.parse_args()
+
+    # Same points as the trend line of Figure 1
+    points = [d for d in nuclear_data if (d.Z, d.N) not in TREND_OUTLIERS]
+    index = NuclideIndex.load()
+    rows = index.rows([d.Z for d in points], [d.N for d in points])
+    delta_n = np.array([d.delta_n for d in points])
+    found = rows != MISSING
+    be = index.table['be_per_a'][rows[found]]
+    sigma = index.table['be_per_a_unc'][rows[found]]
+    finite = np.isfinite(be)
+
+    start = time.perf_counter()
+    result = trend_uncertainty(delta_n[found][finite], be[finite], np.linspace(2, 30, 29),
+                               args.replicates, sigma[finite], args.mode,
+                               chunk_size=args.chunk_size, seed=args.seed,
+                               workers=args.workers)
+    elapsed = time.perf_counter() - start
+
+    print("\n" + "="*60)
+    print(f"TREND UNCERTAINTY ({args.mode}, {result.replicates:,} replicates)")
+    print("="*60)
+    print(f"  Slope:     {result.slope:.5f} MeV  "
+          f"[{result.slope_ci[0]:.5f}, {result.slope_ci[1]:.5f}]")
+    print(f"  Intercept: {result.intercept:.4f} MeV  "
+          f"[{result.intercept_ci[0]:.4f}, {result.intercept_ci[1]:.4f}]")
+    print(f"  Time:      {elapsed:.2f} s ({args.workers} worker(s))")
+    print("="*60 + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
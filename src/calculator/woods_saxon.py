@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+"""
+Woods-Saxon Single-Particle Solver
+Mean-field level schemes to compare with the phenomenological Δn pattern.
+
+Author: André Luís Tomaz Dionísio
+Institution: EPHEC Brussels, Belgium
+Date: December 2025
+
+For each nucleus (Z, N) and nucleon type the radial equation
+
+    -ħ²/2m u'' + [V(r) + V_so(r) <l·s> + ħ² l(l+1)/(2m r²) + V_C(r)] u = E u
+
+is solved on a uniform grid (u(0) = u(r_max) = 0) with the Bohr-Mottelson
+parameterization:
+
+    V(r)    = -(V0 ± V1 (N - Z)/A) f(r),     f = 1 / (1 + exp((r - R)/a))
+    V_so(r) =  λ V0 r0² (1/r) df/dr          (lowers j = l + 1/2)
+    V_C(r)  =  Coulomb field of a uniform sphere of charge Z - 1 (protons)
+
+with R = r0 A^(1/3) (+ for protons, - for neutrons).
+
+The finite-difference Hamiltonian of every (l, j) block is tridiagonal with
+the same off-diagonal, so all bound levels of many nuclei are found together:
+one Sturm count at E = 0 gives the number of bound states per block, then a
+vectorized bisection on the Sturm sequence converges every (block, level)
+pair at once. NumPy only, no dense eigen-decompositions.
+
+Level schemes are cached per (Z, N, parameters, grid). Shell closures are
+the large gaps of a level scheme; the orbitals between two closures give
+c_start and c_high_j (see orbital_filling.split_capacities), which are fed
+to calculate_next_magic and compared with the closure found.
+
+Usage:
+    python woods_saxon.py                 # 208Pb levels + sweep A = 4...300
+    python woods_saxon.py --Z 50 --N 82 --a-min 4 --a-max 300
+"""
+
+import argparse
+import time
+from collections import Counter, namedtuple
+
+import numpy as np
+
+from magic_number_calculator import calculate_next_magic
+from orbital_filling import orbital_label, split_capacities
+
+HBAR2_2M = 20.7355      # ħ²/2m_N in MeV fm²
+E2 = 1.439964           # e²/(4πε0) in MeV fm
+HBAR_OMEGA = 41.0       # ħω ≈ 41 A^(-1/3) MeV
+
+# Potential parameters (Bohr & Mottelson, Nuclear Structure Vol. I)
+WoodsSaxonParameters = namedtuple(
+    'WoodsSaxonParameters', ['V0', 'V1', 'r0', 'a', 'lambda_so', 'rc'],
+    defaults=(51.0, 33.0, 1.27, 0.67, 0.44, 1.27))
+BOHR_MOTTELSON = WoodsSaxonParameters()
+
+# Radial grid and the angular momenta covered
+Grid = namedtuple('Grid', ['step', 'r_max', 'l_max'], defaults=(0.1, 20.0, 14))
+DEFAULT_GRID = Grid()
+
+# A gap of at least this fraction of ħω closes a shell
+GAP_FRACTION = 0.3
+
+# Bisection stops when the bracket is narrower than this (MeV)
+ENERGY_TOLERANCE = 1e-6
+
+NUCLEONS = ('neutron', 'proton')
+
+LEVEL_DTYPE = np.dtype([('n', np.int64), ('l', np.int64), ('j2', np.int64),
+                        ('capacity', np.int64), ('energy', np.float64)])
+
+# One shell between two closures of a level scheme
+MeanFieldShell = namedtuple('MeanFieldShell', ['M_n', 'M_next', 'c_start', 'c_high_j',
+                                               'decreasing', 'M_formula', 'orbitals'])
+
+_LEVEL_CACHE = {}
+
+# =============================================================================
+# POTENTIAL AND HAMILTONIAN BLOCKS
+# =============================================================================
+
+
+def beta_stability_Z(A):
+    """Proton number closest to the valley of stability (Green's formula)."""
+    A = np.asarray(A, dtype=float)
+    return np.rint(A / (1.98 + 0.0155 * A ** (2 / 3))).astype(np.int64)
+
+
+def _blocks(l_max):
+    """(l, j2) of every block: s1/2, p3/2, p1/2, d5/2, ..."""
+    blocks = [(0, 1)]
+    for l in range(1, l_max + 1):
+        blocks += [(l, 2 * l + 1), (l, 2 * l - 1)]
+    return np.array(blocks)
+
+
+def _diagonals(Z, N, nucleon, params, grid):
+    """
+    Diagonals of all (l, j) blocks of one nucleus and nucleon type.
+
+    Returns:
+    --------
+    (diag, l, j2) : (blocks, points) array and the block quantum numbers
+    """
+    A = Z + N
+    r = np.arange(1, int(round(grid.r_max / grid.step))) * grid.step
+    R = params.r0 * A ** (1 / 3)
+    sign = 1 if nucleon == 'proton' else -1
+    depth = params.V0 + sign * params.V1 * (N - Z) / A
+    x = np.exp((r - R) / params.a)
+    f = 1 / (1 + x)
+    df_dr = -x / (params.a * (1 + x) ** 2)
+
+    central = -depth * f
+    if nucleon == 'proton' and Z > 1:
+        Rc = params.rc * A ** (1 / 3)
+        central = central + np.where(r < Rc, (Z - 1) * E2 / (2 * Rc) * (3 - (r / Rc) ** 2),
+                                     (Z - 1) * E2 / r)
+    spin_orbit = params.lambda_so * depth * params.r0 ** 2 * df_dr / r
+
+    blocks = _blocks(grid.l_max)
+    l, j2 = blocks[:, 0], blocks[:, 1]
+    l_dot_s = np.where(j2 == 2 * l + 1, l / 2, -(l + 1) / 2)
+    diag = (2 * HBAR2_2M / grid.step ** 2 + central
+            + l_dot_s[:, None] * spin_orbit
+            + HBAR2_2M * (l * (l + 1))[:, None] / r ** 2)
+    return diag, l, j2
+
+# =============================================================================
+# STURM-SEQUENCE BISECTION
+# =============================================================================
+
+
+def _sturm_count(diag_t, off2, x):
+    """
+    Eigenvalues below x of each tridiagonal matrix (vectorized).
+
+    diag_t is (points, matrices), off2 the squared common off-diagonal and
+    x one shift per matrix.
+    """
+    q = diag_t[0] - x
+    count = (q < 0).astype(np.int64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for d in diag_t[1:]:
+            q = d - x - off2 / q    # q == 0 behaves as +0 (next q = -inf)
+            count += q < 0
+    return count
+
+
+def bound_levels(diag, off2, tolerance=ENERGY_TOLERANCE):
+    """
+    All negative eigenvalues of a batch of tridiagonal matrices.
+
+    Returns:
+    --------
+    (block, k, energy) : arrays, one entry per bound level; k is the
+                         0-based index of the level inside its block
+    """
+    diag_t = np.ascontiguousarray(diag.T)
+    counts = _sturm_count(diag_t, off2, np.zeros(len(diag)))
+    block = np.repeat(np.arange(len(diag)), counts)
+    k = np.arange(len(block)) - np.repeat(np.cumsum(counts) - counts, counts)
+    if not len(block):
+        return block, k, np.empty(0)
+
+    # Gershgorin lower bound per block, upper bound 0
+    lo = (diag.min(axis=1) - 2 * np.sqrt(off2))[block]
+    hi = np.zeros(len(block))
+    pair_diag = diag_t[:, block]
+    iterations = int(np.ceil(np.log2(max(-lo.min(), tolerance) / tolerance)))
+    for _ in range(iterations):
+        mid = 0.5 * (lo + hi)
+        above = _sturm_count(pair_diag, off2, mid) > k
+        hi = np.where(above, mid, hi)
+        lo = np.where(above, lo, mid)
+    return block, k, 0.5 * (lo + hi)
+
+# =============================================================================
+# LEVEL SCHEMES (CACHED)
+# =============================================================================
+
+
+def _key(Z, N, params, grid):
+    return int(Z), int(N), params, grid
+
+
+def solve_nuclei(nuclei, params=BOHR_MOTTELSON, grid=DEFAULT_GRID):
+    """
+    Level schemes of many nuclei, solving all uncached ones in one batch.
+
+    Parameters:
+    -----------
+    nuclei : iterable of (Z, N)
+
+    Returns:
+    --------
+    list of {'neutron': levels, 'proton': levels}, levels being structured
+    arrays (n, l, j2, capacity, energy) sorted by energy
+    """
+    nuclei = [(int(Z), int(N)) for Z, N in nuclei]
+    missing = sorted({nucleus for nucleus in nuclei
+                      if _key(*nucleus, params, grid) not in _LEVEL_CACHE})
+    if missing:
+        diags, owners = [], []
+        for Z, N in missing:
+            for nucleon in NUCLEONS:
+                diag, l, j2 = _diagonals(Z, N, nucleon, params, grid)
+                diags.append(diag)
+                owners.append((Z, N, nucleon))
+        blocks_per_scheme = len(l)
+        off2 = (HBAR2_2M / grid.step ** 2) ** 2
+        block, k, energy = bound_levels(np.concatenate(diags), off2)
+
+        scheme = block // blocks_per_scheme
+        local = block % blocks_per_scheme
+        schemes = {}
+        for index, (Z, N, nucleon) in enumerate(owners):
+            mask = scheme == index
+            levels = np.empty(mask.sum(), dtype=LEVEL_DTYPE)
+            levels['n'] = k[mask] + 1
+            levels['l'] = l[local[mask]]
+            levels['j2'] = j2[local[mask]]
+            levels['capacity'] = levels['j2'] + 1
+            levels['energy'] = energy[mask]
+            levels = levels[np.argsort(levels['energy'], kind='stable')]
+            levels.flags.writeable = False
+            schemes.setdefault((Z, N), {})[nucleon] = levels
+        for (Z, N), result in schemes.items():
+            _LEVEL_CACHE[_key(Z, N, params, grid)] = result
+    return [_LEVEL_CACHE[_key(Z, N, params, grid)] for Z, N in nuclei]
+
+
+def level_scheme(Z, N, nucleon='neutron', params=BOHR_MOTTELSON, grid=DEFAULT_GRID):
+    """Bound single-particle levels of one nucleus (cached)."""
+    return solve_nuclei([(Z, N)], params, grid)[0][nucleon]
+
+
+def clear_cache():
+    _LEVEL_CACHE.clear()
+
+# =============================================================================
+# SHELLS FROM LEVEL SCHEMES
+# =============================================================================
+
+
+def shell_closures(levels, A, gap_fraction=GAP_FRACTION):
+    """Particle numbers after which the next level lies ≥ gap_fraction·ħω higher."""
+    if len(levels) < 2:
+        return []
+    filled = np.cumsum(levels['capacity'])
+    gaps = np.diff(levels['energy'])
+    threshold = gap_fraction * HBAR_OMEGA * A ** (-1 / 3)
+    return filled[:-1][gaps >= threshold].tolist()
+
+
+def mean_field_shells(levels, A, gap_fraction=GAP_FRACTION):
+    """
+    Split a level scheme at its closures and apply the formula to each shell.
+
+    M_formula = calculate_next_magic(M_n, c_start, c_high_j) equals M_next
+    exactly when the shell's orbitals follow the decreasing pattern.
+    """
+    closures = shell_closures(levels, A, gap_fraction)
+    filled = np.concatenate([[0], np.cumsum(levels['capacity'])])
+    shells = []
+    M_n = 0
+    for M_next in closures:
+        inside = levels[(filled[:-1] >= M_n) & (filled[1:] <= M_next)]
+        c_start, c_high_j, decreasing = split_capacities(inside['capacity'])
+        M_formula = calculate_next_magic(M_n, c_start, c_high_j)[2]
+        shells.append(MeanFieldShell(M_n, M_next, c_start, c_high_j, decreasing, M_formula,
+                                     tuple(orbital_label(level) for level in inside)))
+        M_n = M_next
+    return shells
+
+
+def sweep(a_min=4, a_max=300, params=BOHR_MOTTELSON, grid=DEFAULT_GRID,
+          gap_fraction=GAP_FRACTION):
+    """
+    Solve one nucleus per mass number along the valley of stability.
+
+    Returns:
+    --------
+    dict with 'nuclei' [(Z, N)], 'closures' {nucleon: Counter of magic
+    numbers found}, 'shells' / 'reproduced' (count of shells where the
+    formula gives the closure) and 'seconds'
+    """
+    start = time.perf_counter()
+    A = np.arange(a_min, a_max + 1)
+    Z = beta_stability_Z(A)
+    nuclei = list(zip(Z.tolist(), (A - Z).tolist()))
+    schemes = solve_nuclei(nuclei, params, grid)
+
+    closures = {nucleon: Counter() for nucleon in NUCLEONS}
+    shells = reproduced = 0
+    for (z, n), scheme in zip(nuclei, schemes):
+        for nucleon in NUCLEONS:
+            found = mean_field_shells(scheme[nucleon], z + n, gap_fraction)
+            limit = n if nucleon == 'neutron' else z
+            # Closures at or below the occupied number of this nucleon type
+            closures[nucleon].update(s.M_next for s in found if s.M_next <= limit)
+            shells += len(found)
+            reproduced += sum(s.M_formula == s.M_next for s in found)
+    return {'nuclei': nuclei, 'closures': closures, 'shells': shells,
+            'reproduced': reproduced, 'seconds': time.perf_counter() - start}
+
+
+def main(argv=None):
+    """Print one level scheme with its shells and an A = a_min...a_max sweep."""
+    parser = argparse.ArgumentParser(description="Woods-Saxon + spin-orbit level schemes.")
+    parser.add_argument('--Z', type=int, default=82)
+    parser.add_argument('--N', type=int, default=126)
+    parser.add_argument('--nucleon', choices=NUCLEONS, default='neutron')
+    parser.add_argument('--a-min', type=int, default=4)
+    parser.add_argument('--a-max', type=int, default=300)
+    parser.add_argument('--gap', type=float, default=GAP_FRACTION,
+                        help="closure gap as a fraction of ħω (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    levels = level_scheme(args.Z, args.N, args.nucleon)
+    seconds = time.perf_counter() - start
+    A = args.Z + args.N
+
+    print("\n" + "="*78)
+    print(f"WOODS-SAXON LEVELS: Z = {args.Z}, N = {args.N} ({args.nucleon}s), "
+          f"solved in {seconds * 1e3:.0f} ms")
+    print("="*78)
+    filled = np.cumsum(levels['capacity'])
+    for level, total in zip(levels, filled):
+        print(f"  {orbital_label(level):<8} {level['energy']:9.3f} MeV   "
+              f"c = {level['capacity']:<3} Σ = {total}")
+
+    print(f"\n{'Shell':<12} | {'c_start':>7} | {'c_high-j':>8} | {'formula':>7} | Orbitals")
+    print("-"*78)
+    for shell in mean_field_shells(levels, A, args.gap):
+        mark = "✓" if shell.M_formula == shell.M_next else "✗"
+        print(f"{shell.M_n:>4} → {shell.M_next:<5} | {shell.c_start:7} | {shell.c_high_j:8} | "
+              f"{shell.M_formula:5} {mark} | {' '.join(shell.orbitals)}")
+
+    result = sweep(args.a_min, args.a_max, gap_fraction=args.gap)
+    print("\n" + "-"*78)
+    print(f"Sweep A = {args.a_min}...{args.a_max}: {len(result['nuclei'])} nuclei "
+          f"× {len(NUCLEONS)} nucleon types in {result['seconds']:.2f} s")
+    for nucleon, found in result['closures'].items():
+        common = ', '.join(f"{magic} ({times})" for magic, times in
+                           sorted(found.most_common(10)))
+        print(f"  {nucleon} closures (nuclei): {common}")
+    print(f"  calculate_next_magic reproduces {result['reproduced']} of "
+          f"{result['shells']} mean-field shells")
+    print("="*78 + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+magic-numbers: unified command-line entry point
+===============================================
+
+    magic_numbers.py calc M_n c_start c_high_j [--format text|json|markdown]
+    magic_numbers.py validate [--format ...]
+    magic_numbers.py sequence [--start K] [--count N] [--rule published|orbital]
+    magic_numbers.py batch [FILE] [options]          # streaming CSV/JSONL
+    magic_numbers.py serve [options]                 # local HTTP/JSON service
+    magic_numbers.py figures [FIGURE ...] [options]  # generate_figures.py
+    magic_numbers.py abstract [output.png ...]       # graphic abstract
+
+Only argparse is imported up front. Every subcommand imports what it needs
+when it runs, so calc/validate/sequence never load NumPy or matplotlib and
+start in a few tens of milliseconds (see benchmarks/bench_startup.py).
+Options after batch, serve, figures and abstract are passed through to the
+underlying script (e.g. "magic_numbers.py figures --help").
+
+--trace FILE (before the subcommand) records the timing spans of any command
+as a Chrome trace; see calculator/instrumentation.py for the other options.
+
+Author: André Luís Tomaz Dionísio
+Institution: EPHEC Brussels, Belgium
+Date: December 2025
+"""
+
+import argparse
+import os
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, 'visualization'))
+sys.path.insert(0, os.path.join(HERE, 'calculator'))
+
+import instrumentation  # noqa: E402
+
+FORMATS = ('text', 'json', 'markdown')
+
+
+def cmd_calc(args):
+    from calculator_report import compute_calculation, render
+    render(compute_calculation(args.M_n, args.c_start, args.c_high_j), args.format)
+    return 0
+
+
+def cmd_validate(args):
+    from calculator_report import compute_validation, render
+    validation = compute_validation()
+    render(validation, args.format)
+    return 0 if validation.all_valid else 1
+
+
+def cmd_sequence(args):
+    from calculator_report import compute_sequence, render
+    rule = None
+    if args.rule == 'orbital':
+        from orbital_filling import orbital_rule as rule
+    render(compute_sequence(args.start, args.count, rule), args.format)
+    return 0
+
+
+def cmd_batch(args):
+    from batch_stream import main
+    return main(args.args)
+
+
+def cmd_serve(args):
+    from calculator_service import main
+    return main(args.args)
+
+
+def cmd_figures(args):
+    from generate_figures import main
+    return main(args.args)
+
+
+def cmd_abstract(args):
+    from generate_graphic_abstract import main
+    return main(args.args)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog='magic-numbers',
+        description="Nuclear magic numbers: calculator, sequence, figures and abstract.")
+    instrumentation.add_arguments(parser)
+    commands = parser.add_subparsers(dest='command', metavar='COMMAND', required=True)
+
+    calc = commands.add_parser('calc', help="next magic number from (M_n, c_start, c_high_j)")
+    calc.add_argument('M_n', type=int)
+    calc.add_argument('c_start', type=int)
+    calc.add_argument('c_high_j', type=int)
+    calc.add_argument('--format', '-f', choices=FORMATS, default='text')
+    calc.set_defaults(func=cmd_calc)
+
+    validate = commands.add_parser('validate', help="validate all known magic numbers (0 → 184)")
+    validate.add_argument('--format', '-f', choices=FORMATS, default='text')
+    validate.set_defaults(func=cmd_validate)
+
+    sequence = commands.add_parser('sequence', help="shells of the magic-number chain")
+    sequence.add_argument('--start', type=int, default=0, help="first shell index")
+    sequence.add_argument('--count', '-n', type=int, default=8, help="number of shells")
+    sequence.add_argument('--rule', choices=('published', 'orbital'), default='published',
+                          help="parameters as published, or derived from the orbital "
+                               "filling (needs NumPy)")
+    sequence.add_argument('--format', '-f', choices=FORMATS, default='text')
+    sequence.set_defaults(func=cmd_sequence)
+
+    # Thin wrappers: their own parsers handle the remaining arguments (and -h)
+    for name, func, help_text in (
+            ('batch', cmd_batch, "stream CSV/JSONL rows through the calculator"),
+            ('serve', cmd_serve, "run the local HTTP/JSON calculator service"),
+            ('figures', cmd_figures, "generate the article figures"),
+            ('abstract', cmd_abstract, "generate the graphic abstract")):
+        sub = commands.add_parser(name, help=help_text, add_help=False)
+        sub.set_defaults(func=func, passthrough=True)
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args, extra = parser.parse_known_args(argv)
+    if getattr(args, 'passthrough', False):
+        args.args = extra
+    elif extra:
+        parser.error(f"unrecognized arguments: {' '.join(extra)}")
+    if getattr(args, 'count', 0) < 0 or getattr(args, 'start', 0) < 0:
+        parser.error("--start and --count must be non-negative")
+    recorder = instrumentation.start_from_args(args)
+    try:
+        return args.func(args)
+    finally:
+        instrumentation.finish_from_args(args, recorder)
+
+
+if __name__ == "__main__":
+    exit(main())
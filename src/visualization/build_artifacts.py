@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+"""
+Incremental Build for Figures, Graphic Abstract and Tables
+==========================================================
+
+Every artifact is keyed by a content hash of
+- the source of its generator (the function itself plus the module-level
+  names and calculator modules it depends on),
+- its input data files (e.g. the AME2020 mass table),
+- its build parameters.
+
+Only artifacts whose hash changed, or whose outputs are missing, are rebuilt.
+Hashes and build timings are recorded in <out>/manifest.json. Matplotlib and
+the generators are imported only when something actually has to be rebuilt,
+so a no-op build just reads and hashes a handful of files.
+
+Author: André Luís Tomaz Dionísio
+Institution: EPHEC Brussels, Belgium
+Date: December 2025
+
+Usage:
+    python build_artifacts.py                    # build everything that is stale
+    python build_artifacts.py figure1 tables     # only these artifacts
+    python build_artifacts.py --dry-run          # list stale artifacts
+    python build_artifacts.py --force            # rebuild everything
+"""
+
+import argparse
+import ast
+import hashlib
+import importlib
+import json
+import os
+import sys
+import time
+from collections import namedtuple
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+CALCULATOR = os.path.normpath(os.path.join(HERE, '..', 'calculator'))
+REPO_ROOT = os.path.normpath(os.path.join(HERE, '..', '..'))
+DEFAULT_OUT_DIR = os.path.join(REPO_ROOT, 'build')
+MANIFEST_NAME = 'manifest.json'
+
+sys.path.insert(0, CALCULATOR)
+
+# =============================================================================
+# BUILD GRAPH
+# =============================================================================
+
+# sources:    (path, top-level name or None for the whole file)
+# data_files: callables returning paths whose contents feed the artifact
+# build:      (module, function, args); run with the output directory as cwd
+Artifact = namedtuple('Artifact', ['name', 'outputs', 'sources', 'data_files',
+                                   'params', 'build'])
+
+_FIGURES = os.path.join(HERE, 'generate_figures.py')
+_EXPORT = os.path.join(HERE, 'figure_export.py')
+
+
+def _calc(module):
+    return os.path.join(CALCULATOR, module)
+
+
+def _mass_table_path():
+    from mass_table import default_mass_table_path
+    return default_mass_table_path()
+
+
+ARTIFACTS = [
+    Artifact('figure1', ('figure1_delta_n_vs_BE.png',),
+             ((_FIGURES, 'PUBLICATION_STYLE'), (_FIGURES, 'build_figure1'), (_FIGURES, 'generate_figure1'),
+              (_EXPORT, None),
+              (_calc('mass_table.py'), None), (_calc('nuclide_index.py'), None),
+              (_calc('trend_uncertainty.py'), None), (_calc('magic_sequence.py'), None)),
+             (_mass_table_path,),
+             {'bootstrap_replicates': 100_000},
+             ('generate_figures', 'generate_figure1', ())),
+    Artifact('figure2', ('figure2_hierarchy.png',),
+             ((_FIGURES, 'PUBLICATION_STYLE'), (_FIGURES, '_SUPERSCRIPT_DIGITS'),
+              (_FIGURES, '_FROM_SUPERSCRIPTS'), (_FIGURES, '_mathtext_nuclide'),
+              (_FIGURES, 'build_figure2'), (_FIGURES, 'generate_figure2'), (_EXPORT, None),
+              (_calc('calculator_report.py'), 'STABILITY_LEVELS'),
+              (_calc('calculator_report.py'), 'stability_hierarchy'),
+              (_calc('doubly_magic.py'), None), (_calc('woods_saxon.py'), 'beta_stability_Z'),
+              (_calc('mass_table.py'), None), (_calc('nuclide_index.py'), None),
+              (_calc('magic_sequence.py'), None)),
+             (_mass_table_path,), {},
+             ('generate_figures', 'generate_figure2', ())),
+    Artifact('figure3', ('figure3_pattern_evolution.png',),
+             ((_FIGURES, 'PUBLICATION_STYLE'), (_FIGURES, 'build_figure3'),
+              (_FIGURES, 'generate_figure3'), (_EXPORT, None)),
+             (), {},
+             ('generate_figures', 'generate_figure3', ())),
+    Artifact('figure4', ('figure4_nuclide_chart.png',),
+             ((_FIGURES, 'PUBLICATION_STYLE'), (_FIGURES, 'CHART_FIELDS'),
+              (_FIGURES, 'DEFAULT_CHART_FIELD'), (_FIGURES, 'CHART_LABEL_MIN_POINTS'),
+              (_FIGURES, 'CHART_MAX_LABELS'), (_FIGURES, '_select_labels'),
+              (_FIGURES, 'valence_delta_n'), (_FIGURES, 'chart_values'),
+              (_FIGURES, '_cell_points'), (_FIGURES, '_label_rows'),
+              (_FIGURES, '_label_cells'),
+              (_FIGURES, 'build_figure4'), (_FIGURES, 'generate_figure4'),
+              (_EXPORT, None),
+              (_calc('mass_table.py'), None), (_calc('nuclide_index.py'), None),
+              (_calc('magic_sequence.py'), None), (_calc('shell_gaps.py'), None)),
+             (_mass_table_path,),
+             {'field': 'be_per_a'},
+             ('generate_figures', 'generate_figure4', ())),
+    Artifact('abstract', ('graphic_abstract.png',),
+             ((os.path.join(HERE, 'generate_graphic_abstract.py'), None),),
+             (), {},
+             ('generate_graphic_abstract', 'generate_graphic_abstract',
+              (('graphic_abstract.png',),))),
+    Artifact('tables', ('table_validation.tex',),
+             ((os.path.join(HERE, 'generate_tables.py'), None),
+              (_calc('magic_sequence.py'), None),
+              (_calc('magic_number_calculator.py'), 'calculate_delta_n'),
+              (_calc('magic_number_calculator.py'), 'calculate_next_magic')),
+             (), {},
+             ('generate_tables', 'generate_tables', ())),
+]
+
+# =============================================================================
+# HASHING
+# =============================================================================
+
+
+class SourceCache:
+    """Reads and parses each source file once per build."""
+
+    def __init__(self):
+        self._text = {}
+        self._segments = {}
+
+    def text(self, path):
+        if path not in self._text:
+            with open(path, encoding='utf-8') as f:
+                self._text[path] = f.read()
+        return self._text[path]
+
+    def segment(self, path, name):
+        """Source of the top-level def/class/assignment `name` in `path`."""
+        if path not in self._segments:
+            text = self.text(path)
+            segments = {}
+            for node in ast.parse(text).body:
+                if isinstance(node, (ast.FunctionDef, ast.ClassDef)):
+                    names = [node.name]
+                elif isinstance(node, ast.Assign):
+                    names = [t.id for t in node.targets if isinstance(t, ast.Name)]
+                else:
+                    continue
+                source = ast.get_source_segment(text, node)
+                for n in names:
+                    segments[n] = source
+            self._segments[path] = segments
+        try:
+            return self._segments[path][name]
+        except KeyError:
+            raise KeyError(f"{name} not found in {path}") from None
+
+
+def _file_digest(path):
+    """sha256 of a file's contents, or a marker when it does not exist."""
+    if not os.path.exists(path):
+        return 'missing'
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def artifact_hash(artifact, sources):
+    """Content hash of an artifact's generator source, data and parameters."""
+    digest = hashlib.sha256()
+    digest.update(artifact.name.encode())
+    digest.update(json.dumps(artifact.params, sort_keys=True).encode())
+    digest.update(repr(artifact.build).encode())
+    for path, name in artifact.sources:
+        text = sources.text(path) if name is None else sources.segment(path, name)
+        digest.update(os.path.relpath(path, REPO_ROOT).encode())
+        digest.update(text.encode())
+    for data_file in artifact.data_files:
+        path = data_file()
+        digest.update(path.encode())
+        digest.update(_file_digest(path).encode())
+    return digest.hexdigest()
+
+# =============================================================================
+# BUILD
+# =============================================================================
+
+
+def load_manifest(out_dir):
+    path = os.path.join(out_dir, MANIFEST_NAME)
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_manifest(out_dir, manifest):
+    path = os.path.join(out_dir, MANIFEST_NAME)
+    tmp = path + '.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp, path)
+
+
+def is_stale(artifact, digest, manifest, out_dir):
+    entry = manifest.get(artifact.name)
+    if entry is None or entry.get('hash') != digest:
+        return True
+    return not all(os.path.exists(os.path.join(out_dir, o)) for o in artifact.outputs)
+
+
+def run_build(artifact, out_dir):
+    """Import the generator lazily and run it with out_dir as cwd."""
+    import matplotlib
+    matplotlib.use('Agg')
+
+    if HERE not in sys.path:
+        sys.path.insert(0, HERE)
+    module_name, function_name, args = artifact.build
+    func = getattr(importlib.import_module(module_name), function_name)
+
+    previous = os.getcwd()
+    os.chdir(out_dir)
+    try:
+        func(*args, **artifact.params)
+    finally:
+        os.chdir(previous)
+
+
+def build(names=None, out_dir=DEFAULT_OUT_DIR, force=False, dry_run=False):
+    """
+    Bring the requested artifacts up to date.
+
+    Returns:
+    --------
+    list of (name, status, seconds) with status 'up to date', 'stale',
+    'built' or 'FAILED: <error>'
+    """
+    selected = [a for a in ARTIFACTS if names is None or a.name in names]
+    os.makedirs(out_dir, exist_ok=True)
+    manifest = load_manifest(out_dir)
+    sources = SourceCache()
+    results = []
+
+    for artifact in selected:
+        digest = artifact_hash(artifact, sources)
+        if not force and not is_stale(artifact, digest, manifest, out_dir):
+            results.append((artifact.name, 'up to date', 0.0))
+            continue
+        if dry_run:
+            results.append((artifact.name, 'stale', 0.0))
+            continue
+
+        start = time.perf_counter()
+        try:
+            run_build(artifact, out_dir)
+        except Exception as e:
+            results.append((artifact.name, f'FAILED: {e}', time.perf_counter() - start))
+            continue
+        seconds = time.perf_counter() - start
+        manifest[artifact.name] = {
+            'hash': digest,
+            'outputs': list(artifact.outputs),
+            'seconds': round(seconds, 4),
+            'built_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        }
+        save_manifest(out_dir, manifest)
+        results.append((artifact.name, 'built', seconds))
+
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Incrementally build figures, graphic abstract and tables.")
+    parser.add_argument('artifacts', nargs='*', metavar='ARTIFACT',
+                        help=f"{', '.join(a.name for a in ARTIFACTS)} (default: all)")
+    parser.add_argument('--out', default=DEFAULT_OUT_DIR,
+                        help="output directory (default: %(default)s)")
+    parser.add_argument('--force', action='store_true', help="rebuild everything")
+    parser.add_argument('--dry-run', action='store_true', help="only list stale artifacts")
+    args = parser.parse_args(argv)
+
+    known = {a.name for a in ARTIFACTS}
+    unknown = [n for n in args.artifacts if n not in known]
+    if unknown:
+        parser.error(f"unknown artifact(s): {', '.join(unknown)}")
+
+    start = time.perf_counter()
+    results = build(args.artifacts or None, args.out, args.force, args.dry_run)
+    total = time.perf_counter() - start
+
+    print(f"\n{'Artifact':<10} | {'Status':<12} | {'Time (s)':>8}")
+    print("-"*40)
+    for name, status, seconds in results:
+        print(f"{name:<10} | {status:<12} | {seconds:8.2f}")
+    print("-"*40)
+    print(f"Total: {total:.2f} s   Manifest: {os.path.join(args.out, MANIFEST_NAME)}\n")
+    return 1 if any(status.startswith('FAILED') for _, status, _ in results) else 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Figure Export: render once, save many
+=====================================
+
+Writes one already-built matplotlib figure to every requested format and
+resolution (e.g. PNG at 300 and 600 DPI plus PDF and SVG) without re-running
+the code that draws it.
+
+With threads > 1 the extra outputs are written from pickled copies of the
+figure, one per thread, since a single figure must not be drawn by two
+threads at once.
+
+Author: André Luís Tomaz Dionísio
+Institution: EPHEC Brussels, Belgium
+Date: December 2025
+"""
+
+import os
+import pickle
+import sys
+from collections import Counter, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+import matplotlib.pyplot as plt
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                '..', 'calculator'))
+
+from instrumentation import count, span  # noqa: E402
+
+ExportSpec = namedtuple('ExportSpec', ['format', 'dpi'])
+
+DEFAULT_DPI = 300
+DEFAULT_EXPORTS = (ExportSpec('png', DEFAULT_DPI),)
+VECTOR_FORMATS = {'pdf', 'svg', 'eps', 'ps'}
+
+
+def parse_exports(text):
+    """
+    Parse a CLI export list such as "png@300,png@600,pdf,svg".
+
+    The DPI defaults to 300; for vector formats it only affects any
+    rasterized layers.
+    """
+    specs = []
+    for item in text.split(','):
+        item = item.strip().lower()
+        if not item:
+            continue
+        fmt, _, dpi = item.partition('@')
+        try:
+            specs.append(ExportSpec(fmt, int(dpi) if dpi else DEFAULT_DPI))
+        except ValueError:
+            raise ValueError(f"Invalid DPI in export spec: {item}") from None
+    if not specs:
+        raise ValueError("No export formats given")
+    return tuple(specs)
+
+
+def output_paths(basename, specs):
+    """
+    File name for each spec: basename.fmt, or basename_<dpi>dpi.fmt when the
+    same format is requested at several resolutions.
+    """
+    per_format = Counter(spec.format for spec in specs)
+    paths = []
+    for spec in specs:
+        if per_format[spec.format] > 1:
+            paths.append(f"{basename}_{spec.dpi}dpi.{spec.format}")
+        else:
+            paths.append(f"{basename}.{spec.format}")
+    return paths
+
+
+def _save(fig, path, spec):
+    with span('savefig', format=spec.format, dpi=spec.dpi, path=path):
+        fig.savefig(path, format=spec.format, dpi=spec.dpi, bbox_inches='tight')
+    count('savefig.files')
+    return path
+
+
+def _save_copy(data, path, spec):
+    fig = pickle.loads(data)
+    try:
+        return _save(fig, path, spec)
+    finally:
+        plt.close(fig)
+
+
+def export_figure(fig, basename, specs=DEFAULT_EXPORTS, threads=1, close=True):
+    """
+    Save `fig` once per export spec.
+
+    Parameters:
+    -----------
+    fig : matplotlib.figure.Figure
+        The figure, built once.
+    basename : str
+        Output path without extension.
+    specs : sequence of ExportSpec
+    threads : int
+        Write outputs concurrently from pickled copies of the figure.
+    close : bool
+        Close `fig` afterwards.
+
+    Returns:
+    --------
+    list of str : the written paths, in spec order
+    """
+    paths = output_paths(basename, specs)
+    try:
+        if threads <= 1 or len(specs) == 1:
+            return [_save(fig, path, spec) for path, spec in zip(paths, specs)]
+
+        data = pickle.dumps(fig)
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            futures = [pool.submit(_save_copy, data, path, spec)
+                       for path, spec in zip(paths[1:], specs[1:])]
+            written = [_save(fig, paths[0], specs[0])]
+            written.extend(f.result() for f in futures)
+        return written
+    finally:
+        if close:
+            plt.close(fig)
@@ -3,10 +3,11 @@
 Figure Generation Script for Magic Numbers Article
 ===================================================
 
-Generates three publication-quality figures (300 DPI):
+Generates four publication-quality figures (300 DPI):
 1. Figure 1: Δn vs Binding Energy per Nucleon
 2. Figure 2: Stability Hierarchy
 3. Figure 3: Pattern Evolution to 184
+4. Figure 4: Chart of Nuclides (BE/A, Δn or shell gap on the (Z, N) grid)
 
 Author: André Luís Tomaz Dionísio
 Institution: EPHEC Brussels, Belgium
@@ -18,116 +19,160 @@ Requirements:
 - matplotlib
 
 Usage:
-    python generate_figures.py
+    python generate_figures.py                  # all figures, one after another
+    python generate_figures.py -j 3             # one headless worker per figure
+    python generate_figures.py figure1 --headless
+    python generate_figures.py --formats png@300,png@600,pdf,svg --threads 4
+    python generate_figures.py --trace trace.json      # stage timings (Chrome trace)
+    python generate_figures.py figure4 --chart-field shell_gap --formats png,pdf
 
 Output:
     - figure1_delta_n_vs_BE.png (300 DPI)
     - figure2_hierarchy.png (300 DPI)
     - figure3_pattern_evolution.png (300 DPI)
+    - figure4_nuclide_chart.png (300 DPI; _<field> suffix for other fields)
 """
 
+import argparse
+import functools
+import os
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+
 import numpy as np
+import matplotlib
 import matplotlib.pyplot as plt
-from matplotlib import rcParams
+
+# Calculator and data modules live in src/calculator
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                '..', 'calculator'))
+
+import instrumentation  # noqa: E402
+from calculator_report import stability_hierarchy  # noqa: E402
+from instrumentation import count, span  # noqa: E402
+from magic_sequence import KNOWN_MAGIC_NUMBERS, MagicSequence  # noqa: E402
+from nuclide_index import NuclideIndex, MISSING  # noqa: E402
+from shell_gaps import compute_shell_gaps  # noqa: E402
+from trend_uncertainty import (TREND_OUTLIERS, nuclear_data,  # noqa: E402
+                               trend_uncertainty)
+
+from figure_export import DEFAULT_EXPORTS, export_figure, parse_exports  # noqa: E402
 
 # =============================================================================
 # CONFIGURATION
 # =============================================================================
 
-# Set publication-quality parameters
-rcParams['font.family'] = 'serif'
-rcParams['font.size'] = 11
-rcParams['axes.labelsize'] = 12
-rcParams['axes.titlesize'] = 13
-rcParams['xtick.labelsize'] = 10
-rcParams['ytick.labelsize'] = 10
-rcParams['legend.fontsize'] = 10
-rcParams['figure.dpi'] = 300
+# Publication-quality parameters, applied per figure (see @publication_style)
+# rather than globally at import
+PUBLICATION_STYLE = {
+    'font.family': 'serif',
+    'font.size': 11,
+    'axes.labelsize': 12,
+    'axes.titlesize': 13,
+    'xtick.labelsize': 10,
+    'ytick.labelsize': 10,
+    'legend.fontsize': 10,
+    'figure.dpi': 300,
+}
+
+
+def publication_style(func):
+    """Run a figure function inside rc_context(PUBLICATION_STYLE)."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with plt.rc_context(PUBLICATION_STYLE):
+            return func(*args, **kwargs)
+    return wrapper
 
 # =============================================================================
 # EXPERIMENTAL DATA
 # =============================================================================
 
-# Format: (N or Z, c_start, delta_n, BE/A in MeV, nucleus, type)
-# BE/A data from AME2020 (Atomic Mass Evaluation)
-nuclear_data = [
-    (2, 2, 2, 7.074, r'$^4$He', 'magic'),
-    (4, 4, 6, 6.476, r'$^8$Be', 'subshell'),
-    (6, 4, 6, 7.680, r'$^{12}$C', 'subshell'),
-    (8, 4, 6, 7.976, r'$^{16}$O', 'magic'),
-    (10, 6, 12, 8.032, r'$^{20}$Ne', 'subshell'),
-    (14, 6, 12, 8.448, r'$^{28}$Si', 'subshell'),
-    (20, 2, 2, 8.551, r'$^{40}$Ca', 'magic'),
-    (28, 6, 12, 8.643, r'$^{56}$Ni', 'magic'),
-    (50, 8, 20, 8.667, r'$^{100}$Sn', 'magic'),
-    (82, 10, 30, 7.867, r'$^{208}$Pb', 'magic'),
-]
+# The Figure 1 nuclides (nuclear_data) and the trend outliers (TREND_OUTLIERS)
+# live in src/calculator/trend_uncertainty.py, shared with its CLI.
 
 # =============================================================================
 # FIGURE 1: Δn vs BINDING ENERGY
 # =============================================================================
 
-def generate_figure1():
-    """Generate correlation between Δn and binding energy per nucleon."""
-    print("Generating Figure 1: Δn vs Binding Energy...")
-    
-    # Extract data
-    delta_n_values = [d[2] for d in nuclear_data]
-    be_values = [d[3] for d in nuclear_data]
-    nuclei_labels = [d[4] for d in nuclear_data]
-    types = [d[5] for d in nuclear_data]
+@publication_style
+def build_figure1(bootstrap_replicates=100_000):
+    """
+    Build the correlation between Δn and binding energy per nucleon.
+
+    The trend line is shaded with a bootstrap confidence band computed from
+    `bootstrap_replicates` resampled fits (0 disables the band).
+    """
+    # Extract data (BE/A from the mass table)
+    with span('figure1.data'):
+        index = NuclideIndex.load()
+        Z = np.array([d.Z for d in nuclear_data])
+        N = np.array([d.N for d in nuclear_data])
+        rows = index.rows(Z, N)
+        found = rows != MISSING
+        delta_n_values = np.array([d.delta_n for d in nuclear_data])
+        be_values = np.where(found, index.table['be_per_a'][rows], np.nan)
+        nuclei_labels = np.array([d.label for d in nuclear_data])
+
+        # Magic: N or Z closes a known shell (isotones/isotopes index slices)
+        magic_rows = np.concatenate([index.isotones_of(KNOWN_MAGIC_NUMBERS),
+                                     index.isotopes_of(KNOWN_MAGIC_NUMBERS)])
+        is_magic = found & np.isin(rows, magic_rows)
+        is_subshell = found & ~is_magic
     
     # Create figure
-    fig, ax = plt.subplots(figsize=(8, 6))
-    
-    # Plot points with different colors for magic vs subshell
-    magic_points = [(dn, be, label) for dn, be, label, t in 
-                    zip(delta_n_values, be_values, nuclei_labels, types) 
-                    if t == 'magic']
-    subshell_points = [(dn, be, label) for dn, be, label, t in 
-                       zip(delta_n_values, be_values, nuclei_labels, types) 
-                       if t == 'subshell']
+    with span('figure1.subplots'):
+        fig, ax = plt.subplots(figsize=(8, 6))
     
-    # Plot magic numbers (red circles)
-    if magic_points:
-        dn_magic = [p[0] for p in magic_points]
-        be_magic = [p[1] for p in magic_points]
-        labels_magic = [p[2] for p in magic_points]
-        ax.scatter(dn_magic, be_magic, c='red', s=100, alpha=0.7, 
-                  label='Magic numbers', zorder=3, edgecolors='darkred', linewidths=1.5)
+    count('figure1.annotations', int(found.sum()))
+    with span('figure1.artists'):
+        # Plot magic numbers (red circles)
+        if is_magic.any():
+            ax.scatter(delta_n_values[is_magic], be_values[is_magic], c='red', s=100,
+                      alpha=0.7, label='Magic numbers', zorder=3,
+                      edgecolors='darkred', linewidths=1.5)
         
-        # Add labels for magic numbers
-        for dn, be, label in magic_points:
-            ax.annotate(label, (dn, be), xytext=(5, 5), 
-                       textcoords='offset points', fontsize=9)
+            # Add labels for magic numbers
+            for dn, be, label in zip(delta_n_values[is_magic], be_values[is_magic],
+                                     nuclei_labels[is_magic]):
+                ax.annotate(label, (dn, be), xytext=(5, 5), 
+                           textcoords='offset points', fontsize=9)
     
-    # Plot subshell closures (blue triangles)
-    if subshell_points:
-        dn_sub = [p[0] for p in subshell_points]
-        be_sub = [p[1] for p in subshell_points]
-        labels_sub = [p[2] for p in subshell_points]
-        ax.scatter(dn_sub, be_sub, c='blue', s=100, alpha=0.7, 
-                  marker='^', label='Subshell closures', zorder=3, 
-                  edgecolors='darkblue', linewidths=1.5)
+        # Plot subshell closures (blue triangles)
+        if is_subshell.any():
+            ax.scatter(delta_n_values[is_subshell], be_values[is_subshell], c='blue',
+                      s=100, alpha=0.7, marker='^', label='Subshell closures',
+                      zorder=3, edgecolors='darkblue', linewidths=1.5)
         
-        # Add labels for subshells
-        for dn, be, label in subshell_points:
-            ax.annotate(label, (dn, be), xytext=(5, -10), 
-                       textcoords='offset points', fontsize=9)
+            # Add labels for subshells
+            for dn, be, label in zip(delta_n_values[is_subshell], be_values[is_subshell],
+                                     nuclei_labels[is_subshell]):
+                ax.annotate(label, (dn, be), xytext=(5, -10), 
+                           textcoords='offset points', fontsize=9)
     
     # Trend line (excluding outlier 8Be)
-    filtered_data = [(dn, be) for dn, be, t in 
-                     zip(delta_n_values, be_values, types) 
-                     if (dn, be) != (6, 6.476)]  # Exclude 8Be
+    in_trend = (found & np.isfinite(be_values)
+                & ~np.isin(rows, index.rows(*np.array(list(TREND_OUTLIERS)).T)))
     
-    if len(filtered_data) > 2:
-        dn_fit = np.array([p[0] for p in filtered_data])
-        be_fit = np.array([p[1] for p in filtered_data])
-        z = np.polyfit(dn_fit, be_fit, 1)
-        p = np.poly1d(z)
-        dn_line = np.linspace(min(delta_n_values), max(delta_n_values), 100)
+    if in_trend.sum() > 2:
+        with span('figure1.polyfit', points=int(in_trend.sum())):
+            z = np.polyfit(delta_n_values[in_trend], be_values[in_trend], 1)
+            p = np.poly1d(z)
+        dn_line = np.linspace(delta_n_values.min(), delta_n_values.max(), 100)
         ax.plot(dn_line, p(dn_line), 'k--', alpha=0.3, linewidth=1.5, 
                label='Trend (excluding $^8$Be)')
+        
+        # Bootstrap confidence band of the trend
+        if bootstrap_replicates:
+            with span('figure1.bootstrap', replicates=bootstrap_replicates):
+                band = trend_uncertainty(delta_n_values[in_trend], be_values[in_trend],
+                                         dn_line, replicates=bootstrap_replicates,
+                                         seed=0)
+            ax.fill_between(dn_line, band.lower, band.upper, color='gray',
+                            alpha=0.15, linewidth=0,
+                            label=f'{band.level:.0%} bootstrap band')
     
     # Formatting
     ax.set_xlabel(r'Pairing capacity $\Delta n$')
@@ -136,52 +181,68 @@ def generate_figure1():
     ax.grid(True, alpha=0.3, linestyle='--')
     ax.legend(loc='best')
     
-    plt.tight_layout()
-    plt.savefig('figure1_delta_n_vs_BE.png', dpi=300, bbox_inches='tight')
-    print("✓ Figure 1 saved: figure1_delta_n_vs_BE.png")
-    plt.close()
+    with span('figure1.layout'):
+        plt.tight_layout()
+    return fig
+
+
+@publication_style
+def generate_figure1(bootstrap_replicates=100_000, exports=DEFAULT_EXPORTS, threads=1):
+    """Build Figure 1 once and write it in every requested format."""
+    print("Generating Figure 1: Δn vs Binding Energy...")
+    fig = build_figure1(bootstrap_replicates=bootstrap_replicates)
+    for path in export_figure(fig, 'figure1_delta_n_vs_BE', exports, threads):
+        print(f"✓ Figure 1 saved: {path}")
 
 # =============================================================================
 # FIGURE 2: STABILITY HIERARCHY
 # =============================================================================
 
-def generate_figure2():
-    """Generate stability hierarchy diagram."""
-    print("Generating Figure 2: Stability Hierarchy...")
-    
-    # Hierarchy levels
-    hierarchy = [
-        (2, 'LOCAL', ['$^4$He', '$^{40}$Ca']),
-        (6, 'SUBSHELL', ['$^{12}$C', '$^{16}$O']),
-        (12, 'REGIONAL', ['$^{20}$Ne', '$^{28}$Si', '$^{56}$Ni']),
-        (20, 'STRONG', ['$^{100}$Sn']),
-        (30, 'MAJOR', ['$^{208}$Pb']),
-        (42, 'COMPLETE', ['184 (predicted)']),
-    ]
+_SUPERSCRIPT_DIGITS = '⁰¹²³⁴⁵⁶⁷⁸⁹'
+_FROM_SUPERSCRIPTS = str.maketrans(_SUPERSCRIPT_DIGITS, '0123456789')
+
+
+def _mathtext_nuclide(label):
+    """'²⁰⁸Pb' → '$^{208}$Pb'; labels without a superscript mass number are kept."""
+    digits = label[:len(label) - len(label.lstrip(_SUPERSCRIPT_DIGITS))]
+    if not digits:
+        return label
+    return f"$^{{{digits.translate(_FROM_SUPERSCRIPTS)}}}${label[len(digits):]}"
+
+
+@publication_style
+def build_figure2():
+    """Build the stability hierarchy diagram."""
+    # Hierarchy levels, with the same scored examples as the calculator menu
+    hierarchy = [(level.delta_n, level.level,
+                  [_mathtext_nuclide(label) for label in level.examples.split(', ') if label])
+                 for level in stability_hierarchy()]
     
-    fig, ax = plt.subplots(figsize=(10, 6))
+    with span('figure2.subplots'):
+        fig, ax = plt.subplots(figsize=(10, 6))
     
-    # Plot bars
-    delta_n = [h[0] for h in hierarchy]
-    levels = [h[1] for h in hierarchy]
-    positions = np.arange(len(hierarchy))
+    with span('figure2.artists', levels=len(hierarchy)):
+        # Plot bars
+        delta_n = [h[0] for h in hierarchy]
+        levels = [h[1] for h in hierarchy]
+        positions = np.arange(len(hierarchy))
     
-    colors = ['#FFE5E5', '#E5F5FF', '#E5FFE5', '#FFFFE5', '#FFE5FF', '#FFE5E5']
-    bars = ax.barh(positions, delta_n, color=colors, edgecolor='black', linewidth=1.5)
+        colors = ['#FFE5E5', '#E5F5FF', '#E5FFE5', '#FFFFE5', '#FFE5FF', '#FFE5E5']
+        bars = ax.barh(positions, delta_n, color=colors, edgecolor='black', linewidth=1.5)
     
-    # Add labels
-    for i, (dn, level, examples) in enumerate(hierarchy):
-        # Level name
-        ax.text(-2, i, level, va='center', ha='right', fontweight='bold', fontsize=11)
+        # Add labels
+        for i, (dn, level, examples) in enumerate(hierarchy):
+            # Level name
+            ax.text(-2, i, level, va='center', ha='right', fontweight='bold', fontsize=11)
         
-        # Δn value
-        ax.text(dn/2, i, f'Δn = {dn}', va='center', ha='center', 
-               fontweight='bold', fontsize=10)
+            # Δn value
+            ax.text(dn/2, i, f'Δn = {dn}', va='center', ha='center', 
+                   fontweight='bold', fontsize=10)
         
-        # Examples
-        examples_text = ', '.join(examples)
-        ax.text(dn + 1, i, examples_text, va='center', ha='left', 
-               fontsize=9, style='italic')
+            # Examples
+            examples_text = ', '.join(examples)
+            ax.text(dn + 1, i, examples_text, va='center', ha='left', 
+                   fontsize=9, style='italic')
     
     # Formatting
     ax.set_xlabel(r'Pairing capacity $\Delta n$', fontsize=12)
@@ -197,19 +258,26 @@ def generate_figure2():
     ax.text(46.5, len(hierarchy)/2 - 0.5, 'Increasing\nStability', 
            va='center', ha='left', fontsize=10, color='red', fontweight='bold')
     
-    plt.tight_layout()
-    plt.savefig('figure2_hierarchy.png', dpi=300, bbox_inches='tight')
-    print("✓ Figure 2 saved: figure2_hierarchy.png")
-    plt.close()
+    with span('figure2.layout'):
+        plt.tight_layout()
+    return fig
+
+
+@publication_style
+def generate_figure2(exports=DEFAULT_EXPORTS, threads=1):
+    """Build Figure 2 once and write it in every requested format."""
+    print("Generating Figure 2: Stability Hierarchy...")
+    fig = build_figure2()
+    for path in export_figure(fig, 'figure2_hierarchy', exports, threads):
+        print(f"✓ Figure 2 saved: {path}")
 
 # =============================================================================
 # FIGURE 3: PATTERN EVOLUTION
 # =============================================================================
 
-def generate_figure3():
-    """Generate pattern evolution diagram showing recursive structure."""
-    print("Generating Figure 3: Pattern Evolution...")
-    
+@publication_style
+def build_figure3():
+    """Build the pattern evolution diagram showing the recursive structure."""
     # Magic numbers with their building blocks
     magic_structure = [
         (2, [2], 2),
@@ -222,65 +290,69 @@ def generate_figure3():
         (184, [12, 10, 8, 6, 4, 2, 16], 16),
     ]
     
-    fig, ax = plt.subplots(figsize=(12, 8))
+    with span('figure3.subplots'):
+        fig, ax = plt.subplots(figsize=(12, 8))
     
     y_position = len(magic_structure) - 1
     
-    for magic, sequence, sphere in magic_structure:
-        # Draw sequence boxes
-        x_pos = 0
-        box_width = 2
-        box_height = 0.6
+    count('figure3.rectangles', sum(len(seq) for _, seq, _ in magic_structure))
+    count('figure3.annotations', sum(len(seq) - 1 for _, seq, _ in magic_structure))
+    with span('figure3.artists', rows=len(magic_structure)):
+        for magic, sequence, sphere in magic_structure:
+            # Draw sequence boxes
+            x_pos = 0
+            box_width = 2
+            box_height = 0.6
         
-        # Color scheme
-        if sphere == magic:  # Simple closure (just sphere)
-            color = '#FFE5E5'
-        elif sphere > 0:  # Sequence + sphere
-            color = '#E5FFE5'
-        else:  # Just sequence
-            color = '#E5F5FF'
+            # Color scheme
+            if sphere == magic:  # Simple closure (just sphere)
+                color = '#FFE5E5'
+            elif sphere > 0:  # Sequence + sphere
+                color = '#E5FFE5'
+            else:  # Just sequence
+                color = '#E5F5FF'
         
-        # Draw decreasing sequence
-        for i, cap in enumerate(sequence):
-            if sphere > 0 and cap == sphere:
-                # Sphere orbital (highlighted)
-                rect = plt.Rectangle((x_pos, y_position - box_height/2), 
-                                    box_width, box_height,
-                                    facecolor='#FFD700', edgecolor='red', 
-                                    linewidth=2)
-                ax.add_patch(rect)
-                ax.text(x_pos + box_width/2, y_position, str(cap), 
-                       va='center', ha='center', fontweight='bold', fontsize=11)
-                ax.text(x_pos + box_width/2, y_position - box_height/2 - 0.2, 
-                       'sphere', va='top', ha='center', fontsize=8, 
-                       style='italic', color='red')
-            else:
-                # Regular sequence element
-                rect = plt.Rectangle((x_pos, y_position - box_height/2), 
-                                    box_width, box_height,
-                                    facecolor=color, edgecolor='black', linewidth=1)
-                ax.add_patch(rect)
-                ax.text(x_pos + box_width/2, y_position, str(cap), 
-                       va='center', ha='center', fontsize=10)
+            # Draw decreasing sequence
+            for i, cap in enumerate(sequence):
+                if sphere > 0 and cap == sphere:
+                    # Sphere orbital (highlighted)
+                    rect = plt.Rectangle((x_pos, y_position - box_height/2), 
+                                        box_width, box_height,
+                                        facecolor='#FFD700', edgecolor='red', 
+                                        linewidth=2)
+                    ax.add_patch(rect)
+                    ax.text(x_pos + box_width/2, y_position, str(cap), 
+                           va='center', ha='center', fontweight='bold', fontsize=11)
+                    ax.text(x_pos + box_width/2, y_position - box_height/2 - 0.2, 
+                           'sphere', va='top', ha='center', fontsize=8, 
+                           style='italic', color='red')
+                else:
+                    # Regular sequence element
+                    rect = plt.Rectangle((x_pos, y_position - box_height/2), 
+                                        box_width, box_height,
+                                        facecolor=color, edgecolor='black', linewidth=1)
+                    ax.add_patch(rect)
+                    ax.text(x_pos + box_width/2, y_position, str(cap), 
+                           va='center', ha='center', fontsize=10)
             
-            # Arrow between elements
-            if i < len(sequence) - 1:
-                ax.annotate('', xy=(x_pos + box_width + 0.1, y_position), 
-                           xytext=(x_pos + box_width, y_position),
-                           arrowprops=dict(arrowstyle='->', lw=1.5))
+                # Arrow between elements
+                if i < len(sequence) - 1:
+                    ax.annotate('', xy=(x_pos + box_width + 0.1, y_position), 
+                               xytext=(x_pos + box_width, y_position),
+                               arrowprops=dict(arrowstyle='->', lw=1.5))
             
-            x_pos += box_width + 0.3
+                x_pos += box_width + 0.3
         
-        # Magic number label
-        ax.text(-1, y_position, f'M = {magic}', va='center', ha='right', 
-               fontweight='bold', fontsize=12)
+            # Magic number label
+            ax.text(-1, y_position, f'M = {magic}', va='center', ha='right', 
+                   fontweight='bold', fontsize=12)
         
-        # Sum calculation
-        total = sum(sequence)
-        ax.text(x_pos + 0.5, y_position, f'= {total}', va='center', ha='left', 
-               fontsize=10, style='italic')
+            # Sum calculation
+            total = sum(sequence)
+            ax.text(x_pos + 0.5, y_position, f'= {total}', va='center', ha='left', 
+                   fontsize=10, style='italic')
         
-        y_position -= 1
+            y_position -= 1
     
     # Formatting
     ax.set_xlim(-2, 18)
@@ -306,47 +378,328 @@ def generate_figure3():
            ha='center', fontsize=10, style='italic', 
            bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.3))
     
-    plt.tight_layout()
-    plt.savefig('figure3_pattern_evolution.png', dpi=300, bbox_inches='tight')
-    print("✓ Figure 3 saved: figure3_pattern_evolution.png")
-    plt.close()
+    with span('figure3.layout'):
+        plt.tight_layout()
+    return fig
+
+
+@publication_style
+def generate_figure3(exports=DEFAULT_EXPORTS, threads=1):
+    """Build Figure 3 once and write it in every requested format."""
+    print("Generating Figure 3: Pattern Evolution...")
+    fig = build_figure3()
+    for path in export_figure(fig, 'figure3_pattern_evolution', exports, threads):
+        print(f"✓ Figure 3 saved: {path}")
+
+# =============================================================================
+# FIGURE 4: CHART OF NUCLIDES
+# =============================================================================
+
+# Colour fields of the chart: name → (colour bar label, colormap)
+CHART_FIELDS = {
+    'be_per_a': ('Binding energy per nucleon (MeV)', 'viridis'),
+    'delta_n': (r'Valence-shell $\Delta n$ (larger of Z, N)', 'magma_r'),
+    'shell_gap': (r'Shell-gap indicator max($\delta_{2n}$, $\delta_{2p}$) (MeV)', 'inferno'),
+}
+DEFAULT_CHART_FIELD = 'be_per_a'
+
+# Smallest spacing (in points) between two element symbols; on smaller cells
+# only every k-th cell in Z and N is labelled, doubly-magic nuclides first
+CHART_LABEL_MIN_POINTS = 9.0
+
+# Most element symbols drawn on the chart; k grows until the labels fit, so
+# that text layout stays a small part of the save time
+CHART_MAX_LABELS = 150
+
+
+def valence_delta_n(numbers):
+    """Δn of the shell each nucleon number is filling (M_n < x ≤ M_next), 0 for 0."""
+    numbers = np.asarray(numbers)
+    limit = int(numbers.max(initial=0))
+    shells = []
+    for shell in MagicSequence().iter_shells():
+        shells.append(shell)
+        if shell.M_next >= limit:
+            break
+    closures = np.array([s.M_next for s in shells])
+    delta_n = np.array([s.delta_n for s in shells])
+    return np.where(numbers > 0, delta_n[np.searchsorted(closures, numbers)], 0)
+
+
+def chart_values(index, field):
+    """Values of `field` on the dense (Z, N) grid of `index`, NaN where no nuclide."""
+    if field == 'be_per_a':
+        return index.dense('be_per_a')
+    if field == 'delta_n':
+        Z, N = np.indices(index.grid.shape)
+        values = np.maximum(valence_delta_n(Z), valence_delta_n(N)).astype(float)
+        values[index.grid == MISSING] = np.nan
+        return values
+    if field == 'shell_gap':
+        gaps = compute_shell_gaps(index)
+        return np.fmax(gaps.delta_2n, gaps.delta_2p)
+    raise ValueError(f"unknown chart field: {field} (choose from {', '.join(CHART_FIELDS)})")
+
+
+def _cell_points(fig, ax, shape):
+    """Side of one (Z, N) cell in points, once the axes have their final box."""
+    ax.apply_aspect()
+    box = ax.get_position()
+    width, height = fig.get_size_inches()
+    return 72 * min(box.width * width / shape[1], box.height * height / shape[0])
+
+
+def _label_rows(index, present, magic, stride):
+    """
+    Rows to label so that no two labels are closer than `stride` cells:
+    the doubly-magic nuclides, then every stride-th cell in Z and N that is
+    not within `stride` of one of them.
+    """
+    doubly = index.doubly(magic)
+    Z, N = np.indices(present.shape)
+    lattice = present & (Z % stride == 0) & (N % stride == 0)
+    taken = np.zeros_like(present)
+    for record in index.select(doubly):
+        z, n = int(record['Z']), int(record['N'])
+        taken[max(z - stride + 1, 0):z + stride, max(n - stride + 1, 0):n + stride] = True
+    return np.concatenate([doubly, index.grid[lattice & ~taken]])
+
+
+def _select_labels(index, present, magic, cell):
+    """
+    Rows to label for the smallest stride k that keeps the labels
+    CHART_LABEL_MIN_POINTS apart and at most CHART_MAX_LABELS of them.
+    """
+    stride = max(1, int(np.ceil(CHART_LABEL_MIN_POINTS / cell)),
+                 int(np.ceil(np.sqrt(present.sum() / CHART_MAX_LABELS))))
+    rows = _label_rows(index, present, magic, stride)
+    while len(rows) > CHART_MAX_LABELS and stride < max(present.shape):
+        stride += 1
+        rows = _label_rows(index, present, magic, stride)
+    return rows[:CHART_MAX_LABELS]
+
+
+def _label_cells(ax, index, rows, fontsize):
+    """Plain-text element symbols centred on their cells."""
+    for row in index.select(rows):
+        ax.text(row['N'], row['Z'], str(row['element']).strip(), ha='center', va='center',
+                fontsize=fontsize, color='white', clip_on=True)
+
+
+@publication_style
+def build_figure4(field=DEFAULT_CHART_FIELD):
+    """
+    Build the chart of nuclides coloured by `field` (a key of CHART_FIELDS).
+
+    Every nuclide is one cell of a single image over the dense (Z, N) grid,
+    drawn rasterized so vector outputs stay small. Magic numbers are overlaid
+    as lines; element symbols are thinned to every k-th cell so that they
+    stay CHART_LABEL_MIN_POINTS apart and number at most CHART_MAX_LABELS.
+    """
+    label, cmap = CHART_FIELDS[field]
+    with span('figure4.data', field=field):
+        index = NuclideIndex.load()
+        values = np.ma.masked_invalid(chart_values(index, field))
+        magic = [m for m in KNOWN_MAGIC_NUMBERS if m <= max(index.z_max, index.n_max)]
+
+    with span('figure4.subplots'):
+        fig, ax = plt.subplots(figsize=(10, 7))
+
+    count('figure4.cells', int(values.count()))
+    with span('figure4.artists', shape=list(values.shape)):
+        image = ax.imshow(values, origin='lower', cmap=cmap, interpolation='nearest',
+                          extent=(-0.5, index.n_max + 0.5, -0.5, index.z_max + 0.5),
+                          rasterized=True)
+        ax.set_xlim(-0.5, index.n_max + 4.5)
+        ax.set_ylim(-0.5, index.z_max + 4.5)
+        for m in magic:
+            if m <= index.n_max:
+                ax.axvline(m, color='gray', linewidth=0.6, alpha=0.7, zorder=2)
+            if m <= index.z_max:
+                ax.axhline(m, color='gray', linewidth=0.6, alpha=0.7, zorder=2)
+        colorbar = fig.colorbar(image, ax=ax, label=label, fraction=0.03, pad=0.02)
+        colorbar.solids.set_rasterized(True)
+
+    # Formatting
+    ax.set_xticks([m for m in magic if m <= index.n_max])
+    ax.set_yticks([m for m in magic if m <= index.z_max])
+    ax.set_xlabel('Neutron number N')
+    ax.set_ylabel('Proton number Z')
+    ax.set_title(f'Chart of Nuclides ({values.count():,} nuclides)')
+
+    with span('figure4.layout'):
+        plt.tight_layout()
+
+    # Labels last: the cell size is only known once the layout is fixed
+    with span('figure4.labels'):
+        cell = _cell_points(fig, ax, values.shape)
+        rows = _select_labels(index, ~np.ma.getmaskarray(values), magic, cell)
+        count('figure4.labels', len(rows))
+        _label_cells(ax, index, rows, min(0.5 * cell, 9))
+    return fig
+
+
+@publication_style
+def generate_figure4(field=DEFAULT_CHART_FIELD, exports=DEFAULT_EXPORTS, threads=1):
+    """Build Figure 4 once and write it in every requested format."""
+    print(f"Generating Figure 4: Chart of Nuclides ({field})...")
+    fig = build_figure4(field=field)
+    basename = 'figure4_nuclide_chart'
+    if field != DEFAULT_CHART_FIELD:
+        basename += f'_{field}'
+    for path in export_figure(fig, basename, exports, threads):
+        print(f"✓ Figure 4 saved: {path}")
 
 # =============================================================================
 # MAIN FUNCTION
 # =============================================================================
 
-def main():
-    """Generate all three figures."""
+# Registry: name → (function, output basename, description)
+FIGURES = {
+    'figure1': (generate_figure1, 'figure1_delta_n_vs_BE', 'Δn vs Binding Energy'),
+    'figure2': (generate_figure2, 'figure2_hierarchy', 'Stability Hierarchy'),
+    'figure3': (generate_figure3, 'figure3_pattern_evolution', 'Pattern Evolution'),
+    'figure4': (generate_figure4, 'figure4_nuclide_chart', 'Chart of Nuclides'),
+}
+
+
+def use_headless_backend():
+    """Switch matplotlib to the non-interactive Agg backend."""
+    matplotlib.use('Agg', force=True)
+
+
+def render_figure(name, exports=DEFAULT_EXPORTS, threads=1, options=None):
+    """
+    Render one registered figure in every export format and report how it went.
+
+    `options` maps figure names to extra keyword arguments of their function.
+
+    Returns:
+    --------
+    tuple : (name, ok, seconds, error) where error is a traceback string or None
+    """
+    func = FIGURES[name][0]
+    start = time.perf_counter()
+    try:
+        with span(name):
+            func(exports=exports, threads=threads, **(options or {}).get(name, {}))
+    except Exception:
+        plt.close('all')
+        return name, False, time.perf_counter() - start, traceback.format_exc()
+    return name, True, time.perf_counter() - start, None
+
+
+def render_figures(names, jobs=1, exports=DEFAULT_EXPORTS, threads=1, options=None):
+    """
+    Render figures sequentially (jobs=1) or each in its own worker process.
+
+    Workers always use the Agg backend. A failing figure is reported in the
+    results and does not stop the others. While instrumentation is enabled,
+    the spans recorded in the workers are merged into the active Recorder.
+    """
+    if jobs <= 1:
+        return [render_figure(name, exports, threads, options) for name in names]
+
+    recorder = instrumentation.current()
+    with ProcessPoolExecutor(max_workers=min(jobs, len(names)),
+                             initializer=use_headless_backend) as pool:
+        if recorder is None:
+            render = functools.partial(render_figure, exports=exports, threads=threads,
+                                       options=options)
+            return list(pool.map(render, names))
+
+        render = functools.partial(_render_figure_traced, exports=exports,
+                                   threads=threads, options=options,
+                                   memory=recorder.memory)
+        results = []
+        for result, state in pool.map(render, names):
+            recorder.merge(state)
+            results.append(result)
+        return results
+
+
+def _render_figure_traced(name, exports, threads, options, memory):
+    """render_figure in a worker process, returning its spans as well."""
+    instrumentation.disable()  # state inherited from a forked parent
+    instrumentation.enable(memory=memory)
+    try:
+        result = render_figure(name, exports, threads, options)
+    finally:
+        recorder = instrumentation.disable()
+    return result, recorder.state()
+
+
+def main(argv=None):
+    """Generate the article figures."""
+    parser = argparse.ArgumentParser(description="Generate the article figures.")
+    parser.add_argument('figures', nargs='*', metavar='FIGURE',
+                        help=f"figures to generate: {', '.join(FIGURES)} (default: all)")
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                        help="render each figure in its own process (implies --headless)")
+    parser.add_argument('--headless', action='store_true',
+                        help="force the non-interactive Agg backend")
+    parser.add_argument('--formats', default='png@300',
+                        help="outputs per figure, e.g. png@300,png@600,pdf,svg "
+                             "(default: %(default)s)")
+    parser.add_argument('--threads', type=int, default=1,
+                        help="threads writing the outputs of one figure")
+    parser.add_argument('--chart-field', choices=list(CHART_FIELDS),
+                        default=DEFAULT_CHART_FIELD,
+                        help="colour of the figure4 chart of nuclides (default: %(default)s)")
+    instrumentation.add_arguments(parser)
+    args = parser.parse_args(argv)
+    try:
+        exports = parse_exports(args.formats)
+    except ValueError as e:
+        parser.error(str(e))
+    names = args.figures or list(FIGURES)
+    unknown = [name for name in names if name not in FIGURES]
+    if unknown:
+        parser.error(f"unknown figure(s): {', '.join(unknown)}")
+
+    if args.headless or args.jobs > 1:
+        use_headless_backend()
+
     print("\n" + "="*70)
     print("FIGURE GENERATION FOR MAGIC NUMBERS ARTICLE")
     print("="*70)
     print("\nAuthor: André Luís Tomaz Dionísio")
     print("Institution: EPHEC Brussels, Belgium")
-    print("Resolution: 300 DPI (publication quality)")
+    print(f"Outputs: {args.formats}")
     print("\n" + "="*70 + "\n")
     
+    recorder = instrumentation.start_from_args(args)
+    start = time.perf_counter()
     try:
-        # Generate all figures
-        generate_figure1()
-        generate_figure2()
-        generate_figure3()
-        
-        print("\n" + "="*70)
-        print("SUCCESS! All figures generated.")
-        print("="*70)
-        print("\nGenerated files:")
-        print("  • figure1_delta_n_vs_BE.png (Δn vs Binding Energy)")
-        print("  • figure2_hierarchy.png (Stability Hierarchy)")
-        print("  • figure3_pattern_evolution.png (Pattern Evolution)")
-        print("\nThese figures are ready for inclusion in the manuscript.")
-        print("="*70 + "\n")
-        
-    except Exception as e:
-        print(f"\n❌ ERROR: {e}")
-        print("\nPlease ensure you have the required packages:")
+        results = render_figures(names, args.jobs, exports, args.threads,
+                                 {'figure4': {'field': args.chart_field}})
+    finally:
+        total = time.perf_counter() - start
+        instrumentation.finish_from_args(args, recorder, sys.stdout)
+    failed = [r for r in results if not r[1]]
+    
+    print("\n" + "="*70)
+    print("SUCCESS! All figures generated." if not failed
+          else f"{len(failed)} of {len(results)} figures FAILED.")
+    print("="*70)
+    print(f"\n{'Figure':<10} | {'Status':<6} | {'Time (s)':>8} | Description")
+    print("-"*70)
+    for name, ok, seconds, _ in results:
+        _, _, description = FIGURES[name]
+        status = "OK" if ok else "FAILED"
+        print(f"{name:<10} | {status:<6} | {seconds:8.2f} | {description}")
+    print("-"*70)
+    print(f"Wall time: {total:.2f} s ({args.jobs} job(s))")
+    
+    for name, _, _, error in failed:
+        print(f"\n❌ ERROR in {name}:\n{error}")
+    if failed:
+        print("Please ensure you have the required packages:")
         print("  pip install numpy matplotlib")
         return 1
     
+    print("\nThese figures are ready for inclusion in the manuscript.")
+    print("="*70 + "\n")
     return 0
 
 if __name__ == "__main__":
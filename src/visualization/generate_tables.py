@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+LaTeX Table Generation for Magic Numbers Article
+================================================
+
+Generates the tabular bodies used in the manuscript from the calculator,
+so the tables never drift from the code:
+
+1. table_validation.tex: M_n, c_start, c_high-j, Δn, C_total, M_{n+1}
+
+Author: André Luís Tomaz Dionísio
+Institution: EPHEC Brussels, Belgium
+Date: December 2025
+
+Usage:
+    python generate_tables.py [output_dir]
+"""
+
+import os
+import sys
+
+# Calculator modules live in src/calculator
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                '..', 'calculator'))
+
+from magic_sequence import MagicSequence  # noqa: E402
+
+VALIDATION_SHELLS = 8  # 0 → 184
+
+
+def validation_table(shells=VALIDATION_SHELLS):
+    """LaTeX tabular of the validation chain (same layout as the main article)."""
+    lines = [
+        r"\begin{tabular}{@{}cccccc@{}}",
+        r"\toprule",
+        r"$M_n$ & $c_{start}$ & $c_{high-j}$ & $\Delta n$ & $C_{total}$ & $M_{n+1}$ \\ \midrule",
+    ]
+    rows = MagicSequence().prefix(shells)
+    for i, s in enumerate(rows):
+        end = r" \\ \bottomrule" if i == len(rows) - 1 else r" \\"
+        lines.append(f"{s.M_n} & {s.c_start} & {s.c_high_j} & {s.delta_n} & "
+                     f"{s.C_total} & \\textbf{{{s.M_next}}}{end}")
+    lines.append(r"\end{tabular}")
+    return "\n".join(lines) + "\n"
+
+
+def generate_tables(output_dir='.'):
+    """Write every table into output_dir and return the written paths."""
+    path = os.path.join(output_dir, 'table_validation.tex')
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(validation_table())
+    print(f"✓ Table saved: {path}")
+    return [path]
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    generate_tables(argv[0] if argv else '.')
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())